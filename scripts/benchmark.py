@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""Benchmark validate.py, generate-tool-configs.py and migrate_frontmatter.py on a synthetic repository.
+
+Usage:
+    python scripts/benchmark.py                                   # Default size, table on stdout
+    python scripts/benchmark.py --agents 200 --cheatsheets 40 --sessions 150
+    python scripts/benchmark.py --repeat 3 --output bench.json    # Best of 3, JSON saved for later
+    python scripts/benchmark.py --json                            # JSON on stdout
+    python scripts/benchmark.py --compare bench.json              # Exit 1 if a step got slower
+    python scripts/benchmark.py --keep /tmp/bench-repo            # Keep the synthetic repo
+
+Synthetic repository:
+    Built from templates/ (CORE.md, cheatsheets, mistakes, decisions, session
+    log) with deterministic filler text (--seed): N agents, M cheatsheets per
+    agent (a --no-frontmatter fraction of them without frontmatter) and session
+    logs of K entries. GENERAL_RULES.md, .claude/skills/ and the current
+    scripts/ are copied in, so the benchmark measures the code in this tree.
+
+Suites (each run in a fresh interpreter inside the synthetic repo):
+    generate   manifest load, plan, render and write of every output, then a
+               no-op rebuild through the fingerprint cache
+    validate   the tree walk and every check registered in validate.CHECKS, in run order
+    migrate    migrate_frontmatter.py dry run
+
+Every step reports wall and CPU time, peak RSS (reset per step where Linux
+/proc/self/clear_refs allows it, otherwise the process high-water mark) and
+read() calls / bytes from /proc/self/io. With --repeat, each step keeps its
+fastest run. Reports carry the git commit so runs can be compared with
+--compare (a step regresses when it is --threshold times slower and takes at
+least --min-ms).
+
+Requirements: Python 3.10+, Linux for RSS and read counters (reported as null
+elsewhere), no external dependencies, no network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+REPORT_VERSION = 1
+SUITES = ("generate", "validate", "migrate")
+
+DEFAULT_AGENTS = 50
+DEFAULT_CHEATSHEETS = 20
+DEFAULT_SESSIONS = 60
+DEFAULT_CHEATSHEET_BYTES = 6000
+DEFAULT_NO_FRONTMATTER = 0.1
+DEFAULT_THRESHOLD = 1.25
+DEFAULT_MIN_MS = 5.0
+
+DOMAINS = ["aerospace", "software-dev", "data-science", "hardware", "research"]
+MODELS = ["opus", "sonnet", "haiku"]
+OUTCOMES = ["SUCCESS", "SUCCESS", "SUCCESS", "PARTIAL", "FAILED"]
+CONFIDENCES = ["VERIFIED", "TEXTBOOK", "DERIVED", "UNCERTAIN"]
+
+# Files copied from this repo into the synthetic one (when present)
+FRAMEWORK_FILES = ["GENERAL_RULES.md", "agents/manifest.schema.json"]
+FRAMEWORK_DIRS = ["templates", ".claude/skills"]
+
+# Generated outputs removed before each generate run, so every run starts cold
+GENERATED_PATHS = [".claude/agents", ".agents", ".cursorrules", ".windsurfrules", ".agentsouls-cache"]
+
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z-]{2,}")
+
+# ---------------------------------------------------------------------------
+# Synthetic repository
+# ---------------------------------------------------------------------------
+
+
+def _vocabulary(repo_root: Path) -> list[str]:
+    words: set[str] = set()
+    for rel in ["GENERAL_RULES.md", *(f"templates/{n}" for n in sorted(os.listdir(repo_root / "templates")))]:
+        try:
+            words.update(w.lower() for w in WORD_RE.findall((repo_root / rel).read_text(encoding="utf-8")))
+        except OSError:
+            continue
+    return sorted(words) or ["lorem", "ipsum", "dolor", "sit", "amet"]
+
+
+def _paragraphs(rng: random.Random, vocab: list[str], nbytes: int) -> str:
+    """Filler prose of roughly nbytes, in short paragraphs and bullet lists."""
+    out: list[str] = []
+    size = 0
+    while size < nbytes:
+        words = rng.choices(vocab, k=rng.randint(20, 60))
+        if rng.random() < 0.3:
+            block = "\n".join(f"- {' '.join(words[i:i + 8])}" for i in range(0, len(words), 8))
+        else:
+            block = " ".join(words).capitalize() + "."
+        if rng.random() < 0.15:
+            block = f"## {' '.join(rng.choices(vocab, k=3)).title()}\n\n{block}"
+        out.append(block)
+        size += len(block) + 2
+    return "\n\n".join(out) + "\n"
+
+
+def _fill(template: str, values: dict[str, str]) -> str:
+    for placeholder, value in values.items():
+        template = template.replace(placeholder, value)
+    return template
+
+
+def synthesize(
+    source_root: Path,
+    dest: Path,
+    agents: int,
+    cheatsheets: int,
+    sessions: int,
+    cheatsheet_bytes: int = DEFAULT_CHEATSHEET_BYTES,
+    no_frontmatter: float = DEFAULT_NO_FRONTMATTER,
+    seed: int = 0,
+) -> dict:
+    """Write a synthetic repository under dest. Returns {"files": n, "bytes": n}."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(source_root)
+    templates = {
+        name: (source_root / "templates" / name).read_text(encoding="utf-8")
+        for name in ("CORE-TEMPLATE.md", "cheatsheet-template.md", "mistakes-template.md",
+                     "decisions-template.md", "session-log-template.md")
+    }
+    session_block = templates["session-log-template.md"].split("---", 1)[1].strip("\n")
+    log_header = templates["session-log-template.md"].split("---", 1)[0]
+
+    for rel in FRAMEWORK_FILES:
+        if (source_root / rel).is_file():
+            (dest / rel).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_root / rel, dest / rel)
+    for rel in FRAMEWORK_DIRS:
+        if (source_root / rel).is_dir():
+            shutil.copytree(source_root / rel, dest / rel)
+    shutil.copytree(source_root / "scripts", dest / "scripts", ignore=shutil.ignore_patterns("__pycache__"))
+
+    stats = {"files": 0, "bytes": 0}
+
+    def write(rel: str, text: str) -> None:
+        path = dest / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        stats["files"] += 1
+        stats["bytes"] += len(data)
+
+    manifest_agents = []
+    for i in range(agents):
+        slug = f"agent{i:04d}"
+        name = f"Agent {i:04d}"
+        domain = DOMAINS[i % len(DOMAINS)]
+        base = f"agents/{domain}/{slug}"
+        values = {
+            "[Agent Name]": name, "[agent-slug]": slug, "[domain-slug]": domain, "[Domain]": domain,
+            "[opus/sonnet/haiku]": MODELS[i % len(MODELS)], "{slug}": slug,
+            "[One-line role description]": f"Synthetic {domain} specialist {i}",
+        }
+        write(f"{base}/CORE.md", _fill(templates["CORE-TEMPLATE.md"], values).replace("YYYY-MM-DD", "2026-01-01")
+              + _paragraphs(rng, vocab, cheatsheet_bytes // 2))
+
+        index_rows = []
+        for j in range(cheatsheets):
+            topic = " ".join(rng.choices(vocab, k=3)).title()
+            file_name = f"{'-'.join(topic.lower().split())}-{j:03d}.md"
+            text = _fill(templates["cheatsheet-template.md"], {**values, "[Topic Name]": topic})
+            text = text.replace("YYYY-MM-DD", f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+            text = text.replace("[VERIFIED/TEXTBOOK/DERIVED/UNCERTAIN]", rng.choice(CONFIDENCES))
+            if rng.random() < no_frontmatter:
+                text = text.split("---", 2)[2].lstrip("\n")
+            write(f"{base}/cheatsheets/{file_name}", text + "\n" + _paragraphs(rng, vocab, cheatsheet_bytes))
+            index_rows.append(f"| {file_name} | {topic} | | |")
+        write(f"{base}/cheatsheets/_index.md", (
+            "# Cheatsheet Index\n\n| Cheatsheet | Topic | Confidence | Last Updated |\n"
+            "|------------|-------|------------|--------------|\n" + "\n".join(sorted(index_rows)) + "\n"
+        ))
+
+        entries = []
+        for k in range(sessions, 0, -1):
+            day = f"2026-{(k // 28) % 12 + 1:02d}-{k % 28 + 1:02d}"
+            entry = _fill(session_block, {
+                **values, "YYYY-MM-DD": day, "-001": f"-{k % 1000:03d}",
+                "[project name]": f"project-{k % 7}", "[what was asked]": " ".join(rng.choices(vocab, k=8)),
+                "[SUCCESS / PARTIAL / FAILED]": rng.choice(OUTCOMES), "[approximate]": f"{rng.randint(1, 9)}h",
+            })
+            entries.append(entry)
+        write(f"{base}/memory/session-log.md", _fill(log_header, values) + "---\n\n" + "\n\n".join(entries) + "\n")
+        write(f"{base}/memory/mistakes.md", _fill(templates["mistakes-template.md"], values))
+        write(f"{base}/memory/decisions.md", _fill(templates["decisions-template.md"], values))
+        write(f"{base}/memory/brief.md", f"# Brief — {name}\n\n{_paragraphs(rng, vocab, 400)}")
+        write(f"{base}/memory/open-questions.md", f"# Open Questions — {name}\n\n*(No open questions recorded yet.)*\n")
+
+        manifest_agents.append({
+            "name": name,
+            "slug": slug,
+            "domain": domain,
+            "role": values["[One-line role description]"],
+            "description": " ".join(rng.choices(vocab, k=12)).capitalize() + ".",
+            "model": values["[opus/sonnet/haiku]"],
+            "capabilities": rng.sample(vocab, 4),
+            "tags": [domain],
+            "skills": [],
+            "paths": {
+                "core": f"{base}/CORE.md",
+                "cheatsheets": f"{base}/cheatsheets/",
+                "cheatsheet_index": f"{base}/cheatsheets/_index.md",
+                "memory": f"{base}/memory/",
+                "mistakes": f"{base}/memory/mistakes.md",
+                "session_log": f"{base}/memory/session-log.md",
+                "decisions": f"{base}/memory/decisions.md",
+                "brief": f"{base}/memory/brief.md",
+                "open_questions": f"{base}/memory/open-questions.md",
+            },
+            "delegates_to": [],
+            "defers_to": [],
+            "escalates_to": [],
+        })
+
+    manifest = {"$schema": "./manifest.schema.json", "schema_version": "2.0", "agents": manifest_agents}
+    write("agents/manifest.json", json.dumps(manifest, indent=2) + "\n")
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _proc_io() -> dict[str, int]:
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            return {k: int(v) for k, v in (line.split(":") for line in f)}
+    except (OSError, ValueError):
+        return {}
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # kB on Linux
+
+
+def _reset_peak_rss() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")  # resets VmHWM to the current RSS (Linux 4.0+)
+    except OSError:
+        pass
+
+
+class Steps:
+    """Run named steps in order, recording time, peak RSS and read counters for each."""
+
+    def __init__(self) -> None:
+        self.steps: list[dict] = []
+
+    def run(self, name: str, fn: Callable, *args):
+        _reset_peak_rss()
+        io_before = _proc_io()
+        cpu_before = time.process_time()
+        started = time.perf_counter()
+        result = fn(*args)
+        wall_ms = (time.perf_counter() - started) * 1000
+        cpu_ms = (time.process_time() - cpu_before) * 1000
+        io_after = _proc_io()
+        self.steps.append({
+            "name": name,
+            "wall_ms": round(wall_ms, 3),
+            "cpu_ms": round(cpu_ms, 3),
+            "peak_rss_kb": _peak_rss_kb(),
+            "read_calls": io_after["syscr"] - io_before["syscr"] if io_before else None,
+            "read_bytes": io_after["rchar"] - io_before["rchar"] if io_before else None,
+        })
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Suites (run inside the synthetic repository, in a fresh interpreter)
+# ---------------------------------------------------------------------------
+
+
+def suite_generate(repo_root: Path, steps: Steps) -> None:
+    import importlib.util
+
+    from writeback import WriteBatch
+
+    spec = importlib.util.spec_from_file_location("generate_tool_configs", _SCRIPT_DIR / "generate-tool-configs.py")
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    manifest = steps.run("load_manifest", generator.load_manifest, repo_root)
+    planned = steps.run("plan_outputs", generator.plan_outputs, manifest, None, repo_root)
+    rendered = steps.run("render", lambda: [(rel, fp, render()) for rel, fp, render in planned])
+
+    def write() -> None:
+        fingerprints = generator.FingerprintCache(repo_root)
+        with WriteBatch(repo_root) as batch:
+            for rel, _, content in rendered:
+                batch.add(rel, content)
+        for rel, fingerprint, _ in rendered:
+            fingerprints.mark(rel, fingerprint)
+        fingerprints.save()
+
+    steps.run("write", write)
+
+    def noop_rebuild() -> int:
+        fingerprints = generator.FingerprintCache(repo_root)
+        plan = generator.plan_outputs(generator.load_manifest(repo_root), None, repo_root)
+        return sum(not fingerprints.is_current(rel, fp) for rel, fp, _ in plan)
+
+    steps.run("noop_rebuild", noop_rebuild)
+
+
+def suite_validate(repo_root: Path, steps: Steps) -> dict:
+    import validate
+
+    snapshot = steps.run("walk", validate.get_snapshot, repo_root)
+    manifest = steps.run("manifest", validate.check_manifest, repo_root)
+    if manifest is None:
+        raise RuntimeError("synthetic manifest failed validation")
+    context = validate.CheckContext(repo_root, manifest, None, False)
+    for name, check in validate.CHECKS.items():  # every registered check, in run order
+        steps.run(name, check, context)
+    return {"files_read": snapshot.reads, "snapshot_bytes_read": snapshot.bytes_read}
+
+
+def suite_migrate(repo_root: Path, steps: Steps) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        import migrate_frontmatter
+
+        steps.run("migrate_dry_run", migrate_frontmatter.migrate, False)
+
+
+SUITE_FUNCTIONS = {"generate": suite_generate, "validate": suite_validate, "migrate": suite_migrate}
+
+
+def run_stage(suite: str) -> None:
+    """Entry point of the child process: run one suite and print its steps as JSON."""
+    steps = Steps()
+    started = time.perf_counter()
+    extra = SUITE_FUNCTIONS[suite](_SCRIPT_DIR.parent, steps) or {}
+    total_ms = (time.perf_counter() - started) * 1000
+    print(json.dumps({"wall_ms": round(total_ms, 3), **extra, "steps": steps.steps}))
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def _run_suite(repo_root: Path, suite: str) -> dict:
+    if suite == "generate":
+        for rel in GENERATED_PATHS:
+            path = repo_root / rel
+            if path.is_dir():
+                shutil.rmtree(path)
+            elif path.exists():
+                path.unlink()
+    proc = subprocess.run(
+        [sys.executable, str(repo_root / "scripts" / "benchmark.py"), "--stage", suite],
+        capture_output=True, text=True, cwd=repo_root,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"suite {suite} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _best_of(runs: list[dict]) -> dict:
+    """Per step, keep the run with the lowest wall time."""
+    steps = []
+    for by_name in zip(*(run["steps"] for run in runs)):
+        steps.append(min(by_name, key=lambda s: s["wall_ms"]))
+    extra = {k: v for k, v in runs[0].items() if k not in ("wall_ms", "steps")}
+    return {"wall_ms": min(run["wall_ms"] for run in runs), "runs": len(runs), **extra, "steps": steps}
+
+
+def _git_commit(repo_root: Path) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=repo_root, capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return proc.stdout.strip() or None
+
+
+def benchmark(args: argparse.Namespace) -> dict:
+    source_root = _SCRIPT_DIR.parent
+    params = {
+        "agents": args.agents,
+        "cheatsheets": args.cheatsheets,
+        "sessions": args.sessions,
+        "cheatsheet_bytes": args.cheatsheet_bytes,
+        "no_frontmatter": args.no_frontmatter,
+        "seed": args.seed,
+        "repeat": args.repeat,
+    }
+    if args.keep:
+        repo_root = Path(args.keep).resolve()
+        if repo_root.exists():
+            shutil.rmtree(repo_root)
+        repo_root.mkdir(parents=True)
+    else:
+        repo_root = Path(tempfile.mkdtemp(prefix="agentsouls-bench-"))
+
+    try:
+        started = time.perf_counter()
+        stats = synthesize(
+            source_root, repo_root, args.agents, args.cheatsheets, args.sessions,
+            args.cheatsheet_bytes, args.no_frontmatter, args.seed,
+        )
+        synth_ms = (time.perf_counter() - started) * 1000
+
+        suites = {}
+        for suite in args.suites:
+            suites[suite] = _best_of([_run_suite(repo_root, suite) for _ in range(args.repeat)])
+    finally:
+        if not args.keep:
+            shutil.rmtree(repo_root, ignore_errors=True)
+
+    return {
+        "version": REPORT_VERSION,
+        "commit": _git_commit(source_root),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params,
+        "synthetic_repo": {**stats, "wall_ms": round(synth_ms, 3)},
+        "suites": suites,
+    }
+
+
+def _format_optional(value, fmt: str) -> str:
+    return "-" if value is None else format(value, fmt)
+
+
+def print_report(report: dict) -> None:
+    params = report["params"]
+    repo = report["synthetic_repo"]
+    print(
+        f"Synthetic repo: {params['agents']} agents x {params['cheatsheets']} cheatsheets, "
+        f"{params['sessions']} sessions each — {repo['files']} files, {repo['bytes']:,} bytes "
+        f"(built in {repo['wall_ms']:.0f} ms)"
+    )
+    print(f"Commit {report['commit'] or 'unknown'}, Python {report['python']}, best of {params['repeat']}")
+    for suite, result in report["suites"].items():
+        print()
+        files = f", {result['files_read']:,} files read" if "files_read" in result else ""
+        print(f"{suite} ({result['wall_ms']:.1f} ms{files})")
+        print(f"  {'step':<30} {'wall ms':>10} {'cpu ms':>10} {'peak RSS kB':>12} {'reads':>8} {'read bytes':>13}")
+        for step in result["steps"]:
+            print(
+                f"  {step['name']:<30} {step['wall_ms']:>10.1f} {step['cpu_ms']:>10.1f} "
+                f"{_format_optional(step['peak_rss_kb'], ','):>12} {_format_optional(step['read_calls'], ','):>8} "
+                f"{_format_optional(step['read_bytes'], ','):>13}"
+            )
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_ms: float) -> list[str]:
+    """Steps that are threshold times slower than in baseline (and at least min_ms)."""
+    ignored = {"repeat"}
+    if {k: v for k, v in baseline.get("params", {}).items() if k not in ignored} != {
+        k: v for k, v in current["params"].items() if k not in ignored
+    }:
+        print("WARNING: benchmark parameters differ from the baseline; ratios may not be meaningful", file=sys.stderr)
+    regressions = []
+    print()
+    print(f"Compared with {baseline.get('commit') or 'baseline'}:")
+    for suite, result in current["suites"].items():
+        before = {s["name"]: s for s in baseline.get("suites", {}).get(suite, {}).get("steps", [])}
+        for step in result["steps"]:
+            old = before.get(step["name"])
+            if old is None:
+                continue
+            ratio = step["wall_ms"] / old["wall_ms"] if old["wall_ms"] else float("inf")
+            regressed = step["wall_ms"] >= min_ms and ratio >= threshold
+            mark = "  REGRESSION" if regressed else ""
+            print(f"  {suite}/{step['name']:<30} {old['wall_ms']:>10.1f} -> {step['wall_ms']:>10.1f} ms  x{ratio:.2f}{mark}")
+            if regressed:
+                regressions.append(f"{suite}/{step['name']}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the scripts on a synthetic repository")
+    parser.add_argument("--agents", type=int, default=DEFAULT_AGENTS, help=f"Agents (default: {DEFAULT_AGENTS})")
+    parser.add_argument("--cheatsheets", type=int, default=DEFAULT_CHEATSHEETS, help=f"Cheatsheets per agent (default: {DEFAULT_CHEATSHEETS})")
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS, help=f"Session-log entries per agent (default: {DEFAULT_SESSIONS})")
+    parser.add_argument(
+        "--cheatsheet-bytes", type=int, default=DEFAULT_CHEATSHEET_BYTES,
+        help=f"Approximate filler per cheatsheet (default: {DEFAULT_CHEATSHEET_BYTES})",
+    )
+    parser.add_argument(
+        "--no-frontmatter", type=float, default=DEFAULT_NO_FRONTMATTER, metavar="FRACTION",
+        help=f"Fraction of cheatsheets written without frontmatter (default: {DEFAULT_NO_FRONTMATTER})",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic content (default: 0)")
+    parser.add_argument("--suites", default=",".join(SUITES), help=f"Comma-separated suites (default: {','.join(SUITES)})")
+    parser.add_argument("--repeat", type=int, default=1, metavar="N", help="Run each suite N times, keep the fastest (default: 1)")
+    parser.add_argument("--keep", metavar="DIR", help="Build the synthetic repo in DIR and keep it")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON instead of a table")
+    parser.add_argument("--output", metavar="FILE", help="Also write the JSON report to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="Compare with an earlier JSON report; exit 1 on regressions")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"With --compare, slowdown ratio that counts as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--min-ms", type=float, default=DEFAULT_MIN_MS,
+        help=f"With --compare, ignore steps faster than this (default: {DEFAULT_MIN_MS})",
+    )
+    parser.add_argument("--stage", choices=SUITES, help=argparse.SUPPRESS)  # child-process entry point
+    args = parser.parse_args()
+
+    if args.stage:
+        run_stage(args.stage)
+        return
+
+    args.suites = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = [s for s in args.suites if s not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)} (choose from {', '.join(SUITES)})")
+    if args.repeat < 1 or args.agents < 1:
+        parser.error("--repeat and --agents must be at least 1")
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"ERROR: cannot load {args.compare}: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        report = benchmark(args)
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if baseline is not None:
+        regressions = compare(baseline, report, args.threshold, args.min_ms)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Summon bundles: one precompiled file per agent with everything its activation loads.
+
+The loading sequence in the generated wrappers reads GENERAL_RULES.md, CORE.md,
+mistakes.md and the cheatsheet index as separate files. A bundle concatenates
+them (plus memory/brief.md and the top-K most relevant cheatsheets, ranked
+against the agent's profile by select_cheatsheets.rank()) into
+.agentsouls-cache/bundles/{slug}.md so a summon is a single read.
+
+Each bundle carries a token estimate (~4 characters per token) and is kept
+within a token budget: when the sources are larger, the lowest-priority
+sections are truncated (or dropped) first, lowest-ranked cheatsheets before the
+index, brief, mistakes, GENERAL_RULES.md and finally CORE.md. Omitted content
+is listed at the end so the agent knows what to read on demand.
+
+Bundles are a local build product, not committed: they embed files that change
+every session (mistakes.md, brief.md, the cheatsheet index), so a committed copy
+would go stale on every session end. generate-tool-configs.py (and its watch
+mode) builds them with the default budget and K unless --bundle-budget /
+--bundle-top-k are given; the values used are recorded in the bundle header.
+
+The header also records an inputs fingerprint: the bundle code, the agent's
+manifest entry and the (mtime, size) of every input file (bundle_inputs()).
+validate.py (check 14) warns when a built bundle's fingerprint no longer
+matches, e.g. after a session end rewrote mistakes.md or brief.md, and the
+generated wrappers tell agents to skip a bundle older than its memory files.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from cache import CACHE_DIR_NAME, source_hash, stable_hash
+from select_cheatsheets import CheatsheetVectors, rank
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+BUNDLES_DIR = f"{CACHE_DIR_NAME}/bundles"  # gitignored build output
+RULES_PATH = "GENERAL_RULES.md"
+
+DEFAULT_BUDGET_TOKENS = 12000
+DEFAULT_TOP_K = 3
+CHARS_PER_TOKEN = 4
+MIN_SECTION_TOKENS = 200  # below this a truncated section is dropped instead
+
+# Truncation order: lower priority goes first (cheatsheets get 10 - rank)
+SECTION_PRIORITY = {"core": 100, "rules": 90, "mistakes": 80, "brief": 70, "index": 60}
+
+BUNDLE_TEMPLATE = """\
+<!-- AUTO-GENERATED from agents/manifest.json — DO NOT EDIT MANUALLY -->
+<!-- generated_by: generate-tool-configs.py | schema: {schema_version} | budget: {budget} | top_k: {top_k} | tokens: ~{tokens} | inputs: {inputs} -->
+
+# {name} — Summon Bundle
+
+Precompiled activation context for {name}: the files of the loading sequence, in order.
+Reading this file replaces reading each of them separately.
+
+{body}"""
+
+INPUTS_RE = re.compile(r"\| inputs: ([0-9a-f]+) -->")
+HEADER_BYTES = 512  # the inputs fingerprint is in the first lines
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+class FileSource:
+    """Reads bundle inputs straight from the filesystem."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+
+    def text(self, rel_path: str) -> str | None:
+        try:
+            return (self.repo_root / rel_path).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def list_markdown(self, rel_dir: str) -> list[str]:
+        base = rel_dir.rstrip("/")
+        try:
+            names = sorted(n for n in os.listdir(self.repo_root / base) if n.endswith(".md"))
+        except OSError:
+            return []
+        return [f"{base}/{n}" for n in names if (self.repo_root / base / n).is_file()]
+
+    def stat(self, rel_path: str) -> tuple[int, int] | None:
+        try:
+            st = (self.repo_root / rel_path).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+
+class SnapshotSource:
+    """Reads bundle inputs through a RepoSnapshot (shared reads in validate.py / watch mode)."""
+
+    def __init__(self, snapshot) -> None:
+        self.snapshot = snapshot
+        self.repo_root = snapshot.repo_root
+
+    def text(self, rel_path: str) -> str | None:
+        entry = self.snapshot.get(rel_path)
+        return entry.text if entry is not None else None
+
+    def list_markdown(self, rel_dir: str) -> list[str]:
+        return [e.rel for e in self.snapshot.list_dir(rel_dir, ".md")]
+
+    def stat(self, rel_path: str) -> tuple[int, int] | None:
+        entry = self.snapshot.get(rel_path)
+        return (entry.mtime_ns, entry.size) if entry is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class Section(NamedTuple):
+    rel_path: str
+    priority: int
+    text: str
+
+
+def bundle_path(slug: str) -> str:
+    """Repo-relative path of an agent's bundle."""
+    return f"{BUNDLES_DIR}/{slug}.md"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def profile_query(agent: dict) -> str:
+    """The agent's role, description, capabilities and tags as one query."""
+    return " ".join([
+        agent.get("role", ""),
+        agent.get("description", ""),
+        " ".join(agent.get("capabilities", [])),
+        " ".join(agent.get("tags", [])),
+    ])
+
+
+def rank_cheatsheets(agent: dict, source) -> list[str]:
+    """An agent's cheatsheets ranked against its profile, most relevant first.
+
+    Uses select_cheatsheets.py's cached term vectors and rank(), so a summon
+    preloads the same cheatsheets step 5 would suggest for a task phrased like
+    the agent's profile. Cheatsheets sharing no term with the profile are left out.
+    """
+    entries = CheatsheetVectors(source.repo_root, agent).refresh()
+    return [s.rel_path for s in rank(entries, profile_query(agent))]
+
+
+def _strip_frontmatter(text: str) -> str:
+    lines = text.split("\n")
+    if lines and lines[0].strip() == "---":
+        for i in range(1, len(lines)):
+            if lines[i].strip() == "---":
+                return "\n".join(lines[i + 1:])
+    return text
+
+
+def bundle_inputs(agent: dict, source) -> list[str]:
+    """Every repo file a bundle may draw from (its fingerprint / cache dependencies)."""
+    paths = agent["paths"]
+    fixed = [RULES_PATH, paths["core"], paths["mistakes"], paths["brief"], paths["cheatsheet_index"]]
+    return fixed + [r for r in source.list_markdown(paths["cheatsheets"]) if r not in fixed]
+
+
+@lru_cache(maxsize=None)
+def _code_version() -> str:
+    """Hash of the code that shapes a bundle's content (a change makes built bundles stale)."""
+    return source_hash(
+        Path(__file__).resolve(), _SCRIPT_DIR / "select_cheatsheets.py", _SCRIPT_DIR / "search.py",
+        _SCRIPT_DIR / "frontmatter.py",
+    )
+
+
+def inputs_fingerprint(agent: dict, schema_version: str, source) -> str:
+    """Fingerprint of what a bundle is built from: code, manifest entry and each input's (mtime, size)."""
+    inputs = [[rel, source.stat(rel)] for rel in bundle_inputs(agent, source)]
+    return stable_hash([_code_version(), schema_version, agent, inputs])[:16]
+
+
+def recorded_fingerprint(path: Path) -> str | None:
+    """Inputs fingerprint in the header of a built bundle; None if it is missing or has none."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            head = f.read(HEADER_BYTES)
+    except OSError:
+        return None
+    match = INPUTS_RE.search(head)
+    return match[1] if match else None
+
+
+def _collect_sections(agent: dict, source, top_k: int) -> list[Section]:
+    paths = agent["paths"]
+    wanted = [
+        (RULES_PATH, SECTION_PRIORITY["rules"]),
+        (paths["core"], SECTION_PRIORITY["core"]),
+        (paths["mistakes"], SECTION_PRIORITY["mistakes"]),
+        (paths["brief"], SECTION_PRIORITY["brief"]),
+        (paths["cheatsheet_index"], SECTION_PRIORITY["index"]),
+    ]
+    wanted += [(rel, 10 - position) for position, rel in enumerate(rank_cheatsheets(agent, source)[:top_k])]
+
+    sections = []
+    for rel, priority in wanted:
+        text = source.text(rel)
+        if text is None:
+            continue
+        sections.append(Section(rel, priority, _strip_frontmatter(text).strip("\n") + "\n"))
+    return sections
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    cut = text[: max_tokens * CHARS_PER_TOKEN]
+    newline = cut.rfind("\n")
+    return cut[: newline + 1] if newline > 0 else cut
+
+
+def _render_body(sections: list[Section], truncated: set[str], omitted: list[str]) -> str:
+    parts = []
+    for s in sections:
+        note = f"*[truncated to fit the token budget — read `{s.rel_path}` for the rest]*\n" if s.rel_path in truncated else ""
+        parts.append(f"<!-- BEGIN {s.rel_path} -->\n{s.text}{note}<!-- END {s.rel_path} -->\n")
+    if omitted:
+        lines = "\n".join(f"- `{rel}`" for rel in omitted)
+        parts.append(f"## Not Included (token budget)\n\nRead these on demand:\n\n{lines}\n")
+    return "\n".join(parts)
+
+
+def render_bundle(
+    agent: dict,
+    schema_version: str,
+    source,
+    budget: int = DEFAULT_BUDGET_TOKENS,
+    top_k: int = DEFAULT_TOP_K,
+) -> str:
+    """Render the bundle of one agent (see bundle_path()) within the token budget."""
+    sections = _collect_sections(agent, source, top_k)
+    inputs = inputs_fingerprint(agent, schema_version, source)
+    truncated: set[str] = set()
+    omitted: list[str] = []
+
+    def render(body_sections: list[Section]) -> str:
+        fields = {
+            "schema_version": schema_version,
+            "budget": budget,
+            "top_k": top_k,
+            "inputs": inputs,
+            "name": agent["name"],
+            "body": _render_body(body_sections, truncated, omitted),
+        }
+        return BUNDLE_TEMPLATE.format(tokens=estimate_tokens(BUNDLE_TEMPLATE.format(tokens=0, **fields)), **fields)
+
+    content = render(sections)
+    for victim in sorted(sections, key=lambda s: s.priority):
+        over = estimate_tokens(content) - budget
+        if over <= 0:
+            break
+        pos = next(i for i, s in enumerate(sections) if s.rel_path == victim.rel_path)
+        keep_tokens = estimate_tokens(victim.text) - over - 32  # room for the truncation note
+        if keep_tokens >= MIN_SECTION_TOKENS:
+            sections[pos] = victim._replace(text=_truncate(victim.text, keep_tokens))
+            truncated.add(victim.rel_path)
+        else:
+            del sections[pos]
+            omitted.append(victim.rel_path)
+        content = render(sections)
+    return content
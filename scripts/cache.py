@@ -0,0 +1,210 @@
+"""Local on-disk caches shared by the scripts.
+
+Cache files live under .agentsouls-cache/ at the repo root (gitignored). They are
+plain JSON so they can be inspected or deleted at any time: a missing, corrupt or
+outdated cache is treated as empty, so caches only ever save work and never change
+results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CACHE_DIR_NAME = ".agentsouls-cache"
+
+# Bump when the layout of any cache file changes; old caches are then ignored.
+CACHE_FORMAT = 1
+
+# ---------------------------------------------------------------------------
+# Hashing helpers
+# ---------------------------------------------------------------------------
+
+
+def sha256_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path: Path, chunk_size: int = 1 << 20) -> str | None:
+    """Return the hex SHA-256 digest of a file, read in chunks; None if unreadable."""
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def stable_hash(obj: object) -> str:
+    """Hash a JSON-serializable object independently of dict key order."""
+    encoded = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return sha256_bytes(encoded.encode("utf-8"))
+
+
+def source_hash(*paths: Path) -> str:
+    """Hash the contents of source files (used to invalidate caches on code changes)."""
+    h = hashlib.sha256()
+    for path in paths:
+        try:
+            h.update(path.read_bytes())
+        except OSError:
+            h.update(b"\0missing\0")
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Cache file I/O
+# ---------------------------------------------------------------------------
+
+
+def cache_path(repo_root: Path, name: str) -> Path:
+    """Return the path of a named cache file under .agentsouls-cache/."""
+    return repo_root / CACHE_DIR_NAME / name
+
+
+def load_cache(repo_root: Path, name: str) -> dict:
+    """Load a JSON cache file. Returns {} if missing, unreadable, or from another format."""
+    path = cache_path(repo_root, name)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+        return {}
+    return data
+
+
+def save_cache(repo_root: Path, name: str, data: dict) -> None:
+    """Atomically write a JSON cache file (write to a temp file, then rename)."""
+    path = cache_path(repo_root, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = dict(data, format=CACHE_FORMAT)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# File state tracking
+# ---------------------------------------------------------------------------
+
+
+class FileStateCache:
+    """Per-file (mtime_ns, size, sha256) table.
+
+    digest() stats the file and only re-reads and re-hashes it when the stat
+    signature differs from the cached one. Given a RepoSnapshot, the stat comes
+    from its walk and the hash from the entry's bytes: a miss means the unit
+    will run and read the file anyway, so loading them into the snapshot once
+    serves both the hash and the check.
+    """
+
+    def __init__(self, repo_root: Path, entries: dict | None = None, snapshot=None) -> None:
+        self.repo_root = repo_root
+        self.snapshot = snapshot
+        self._entries: dict[str, list] = dict(entries or {})
+        self._seen: dict[str, list] = {}
+
+    def _stat_and_hasher(self, rel_path: str):
+        if self.snapshot is not None:
+            entry = self.snapshot.get(rel_path)
+            if entry is None:
+                return None
+            return entry.mtime_ns, entry.size, lambda: None if entry.data is None else sha256_bytes(entry.data)
+        full_path = self.repo_root / rel_path
+        try:
+            st = full_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, lambda: sha256_file(full_path)
+
+    def digest(self, rel_path: str) -> str | None:
+        """Return the SHA-256 of a repo-relative file, or None if it does not exist."""
+        if rel_path in self._seen:
+            return self._seen[rel_path][2]
+        state = self._stat_and_hasher(rel_path)
+        if state is None:
+            return None
+        mtime_ns, size, hasher = state
+        cached = self._entries.get(rel_path)
+        if cached and cached[0] == mtime_ns and cached[1] == size:
+            entry = cached
+        else:
+            digest = hasher()
+            if digest is None:
+                return None
+            entry = [mtime_ns, size, digest]
+        self._seen[rel_path] = entry
+        return entry[2]
+
+    def to_json(self) -> dict:
+        """Return the entries touched in this run (stale paths are dropped)."""
+        return dict(self._seen)
+
+
+class ResultCache:
+    """Cache of check results keyed by (check, unit), valid while the unit's inputs are.
+
+    A unit declares the files it reads (deps) plus a token summarizing any
+    non-file input (e.g. the agent's manifest entry). A cached result is reused
+    only if the token matches and every dep still has the recorded digest.
+    Results computed by a different version of the scripts (salt) are discarded.
+    """
+
+    def __init__(self, repo_root: Path, name: str, salt: str, snapshot=None) -> None:
+        self.repo_root = repo_root
+        self.name = name
+        self.salt = salt
+        data = load_cache(repo_root, name)
+        if data.get("salt") != salt:
+            data = {}
+        self.files = FileStateCache(repo_root, data.get("files"), snapshot)
+        self._results: dict[str, dict] = data.get("results", {})
+        self._kept: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _deps_state(self, deps: list[str]) -> dict[str, str | None]:
+        return {rel: self.files.digest(rel) for rel in deps}
+
+    def lookup(self, check: str, key: str, deps: list[str], token: str = ""):
+        """Return the cached result for a unit, or None if it must be recomputed.
+
+        The deps are hashed even on a miss: with a snapshot this loads their
+        bytes before the unit runs, so the unit reuses them and store() finds
+        the digests already computed (one read per file, not two).
+        """
+        entry = self._results.get(check, {}).get(key)
+        state = self._deps_state(deps)
+        if entry is not None and entry["token"] == token and entry["deps"] == state:
+            self._kept.setdefault(check, {})[key] = entry
+            self.hits += 1
+            return entry["result"]
+        self.misses += 1
+        return None
+
+    def store(self, check: str, key: str, deps: list[str], token: str, result) -> None:
+        """Record the result of a unit together with the state of its inputs."""
+        self._kept.setdefault(check, {})[key] = {
+            "token": token,
+            "deps": self._deps_state(deps),
+            "result": result,
+        }
+
+    def save(self) -> None:
+        """Persist the units and file states seen in this run."""
+        save_cache(
+            self.repo_root,
+            self.name,
+            {"salt": self.salt, "files": self.files.to_json(), "results": self._kept},
+        )
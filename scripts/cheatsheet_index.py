@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Generate every agent's cheatsheets/_index.md, paginated for large cheatsheet sets.
+
+Usage:
+    python scripts/cheatsheet_index.py              # Update every agent's index (changed pages only)
+    python scripts/cheatsheet_index.py miles sam    # Only these agents
+    python scripts/cheatsheet_index.py --check      # Exit 1 if any index page is out of date
+
+Layout:
+    Up to PAGE_SIZE cheatsheets, _index.md is one table with a row per
+    cheatsheet: file, topic, confidence, last updated, size in bytes and line
+    count (so an agent can budget its context before loading a file).
+
+    Above PAGE_SIZE, _index.md becomes a short table of pages and the rows move
+    to cheatsheets/_index/{group}.md. A cheatsheet's group is its first
+    frontmatter tag, else the first significant word of its topic ("Stability
+    Derivatives Reference" -> stability). Groups of at least MIN_GROUP_SIZE get
+    their own page (split into {group}-1, {group}-2, ... above PAGE_SIZE). The
+    smaller groups are merged, in alphabetical order of their names, into range
+    pages {first}-to-{last} of at most RANGE_PAGE_SIZE cheatsheets; a group
+    never spans two range pages.
+
+Rows are cached in .agentsouls-cache/cheatsheet-index.json by each file's
+(mtime, size), so only new or changed cheatsheets are read, and a page is only
+written when its content differs from the file on disk. Pages no longer part
+of the layout are removed. validate.py check 5 verifies both levels
+(validate.py --fix rewrites them through the same code).
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import load_cache, save_cache, source_hash
+from frontmatter import parse_frontmatter
+from manifest import ManifestError, load_manifest
+from search import tokenize
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+INDEX_NAME = "_index.md"
+PAGES_DIR = "_index"  # sub-index pages, relative to the cheatsheets directory
+ROWS_CACHE_NAME = "cheatsheet-index.json"
+
+PAGE_SIZE = 200  # rows per page; a flat index holds at most this many
+MIN_GROUP_SIZE = 3  # smaller groups are merged into alphabetical range pages
+RANGE_PAGE_SIZE = 50  # rows per range page
+OTHER_GROUP = "other"  # cheatsheets whose tag and topic give no usable word
+PAGE_TOPICS = 3  # topics quoted per page in the top-level table
+
+TABLE_HEADER = (
+    "| Cheatsheet | Topic | Confidence | Last Updated | Bytes | Lines |\n"
+    "|------------|-------|------------|--------------|-------|-------|\n"
+)
+H1_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+GROUP_RE = re.compile(r"[a-z0-9]+")
+PAGE_LINK_RE = re.compile(r"\|\s*`?(" + PAGES_DIR + r"/[^|`\s]+\.md)`?\s*\|")
+FILE_CELL_RE = re.compile(r"^\|\s*`?([^|`\s/]+\.md)`?\s*\|", re.MULTILINE)
+
+# ---------------------------------------------------------------------------
+# Rows
+# ---------------------------------------------------------------------------
+
+
+class IndexRow(NamedTuple):
+    name: str
+    topic: str
+    confidence: str
+    last_updated: str
+    size: int
+    lines: int
+    group: str  # page group when the index is paginated (see group_of())
+
+
+def kebab_to_title(filename: str) -> str:
+    """Convert a kebab-case .md filename to Title Case."""
+    name = filename.removesuffix(".md")
+    return " ".join(word.capitalize() for word in name.split("-"))
+
+
+def index_row(name: str, text: str, fm: dict | None, size: int) -> IndexRow:
+    """Index row of one cheatsheet, from its content alone.
+
+    The topic falls back to the first H1 heading, then to the file name. The
+    date comes from the last_updated field only (empty without one, shown as
+    "—"), so the index never depends on git history or file modification times.
+    """
+    fm = fm or {}
+    topic = fm.get("topic", "") or ""
+    if not topic:
+        heading = H1_RE.search(text)
+        topic = heading.group(1).strip() if heading else kebab_to_title(name)
+    lines = text.count("\n") + (1 if text and not text.endswith("\n") else 0)
+    return IndexRow(
+        name, topic, fm.get("confidence", "") or "UNKNOWN", fm.get("last_updated", "") or "", size, lines,
+        group_of(fm.get("tags"), topic),
+    )
+
+
+def group_of(tags: str | list[str] | None, topic: str) -> str:
+    """Page group of a cheatsheet: its first tag, else the first significant word of its topic."""
+    tag = tags[0] if isinstance(tags, list) and tags else tags if isinstance(tags, str) else ""
+    words = GROUP_RE.findall(tag.lower()) if tag else []
+    if words:
+        return "-".join(words)
+    words = tokenize(topic)
+    return words[0] if words else OTHER_GROUP
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def paginate(rows: list[IndexRow], page_size: int = PAGE_SIZE) -> dict[str, list[IndexRow]]:
+    """Page name -> rows (in name order). Empty if the rows fit one flat index."""
+    if len(rows) <= page_size:
+        return {}
+    groups: dict[str, list[IndexRow]] = {}
+    for row in rows:
+        groups.setdefault(row.group, []).append(row)
+
+    pages: dict[str, list[IndexRow]] = {}
+    small: list[tuple[str, list[IndexRow]]] = []  # (group, rows) of groups below MIN_GROUP_SIZE
+    for group in sorted(groups):
+        members = sorted(groups[group], key=lambda r: r.name)
+        if len(members) < MIN_GROUP_SIZE:
+            small.append((group, members))
+        elif len(members) > page_size:
+            for n, start in enumerate(range(0, len(members), page_size), 1):
+                pages[f"{group}-{n}"] = members[start:start + page_size]
+        else:
+            pages[group] = members
+
+    # Alphabetical ranges of small groups, closed before a group would overflow the page
+    run: list[tuple[str, list[IndexRow]]] = []
+    for group, members in [*small, ("", [])]:
+        if run and (not members or sum(len(m) for _, m in run) + len(members) > RANGE_PAGE_SIZE):
+            first, last = run[0][0], run[-1][0]
+            pages[first if first == last else f"{first}-to-{last}"] = [r for _, m in run for r in m]
+            run = []
+        run.append((group, members))
+    return dict(sorted(pages.items()))
+
+
+def page_rel(page: str) -> str:
+    """Path of a page relative to the cheatsheets directory."""
+    return f"{PAGES_DIR}/{page}.md"
+
+
+def _cell(text: str) -> str:
+    return text.replace("|", "\\|")
+
+
+def _table(rows: list[IndexRow]) -> str:
+    return TABLE_HEADER + "".join(
+        f"| {r.name} | {_cell(r.topic)} | {_cell(r.confidence)} | {_cell(r.last_updated) or '—'} | {r.size} | {r.lines} |\n"
+        for r in rows
+    )
+
+
+def render_index(rows: list[IndexRow], page_size: int = PAGE_SIZE) -> dict[str, str]:
+    """Every file of an index (paths relative to the cheatsheets directory) -> content."""
+    if not rows:
+        return {INDEX_NAME: "# Cheatsheet Index\n\nNo cheatsheets yet.\n"}
+    pages = paginate(rows, page_size)
+    if not pages:
+        return {INDEX_NAME: "# Cheatsheet Index\n\n" + _table(rows)}
+
+    total = sum(r.size for r in rows)
+    lines = [
+        "# Cheatsheet Index\n",
+        "\n",
+        f"{len(rows)} cheatsheets ({total} bytes) on {len(pages)} pages, grouped by tag or topic word "
+        "(small groups share alphabetical range pages). Open the page for the current task; each lists its "
+        "cheatsheets with size and line count.\n",
+        "\n",
+        "| Page | Cheatsheets | Bytes | Topics |\n",
+        "|------|-------------|-------|--------|\n",
+    ]
+    files = {}
+    for page, members in pages.items():
+        topics = "; ".join(_cell(r.topic) for r in members[:PAGE_TOPICS]) + ("; …" if len(members) > PAGE_TOPICS else "")
+        lines.append(f"| {page_rel(page)} | {len(members)} | {sum(r.size for r in members)} | {topics} |\n")
+        files[page_rel(page)] = (
+            f"# Cheatsheet Index — {page}\n\n"
+            f"Page of `{INDEX_NAME}`. Cheatsheet files are in the parent directory.\n\n" + _table(members)
+        )
+    return {INDEX_NAME: "".join(lines), **files}
+
+
+def listed_files(text: str) -> set[str]:
+    """Cheatsheet file names in the first column of an index table."""
+    return set(FILE_CELL_RE.findall(text))
+
+
+def listed_pages(text: str) -> set[str]:
+    """Page paths (relative to the cheatsheets directory) linked from a top-level index."""
+    return set(PAGE_LINK_RE.findall(text))
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+
+def existing_pages(cheatsheets_dir: Path) -> list[str]:
+    """Page files currently in the cheatsheets/_index/ directory (relative paths)."""
+    try:
+        names = sorted(n for n in os.listdir(cheatsheets_dir / PAGES_DIR) if n.endswith(".md"))
+    except OSError:
+        return []
+    return [f"{PAGES_DIR}/{n}" for n in names]
+
+
+def apply_index(cheatsheets_dir: Path, files: dict[str, str], current: dict[str, str | None]) -> list[str]:
+    """Write the index files whose content differs from current, remove pages not in files.
+
+    current maps the relative paths of the existing index files to their content
+    (None if unreadable). Returns the relative paths written or removed.
+    """
+    changed = []
+    for rel, content in files.items():
+        if current.get(rel) != content:
+            path = cheatsheets_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            changed.append(rel)
+    for rel in current:
+        if rel not in files:
+            (cheatsheets_dir / rel).unlink(missing_ok=True)
+            changed.append(rel)
+    if not any(rel.startswith(PAGES_DIR + "/") for rel in files):
+        try:
+            (cheatsheets_dir / PAGES_DIR).rmdir()
+        except OSError:
+            pass  # absent, or holds files that are not pages
+    return changed
+
+
+class RowCache:
+    """Index rows per cheatsheet, keyed by (mtime, size) and persisted between runs."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.salt = source_hash(Path(__file__).resolve(), _SCRIPT_DIR / "frontmatter.py", _SCRIPT_DIR / "search.py")
+        data = load_cache(repo_root, ROWS_CACHE_NAME)
+        self._rows: dict[str, list] = data.get("rows", {}) if data.get("salt") == self.salt else {}
+        self._seen: dict[str, list] = {}
+        self._visited: set[str] = set()
+        self.read = 0  # cheatsheets read this run
+
+    def rows(self, cs_rel: str) -> list[IndexRow]:
+        """Rows of one cheatsheets directory (repo-relative), reading only changed files."""
+        self._visited.add(cs_rel)
+        try:
+            with os.scandir(self.repo_root / cs_rel) as it:
+                found = sorted((de.name, de) for de in it if de.name.endswith(".md") and de.name != INDEX_NAME)
+        except OSError:
+            return []
+        rows = []
+        for name, de in found:
+            rel = f"{cs_rel}/{name}"
+            try:
+                if not de.is_file():
+                    continue
+                st = de.stat()
+            except OSError:
+                continue
+            cached = self._rows.get(rel)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                entry = cached
+            else:
+                try:
+                    with open(de.path, encoding="utf-8", errors="replace") as f:
+                        text = f.read()
+                except OSError:
+                    continue
+                self.read += 1
+                entry = [st.st_mtime_ns, st.st_size, list(index_row(name, text, parse_frontmatter(text), st.st_size))]
+            self._seen[rel] = entry
+            rows.append(IndexRow(*entry[2]))
+        return rows
+
+    def save(self) -> None:
+        """Persist the rows seen in this run; those of directories not visited are kept."""
+        rows = {rel: row for rel, row in self._rows.items() if rel.rsplit("/", 1)[0] not in self._visited}
+        rows.update(self._seen)
+        if self.read or rows.keys() != self._rows.keys():
+            try:
+                save_cache(self.repo_root, ROWS_CACHE_NAME, {"salt": self.salt, "rows": rows})
+            except OSError:
+                pass  # the cache only saves work
+
+
+def update_index(repo_root: Path, cs_rel: str, row_cache: RowCache, write: bool = True) -> list[str]:
+    """Bring one agent's index up to date. Returns the relative paths that (would) change."""
+    cheatsheets_dir = repo_root / cs_rel
+    files = render_index(row_cache.rows(cs_rel))
+    current: dict[str, str | None] = {}
+    for rel in [INDEX_NAME, *existing_pages(cheatsheets_dir)]:
+        try:
+            current[rel] = (cheatsheets_dir / rel).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            current[rel] = None
+    if not write:
+        return [rel for rel, content in files.items() if current.get(rel) != content] + [
+            rel for rel in current if rel not in files
+        ]
+    return apply_index(cheatsheets_dir, files, current)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate cheatsheet indexes (_index.md and its pages)")
+    parser.add_argument("slugs", nargs="*", help="Agent slugs (default: every agent in the manifest)")
+    parser.add_argument("--check", action="store_true", help="Report out-of-date index files, write nothing")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    agents = {a["slug"]: a for a in manifest["agents"]}
+    unknown = [s for s in args.slugs if s not in agents]
+    if unknown:
+        print(f"ERROR: unknown agent slug(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    row_cache = RowCache(repo_root)
+    changed_total = 0
+    for slug in args.slugs or list(agents):
+        cs_rel = agents[slug]["paths"]["cheatsheets"].rstrip("/")
+        if not (repo_root / cs_rel).is_dir():
+            continue
+        changed = update_index(repo_root, cs_rel, row_cache, write=not args.check)
+        changed_total += len(changed)
+        for rel in changed:
+            print(f"  {'stale' if args.check else 'updated'}: {cs_rel}/{rel}")
+    row_cache.save()
+
+    if args.check:
+        if changed_total:
+            print(f"ERROR: {changed_total} index file(s) out of date; run python scripts/cheatsheet_index.py", file=sys.stderr)
+            sys.exit(1)
+        print("All cheatsheet indexes are up to date")
+    else:
+        print(f"{changed_total} index file(s) updated, {row_cache.read} cheatsheet(s) read")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Delegation graph over the manifest's delegates_to / defers_to / escalates_to lists.
+
+Usage:
+    python scripts/delegation.py                       # Dump every agent's edges and problems
+    python scripts/delegation.py --json                # Machine-readable dump
+    python scripts/delegation.py --dot > graph.dot     # Graphviz
+    python scripts/delegation.py --who escalates_to miles   # Who handles escalation for miles
+
+References are resolved to slugs once: an exact slug matches first, then a
+case-insensitive slug or display name (build_delegates_sentence() renders them
+capitalized, so "Sage" and "sage" both mean the agent sage). A reference that
+matches no agent is dangling.
+
+DelegationGraph builds adjacency and reverse-adjacency tables per relation,
+finds cycles with Tarjan's strongly-connected-components algorithm and
+resolves every agent's escalation chain, all in O(agents + references).
+Afterwards targets(), sources() and escalation_top() are dict lookups.
+
+An escalation chain follows the first escalates_to target of each agent until
+it reaches an agent with none, who escalates to the human operator
+(GENERAL_RULES.md). Chains that run into a cycle or a dangling reference never
+get there. validate.py (check 13) reports dangling references, cycles and such
+broken chains.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from manifest import ManifestError, load_manifest
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+RELATIONS = ("delegates_to", "defers_to", "escalates_to")
+
+# A cycle in these sends a decision or a blocker around forever
+STRICT_RELATIONS = {"defers_to", "escalates_to"}
+
+
+class Dangling(NamedTuple):
+    slug: str
+    relation: str
+    ref: str
+
+
+# ---------------------------------------------------------------------------
+# Graph
+# ---------------------------------------------------------------------------
+
+
+def strongly_connected(nodes: list[str], edges: dict[str, tuple[str, ...]]) -> list[list[str]]:
+    """Tarjan's algorithm (iterative). Returns components in reverse topological order."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(edges.get(root, ())))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(edges.get(child, ()))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+class DelegationGraph:
+    """Resolved delegation edges of every agent, with cycles and escalation chains precomputed."""
+
+    def __init__(self, agents: list[dict]) -> None:
+        self.slugs = [a["slug"] for a in agents]
+        lookup: dict[str, str] = {}
+        for agent in agents:
+            lookup.setdefault(agent["slug"].lower(), agent["slug"])
+            lookup.setdefault(str(agent.get("name", "")).lower(), agent["slug"])
+        exact = set(self.slugs)
+
+        self.edges: dict[str, dict[str, tuple[str, ...]]] = {r: {} for r in RELATIONS}
+        self.reverse: dict[str, dict[str, list[str]]] = {r: {} for r in RELATIONS}
+        self.dangling: list[Dangling] = []
+        for agent in agents:
+            slug = agent["slug"]
+            for relation in RELATIONS:
+                targets: list[str] = []
+                refs = agent.get(relation) or []
+                for ref in refs if isinstance(refs, list) else []:
+                    target = ref if ref in exact else lookup.get(str(ref).lower())
+                    if target is None:
+                        self.dangling.append(Dangling(slug, relation, str(ref)))
+                    elif target not in targets:
+                        targets.append(target)
+                        self.reverse[relation].setdefault(target, []).append(slug)
+                self.edges[relation][slug] = tuple(targets)
+
+        self.cycles: dict[str, list[list[str]]] = {}
+        for relation in RELATIONS:
+            edges = self.edges[relation]
+            self.cycles[relation] = [
+                sorted(component)
+                for component in strongly_connected(self.slugs, edges)
+                if len(component) > 1 or component[0] in edges.get(component[0], ())
+            ]
+        self._resolve_escalations()
+
+    def _resolve_escalations(self) -> None:
+        """Follow each agent's first escalates_to target to the top of its chain, once per agent."""
+        edges = self.edges["escalates_to"]
+        broken_refs = {d.slug for d in self.dangling if d.relation == "escalates_to"}
+        self.top: dict[str, str | None] = {}
+        for start in self.slugs:
+            path: list[str] = []
+            on_path: set[str] = set()
+            node = start
+            while node not in self.top:
+                if node in on_path:  # cycle: nobody on this path reaches the top
+                    result = None
+                    break
+                path.append(node)
+                on_path.add(node)
+                targets = edges.get(node, ())
+                if not targets:
+                    result = None if node in broken_refs else node
+                    break
+                node = targets[0]
+            else:
+                result = self.top[node]
+            for member in path:
+                self.top[member] = result
+
+    # -- queries ------------------------------------------------------------------
+
+    def targets(self, slug: str, relation: str) -> tuple[str, ...]:
+        """Agents slug hands work to over relation (resolved slugs, manifest order)."""
+        return self.edges[relation].get(slug, ())
+
+    def sources(self, slug: str, relation: str) -> list[str]:
+        """Agents that hand work to slug over relation."""
+        return self.reverse[relation].get(slug, [])
+
+    def escalation_top(self, slug: str) -> str | None:
+        """Last agent on slug's escalation chain (slug itself if it has no escalates_to).
+
+        None if the chain runs into a cycle or a dangling reference.
+        """
+        return self.top.get(slug)
+
+    def escalation_chain(self, slug: str) -> list[str]:
+        """slug followed by each first escalates_to target, stopping before a repeat."""
+        chain = [slug]
+        seen = {slug}
+        while targets := self.edges["escalates_to"].get(chain[-1]):
+            if targets[0] in seen:
+                chain.append(targets[0])
+                break
+            chain.append(targets[0])
+            seen.add(targets[0])
+        return chain
+
+    def broken_escalations(self) -> list[str]:
+        """Agents whose escalation chain never reaches an agent without escalates_to."""
+        return [slug for slug in self.slugs if self.top.get(slug) is None]
+
+    def to_dict(self) -> dict:
+        return {
+            "agents": {
+                slug: {
+                    **{relation: list(self.targets(slug, relation)) for relation in RELATIONS},
+                    "escalation_top": self.escalation_top(slug),
+                }
+                for slug in self.slugs
+            },
+            "dangling": [d._asdict() for d in self.dangling],
+            "cycles": self.cycles,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def _format_dot(graph: DelegationGraph) -> str:
+    styles = {"delegates_to": "solid", "defers_to": "dashed", "escalates_to": "bold"}
+    lines = ["digraph delegation {", "  rankdir=LR;"]
+    lines += [f'  "{slug}";' for slug in graph.slugs]
+    for relation in RELATIONS:
+        for slug in graph.slugs:
+            for target in graph.targets(slug, relation):
+                lines.append(f'  "{slug}" -> "{target}" [label="{relation}", style={styles[relation]}];')
+    lines.append("}")
+    return "\n".join(lines)
+
+
+def _format_text(graph: DelegationGraph) -> str:
+    lines = []
+    for slug in graph.slugs:
+        edges = [f"{r}: {', '.join(graph.targets(slug, r))}" for r in RELATIONS if graph.targets(slug, r)]
+        top = graph.escalation_top(slug)
+        escalation = "human operator" if top == slug else f"{top} → human operator" if top else "BROKEN"
+        lines.append(f"  {slug}: {'; '.join(edges) or 'no edges'} (escalation: {escalation})")
+    for d in graph.dangling:
+        lines.append(f"  dangling: {d.slug}.{d.relation} → '{d.ref}'")
+    for relation, cycles in graph.cycles.items():
+        for cycle in cycles:
+            lines.append(f"  cycle in {relation}: {' → '.join(cycle + cycle[:1])}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dump and query the agent delegation graph")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--json", action="store_true", help="Print the resolved graph as JSON")
+    output.add_argument("--dot", action="store_true", help="Print the graph in Graphviz dot format")
+    output.add_argument(
+        "--who", nargs=2, metavar=("RELATION", "SLUG"),
+        help=f"Print who handles RELATION ({', '.join(RELATIONS)}) for agent SLUG",
+    )
+    args = parser.parse_args()
+
+    try:
+        manifest = load_manifest(_SCRIPT_DIR.parent)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    graph = DelegationGraph(manifest["agents"])
+
+    if args.who:
+        relation, slug = args.who
+        if relation not in RELATIONS:
+            parser.error(f"RELATION must be one of {', '.join(RELATIONS)}")
+        if slug not in graph.edges[relation]:
+            print(f"ERROR: unknown agent slug: {slug}", file=sys.stderr)
+            sys.exit(1)
+        targets = graph.targets(slug, relation)
+        print(", ".join(targets) if targets else "(none)")
+        if relation == "escalates_to":
+            top = graph.escalation_top(slug)
+            chain = " → ".join(graph.escalation_chain(slug))
+            print(f"chain: {chain} → {'human operator' if top else 'BROKEN'}")
+    elif args.json:
+        print(json.dumps(graph.to_dict(), indent=2))
+    elif args.dot:
+        print(_format_dot(graph))
+    else:
+        print(f"Delegation graph: {len(graph.slugs)} agents")
+        print(_format_text(graph))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""YAML frontmatter parsing shared by the scripts (minimal, no external deps).
+
+Supports the YAML subset used by CORE.md, cheatsheets and SKILL.md files:
+
+    key: Issue #42              # plain value, kept verbatim (" #" is not a comment)
+    key: "double \"quoted\""    # \" \\ \n \t escapes
+    key: 'single ''quoted'''
+    key: [a, "b, c", d]         # flow list
+    key:                        # block list
+      - a
+      - b
+    key: |                      # literal block (> folds lines into one)
+      line one
+      line two
+    key: a long plain value
+      continued on an indented line
+
+Scalars are returned as strings (no int/bool/date conversion) and lists as
+lists of strings. Keys in SCALAR_KEYS are always strings: a bracketed value
+such as `confidence: [VERIFIED]` (the notation GENERAL_RULES.md prescribes)
+is kept as the text "[VERIFIED]", as the original regex parser returned it. Lines that fit none of these forms, and whole-line #
+comments, are ignored.
+
+read_frontmatter() streams a file only up to the closing --- and memoizes the
+result by (path, mtime, size) with LRU eviction, so repeated lookups of an
+unchanged file across checks and tools cost one stat().
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+
+FRONTMATTER_CACHE_SIZE = 4096  # files whose parsed frontmatter is memoized
+
+KEY_RE = re.compile(r"^(\w[\w-]*)\s*:\s*(.*?)\s*$")
+LIST_ITEM_RE = re.compile(r"^\s*-(?:\s+(.*?))?\s*$")
+DOUBLE_ESCAPES = {'"': '"', "\\": "\\", "n": "\n", "t": "\t", "/": "/"}
+# Fields every consumer reads as a single string; [..] is text here, not a flow list
+SCALAR_KEYS = frozenset({
+    "agent", "confidence", "created", "description", "domain", "last_updated",
+    "model", "name", "role", "source", "topic", "version",
+})
+
+# ---------------------------------------------------------------------------
+# Scalars
+# ---------------------------------------------------------------------------
+
+
+def _unquote(value: str) -> str:
+    """Strip quotes (and process escapes) from a scalar; plain scalars are only trimmed.
+
+    A " #" inside a plain scalar is kept rather than read as a comment, as the
+    original regex parser did, so values like "Issue #42" survive.
+    """
+    if len(value) >= 2 and value[0] == '"' and value.endswith('"'):
+        out: list[str] = []
+        chars = iter(value[1:-1])
+        for ch in chars:
+            if ch == "\\":
+                nxt = next(chars, "\\")
+                out.append(DOUBLE_ESCAPES.get(nxt, "\\" + nxt))
+            else:
+                out.append(ch)
+        return "".join(out)
+    if len(value) >= 2 and value[0] == "'" and value.endswith("'"):
+        return value[1:-1].replace("''", "'")
+    return value.strip()
+
+
+def _split_flow(value: str) -> list[str]:
+    """Split the inside of a [a, "b, c"] flow list on commas outside quotes."""
+    items: list[str] = []
+    current: list[str] = []
+    quote = ""
+    for ch in value:
+        if quote:
+            if ch == quote:
+                quote = ""
+        elif ch in "\"'":
+            quote = ch
+        elif ch == ",":
+            items.append("".join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    items.append("".join(current).strip())
+    return [_unquote(item) for item in items if item]
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def _dedent_block(lines: list[str], style: str) -> str:
+    """Join the lines of a | (literal) or > (folded) block scalar."""
+    while lines and not lines[-1].strip():
+        lines.pop()
+    indent = min((len(l) - len(l.lstrip()) for l in lines if l.strip()), default=0)
+    lines = [l[indent:] for l in lines]
+    if style == "|":
+        return "\n".join(lines)
+    return " ".join(l.strip() for l in lines if l.strip())
+
+
+def parse_lines(lines: Iterable[str]) -> dict[str, str | list[str]] | None:
+    """Parse frontmatter from an iterable of lines (the first must be ---).
+
+    Stops consuming at the closing ---. Returns None if the opening or the
+    closing delimiter is missing.
+    """
+    it = iter(lines)
+    first = next(it, None)
+    if first is None or first.strip() != "---":
+        return None
+
+    fields: dict[str, str | list[str]] = {}
+    key: str | None = None  # field that indented continuation lines belong to
+    block: str | None = None  # "|" or ">" while collecting a block scalar
+    block_lines: list[str] = []
+    quoted: str | None = None  # raw text of a quoted scalar still missing its closing quote
+
+    for raw in it:
+        line = raw.rstrip("\r\n")
+        if line.strip() == "---":
+            if block is not None:
+                fields[key] = _dedent_block(block_lines, block)
+            return fields
+        indented = line[:1] in (" ", "\t")
+
+        if block is not None:
+            if indented or not line.strip():
+                block_lines.append(line)
+                continue
+            fields[key] = _dedent_block(block_lines, block)
+            block = None
+        if quoted is not None:
+            quoted = f"{quoted} {line.strip()}" if quoted[-1:] != "\\" else quoted + line.strip()
+            if len(quoted) > 1 and quoted.endswith(quoted[0]) and not quoted.endswith("\\" + quoted[0]):
+                fields[key] = _unquote(quoted)
+                quoted = None
+            continue
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+
+        if key is not None and indented:
+            current = fields.get(key)
+            item = LIST_ITEM_RE.match(line)
+            if item and (current == "" or isinstance(current, list)):
+                if not isinstance(current, list):
+                    current = fields[key] = []
+                current.append(_unquote(item[1] or ""))
+            elif isinstance(current, str) and current:
+                fields[key] = f"{current} {_unquote(line.strip())}"
+            continue
+
+        match = KEY_RE.match(line)
+        if match is None:
+            key = None
+            continue
+        key, value = match[1], match[2]
+        if value in ("|", ">", "|-", ">-", "|+", ">+"):
+            block, block_lines = value[0], []
+            fields[key] = ""
+        elif value.startswith("[") and value.endswith("]") and key not in SCALAR_KEYS:
+            fields[key] = _split_flow(value[1:-1])
+        elif value[:1] in ("\"", "'") and (len(value) == 1 or not value.endswith(value[0])):
+            quoted = value
+        else:
+            fields[key] = _unquote(value)
+
+    return None  # Never found closing ---
+
+
+def parse_frontmatter(text: str) -> dict[str, str | list[str]] | None:
+    """Parse YAML frontmatter between --- delimiters. Returns None if no frontmatter."""
+    return parse_lines(io.StringIO(text))
+
+
+def has_frontmatter(text: str) -> bool:
+    """Return True if the text begins with a complete YAML frontmatter block."""
+    return parse_frontmatter(text) is not None
+
+
+_cache: OrderedDict[tuple[str, int, int], dict[str, str | list[str]] | None] = OrderedDict()
+
+
+def read_frontmatter(
+    path: Path | str,
+    stat: tuple[int, int] | None = None,
+    text: str | None = None,
+) -> dict[str, str | list[str]] | None:
+    """Frontmatter of a file, reading only up to the closing ---.
+
+    Results are memoized by (path, mtime_ns, size) in an LRU of
+    FRONTMATTER_CACHE_SIZE entries. Pass stat=(mtime_ns, size) when it is
+    already known to skip the stat() call, and text when the contents are
+    already in memory to parse them instead of reopening the file. Returns None
+    if the file has no frontmatter or cannot be read. The returned dict is a
+    copy, list values included, so callers may modify it freely.
+    """
+    if stat is None:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stat = (st.st_mtime_ns, st.st_size)
+    key = (os.fspath(path), *stat)
+    if key in _cache:
+        _cache.move_to_end(key)
+        fields = _cache[key]
+    else:
+        if text is not None:
+            fields = parse_frontmatter(text)
+        else:
+            try:
+                with open(key[0], encoding="utf-8") as f:
+                    fields = parse_lines(f)
+            except (OSError, UnicodeDecodeError):
+                fields = None
+        _cache[key] = fields
+        if len(_cache) > FRONTMATTER_CACHE_SIZE:
+            _cache.popitem(last=False)
+    if fields is None:
+        return None
+    return {k: list(v) if isinstance(v, list) else v for k, v in fields.items()}
+
+
+def clear_frontmatter_cache() -> None:
+    """Forget every memoized read_frontmatter() result."""
+    _cache.clear()
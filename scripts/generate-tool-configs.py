@@ -4,26 +4,62 @@
 Usage:
     python generate-tool-configs.py          # Generate all files
     python generate-tool-configs.py --check  # Verify committed files match (exits non-zero on drift)
+    python generate-tool-configs.py --watch  # Regenerate and revalidate on every file change
+    python generate-tool-configs.py --only miles,sam  # Only the given agents' wrappers/skills
+    python generate-tool-configs.py --force  # Ignore the fingerprint cache and re-render everything
+    python generate-tool-configs.py --fsync batch  # fsync written files before reporting success
+    python generate-tool-configs.py --bundle-budget 8000 --bundle-top-k 2  # Build smaller summon bundles
 
 AUTO-GENERATED files produced:
     .claude/agents/{slug}.md       — Claude Code agent wrappers
     .agents/skills/{slug}/SKILL.md — Cross-tool skill files
     .cursorrules                   — Cursor integration
     .windsurfrules                 — Windsurf integration
+    .agents/routing-index.json     — Capability/tag/domain routing index (see route.py)
+
+Local build output (gitignored, not covered by --check):
+    .agentsouls-cache/bundles/{slug}.md — Summon bundles (see bundles.py)
+
+Fingerprints:
+    Each output is keyed by a fingerprint of its inputs (the agent's manifest entry,
+    schema_version and the templates.py/generator source; for bundles also the
+    (mtime, size) of every source file and the budget). Fingerprints and the
+    (mtime, size) of the file last written are kept in .agentsouls-cache/generate.json;
+    an output whose fingerprint is unchanged and whose file was not touched since is
+    neither rendered nor read back.
+
+Writes:
+    Changed outputs are staged under .agentsouls-cache/ and renamed into place
+    as one batch (see writeback.py), so an interrupted run never leaves a
+    half-written file. --fsync picks durability vs throughput.
 
 Requirements: Python 3.10+, no external dependencies.
 """
 
 import argparse
-import json
 import sys
+from functools import partial
 from pathlib import Path
+from typing import Callable
 
 # Ensure scripts/ is on sys.path for sibling imports
 _SCRIPT_DIR = Path(__file__).resolve().parent
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+from bundles import (
+    BUNDLES_DIR,
+    DEFAULT_BUDGET_TOKENS,
+    DEFAULT_TOP_K,
+    FileSource,
+    bundle_path,
+    inputs_fingerprint,
+    render_bundle,
+)
+from cache import load_cache, save_cache, source_hash, stable_hash
+from manifest import ManifestError, load_manifest as load_merged_manifest
+from route import ROUTING_INDEX_PATH, render_routing_index
+from writeback import FSYNC_MODES, WriteBatch
 from templates import (
     render_claude_agent,
     render_cursorrules,
@@ -32,30 +68,20 @@ from templates import (
     sort_agents,
 )
 
+GENERATE_CACHE_NAME = "generate.json"
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
 def load_manifest(repo_root: Path) -> dict:
-    """Load and return the parsed manifest.json."""
-    manifest_path = repo_root / "agents" / "manifest.json"
-    if not manifest_path.exists():
-        print(f"ERROR: manifest not found at {manifest_path}", file=sys.stderr)
+    """Load and return the merged manifest (manifest.json plus agents/manifest.d/ shards)."""
+    try:
+        return load_merged_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
         sys.exit(1)
-    with open(manifest_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def write_file(path: Path, content: str) -> bool:
-    """Write content to path, creating parent dirs. Returns True if file changed."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-        if existing == content:
-            return False
-    path.write_text(content, encoding="utf-8")
-    return True
 
 
 # ---------------------------------------------------------------------------
@@ -63,82 +89,188 @@ def write_file(path: Path, content: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def generate(repo_root: Path, output_root: Path) -> list[tuple[str, str]]:
-    """Generate all files under output_root. Returns list of (relative_path, content)."""
-    manifest = load_manifest(repo_root)
+def templates_version() -> str:
+    """Fingerprint of the code that shapes the outputs (templates, bundles and their ranking, routing, this script)."""
+    return source_hash(
+        _SCRIPT_DIR / "templates.py",
+        _SCRIPT_DIR / "bundles.py",
+        _SCRIPT_DIR / "select_cheatsheets.py",
+        _SCRIPT_DIR / "search.py",
+        _SCRIPT_DIR / "route.py",
+        Path(__file__).resolve(),
+    )
+
+
+def plan_outputs(
+    manifest: dict,
+    only: set[str] | None = None,
+    repo_root: Path | None = None,
+    bundle_budget: int | None = None,
+    bundle_top_k: int | None = None,
+) -> list[tuple[str, str, Callable[[], str]]]:
+    """Return (relative_path, fingerprint, render) for every output; rendering is deferred.
+
+    With only, per-agent outputs are limited to those slugs (repo-level files are
+    always planned; their fingerprint covers every agent they list). Summon
+    bundles read agent files, so they are planned only when repo_root is given.
+    """
     schema_version = manifest["schema_version"]
     agents = sort_agents(manifest["agents"])
+    version = templates_version()
+    budget = bundle_budget or DEFAULT_BUDGET_TOKENS
+    top_k = bundle_top_k if bundle_top_k is not None else DEFAULT_TOP_K
 
-    generated: list[tuple[str, str]] = []
-
+    planned: list[tuple[str, str, Callable[[], str]]] = []
     for agent in agents:
         slug = agent["slug"]
+        if only is not None and slug not in only:
+            continue
+        fingerprint = stable_hash([version, schema_version, agent])
 
         # Claude Code agent wrapper
-        claude_rel = f".claude/agents/{slug}.md"
-        claude_content = render_claude_agent(agent, schema_version)
-        generated.append((claude_rel, claude_content))
+        planned.append((f".claude/agents/{slug}.md", fingerprint, partial(render_claude_agent, agent, schema_version)))
 
         # Cross-tool skill file
-        skill_rel = f".agents/skills/{slug}/SKILL.md"
-        skill_content = render_skill(agent, schema_version)
-        generated.append((skill_rel, skill_content))
+        planned.append((f".agents/skills/{slug}/SKILL.md", fingerprint, partial(render_skill, agent, schema_version)))
+
+        # Summon bundle
+        if repo_root is not None:
+            source = FileSource(repo_root)
+            rel_path = bundle_path(slug)
+            inputs = inputs_fingerprint(agent, schema_version, source)
+            bundle_fingerprint = stable_hash([version, budget, top_k, inputs])
+            planned.append((rel_path, bundle_fingerprint, partial(render_bundle, agent, schema_version, source, budget, top_k)))
 
     # Repo-level tool config files
-    generated.append((".cursorrules", render_cursorrules(agents, schema_version)))
-    generated.append((".windsurfrules", render_windsurfrules(agents, schema_version)))
+    repo_fingerprint = stable_hash([version, schema_version, agents])
+    planned.append((".cursorrules", repo_fingerprint, partial(render_cursorrules, agents, schema_version)))
+    planned.append((".windsurfrules", repo_fingerprint, partial(render_windsurfrules, agents, schema_version)))
+    planned.append((ROUTING_INDEX_PATH, repo_fingerprint, partial(render_routing_index, agents, schema_version)))
+
+    return planned
 
-    return generated
 
+def generate(repo_root: Path, output_root: Path) -> list[tuple[str, str]]:
+    """Generate all files under output_root. Returns list of (relative_path, content)."""
+    manifest = load_manifest(repo_root)
+    return [(rel_path, render()) for rel_path, _, render in plan_outputs(manifest, repo_root=repo_root)]
 
-def do_generate(repo_root: Path) -> None:
-    """Generate all files in-place under repo_root."""
-    files = generate(repo_root, repo_root)
-    created = 0
-    unchanged = 0
-    updated = 0
 
-    for rel_path, content in files:
-        full_path = repo_root / rel_path
-        if not full_path.exists():
-            write_file(full_path, content)
-            created += 1
-        else:
-            changed = write_file(full_path, content)
-            if changed:
-                updated += 1
-            else:
-                unchanged += 1
+class FingerprintCache:
+    """Per-output fingerprint plus the (mtime_ns, size) of the file it was verified against."""
 
-    total = len(files)
-    per_agent = (total - 2) // 2  # subtract .cursorrules + .windsurfrules
+    def __init__(self, repo_root: Path, enabled: bool = True) -> None:
+        self.repo_root = repo_root
+        self.enabled = enabled
+        self._outputs: dict[str, list] = load_cache(repo_root, GENERATE_CACHE_NAME).get("outputs", {}) if enabled else {}
+
+    def is_current(self, rel_path: str, fingerprint: str) -> bool:
+        """True if rel_path was produced from fingerprint and has not been touched since."""
+        entry = self._outputs.get(rel_path)
+        if entry is None or entry[0] != fingerprint:
+            return False
+        try:
+            st = (self.repo_root / rel_path).stat()
+        except OSError:
+            return False
+        return entry[1] == st.st_mtime_ns and entry[2] == st.st_size
+
+    def mark(self, rel_path: str, fingerprint: str) -> None:
+        """Record that rel_path on disk now matches fingerprint."""
+        st = (self.repo_root / rel_path).stat()
+        self._outputs[rel_path] = [fingerprint, st.st_mtime_ns, st.st_size]
+
+    def save(self) -> None:
+        if self.enabled:
+            save_cache(self.repo_root, GENERATE_CACHE_NAME, {"outputs": self._outputs})
+
+
+def _parse_only(manifest: dict, only: str | None) -> set[str] | None:
+    """Parse --only into a set of slugs, exiting on unknown ones."""
+    if not only:
+        return None
+    slugs = {s.strip() for s in only.split(",") if s.strip()}
+    unknown = slugs - {a["slug"] for a in manifest["agents"]}
+    if unknown:
+        print(f"ERROR: unknown agent slug(s) for --only: {', '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(1)
+    return slugs
+
+
+def do_generate(
+    repo_root: Path,
+    only: str | None = None,
+    force: bool = False,
+    fsync: str = "none",
+    bundle_budget: int | None = None,
+    bundle_top_k: int | None = None,
+) -> None:
+    """Generate all files in-place under repo_root (changed files are written as one atomic batch)."""
+    manifest = load_manifest(repo_root)
+    planned = plan_outputs(manifest, _parse_only(manifest, only), repo_root, bundle_budget, bundle_top_k)
+    cache = FingerprintCache(repo_root, enabled=not force)
+    counts = {"created": 0, "updated": 0, "unchanged": 0}
+    skipped = 0
+    verified: list[tuple[str, str]] = []
+
+    with WriteBatch(repo_root, fsync=fsync) as batch:
+        for rel_path, fingerprint, render in planned:
+            if cache.is_current(rel_path, fingerprint):
+                counts["unchanged"] += 1
+                skipped += 1
+                continue
+            counts[batch.add(rel_path, render())] += 1
+            verified.append((rel_path, fingerprint))
+
+    for rel_path, fingerprint in verified:
+        cache.mark(rel_path, fingerprint)
+    cache.save()
+    created, updated, unchanged = counts["created"], counts["updated"], counts["unchanged"]
+
+    total = len(planned)
+    per_agent = (total - 3) // 3  # subtract .cursorrules, .windsurfrules and the routing index
     print(f"Generated {total} files ({created} created, {updated} updated, {unchanged} unchanged)")
     print(f"  - .claude/agents/*.md: {per_agent} files")
     print(f"  - .agents/skills/*/SKILL.md: {per_agent} files")
+    print(f"  - {BUNDLES_DIR}/*.md: {per_agent} files (local, not committed)")
     print(f"  - .cursorrules, .windsurfrules: 2 files")
+    print(f"  - {ROUTING_INDEX_PATH}: 1 file")
+    if skipped:
+        print(f"  - {skipped} unchanged files skipped by fingerprint")
+    print(f"  - {batch.summary()}")
+
 
+def do_check(repo_root: Path, only: str | None = None, force: bool = False) -> None:
+    """Check that committed files match what would be generated. Exit non-zero on drift.
 
-def do_check(repo_root: Path) -> None:
-    """Check that committed files match what would be generated. Exit non-zero on drift."""
-    files = generate(repo_root, repo_root)
+    Summon bundles are local build output and are not checked (they are not
+    planned without repo_root). The fingerprint cache is only read: outputs it
+    vouches for are skipped, everything else is compared, and nothing is
+    written, so --check works on a read-only checkout and leaves no cache behind.
+    """
+    manifest = load_manifest(repo_root)
+    planned = plan_outputs(manifest, _parse_only(manifest, only))
+    cache = FingerprintCache(repo_root, enabled=not force)
     drift_count = 0
     missing_count = 0
     ok_count = 0
 
-    for rel_path, expected_content in files:
+    for rel_path, fingerprint, render in planned:
         full_path = repo_root / rel_path
-        if not full_path.exists():
+        if cache.is_current(rel_path, fingerprint):
+            ok_count += 1
+        elif not full_path.exists():
             print(f"  MISSING: {rel_path}")
             missing_count += 1
         else:
             actual = full_path.read_text(encoding="utf-8")
-            if actual != expected_content:
+            if actual != render():
                 print(f"  DRIFT:   {rel_path}")
                 drift_count += 1
             else:
                 ok_count += 1
 
-    total = len(files)
+    total = len(planned)
     print(f"Checked {total} files: {ok_count} ok, {drift_count} drifted, {missing_count} missing")
 
     if drift_count > 0 or missing_count > 0:
@@ -158,14 +290,62 @@ def main() -> None:
         action="store_true",
         help="Verify committed files match generated output (exits non-zero on drift)",
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: re-render affected agents and re-run affected checks on change",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll os.stat instead of using inotify (e.g. network filesystems)",
+    )
+    parser.add_argument(
+        "--only",
+        metavar="SLUGS",
+        help="Comma-separated agent slugs: only (re)generate or check these agents' files",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the fingerprint cache: render and compare every output",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="none",
+        help="Durability of written files: none (fastest), batch (one sync pass), each (per file)",
+    )
+    parser.add_argument(
+        "--bundle-budget",
+        type=int,
+        metavar="TOKENS",
+        help=f"Token budget for summon bundles (default: {DEFAULT_BUDGET_TOKENS})",
+    )
+    parser.add_argument(
+        "--bundle-top-k",
+        type=int,
+        metavar="K",
+        help=f"Cheatsheets included in each summon bundle (default: {DEFAULT_TOP_K})",
+    )
     args = parser.parse_args()
 
     repo_root = _SCRIPT_DIR.parent
 
-    if args.check:
-        do_check(repo_root)
+    if args.watch:
+        from watch import watch
+        watch(repo_root, generate=True, polling=args.poll)
+    elif args.check:
+        do_check(repo_root, only=args.only, force=args.force)
     else:
-        do_generate(repo_root)
+        do_generate(
+            repo_root,
+            only=args.only,
+            force=args.force,
+            fsync=args.fsync,
+            bundle_budget=args.bundle_budget,
+            bundle_top_k=args.bundle_top_k,
+        )
 
 
 if __name__ == "__main__":
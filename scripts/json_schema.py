@@ -0,0 +1,366 @@
+"""A small JSON Schema (draft-07 subset) validator, compiled to closures.
+
+Supported keywords:
+    type, enum, const,
+    properties, required, additionalProperties, patternProperties,
+    items (single schema or tuple), minItems, maxItems, uniqueItems,
+    minLength, maxLength, pattern,
+    minimum, maximum, exclusiveMinimum, exclusiveMaximum,
+    allOf, anyOf, oneOf, not,
+    $ref to a local JSON pointer ("#", "#/$defs/...", "#/definitions/...")
+Annotations (title, description, examples, default, $id, $schema) and any other
+keyword are ignored.
+
+compile_schema() walks the schema once and returns a function that checks an
+instance and yields every violation as a SchemaViolation with the JSON pointer
+of the offending value; keyword dispatch, $ref resolution and regex
+compilation all happen at compile time, so validation is a chain of closure
+calls. compile_schema_text() memoizes compilation per process by the SHA-256
+of the schema text (compiling takes well under a millisecond, so there is no
+on-disk form).
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, NamedTuple
+
+from cache import sha256_bytes
+
+# ---------------------------------------------------------------------------
+# Types
+# ---------------------------------------------------------------------------
+
+
+class SchemaViolation(NamedTuple):
+    pointer: str  # JSON pointer of the offending value ("" = the whole document)
+    message: str
+
+
+# fn(instance, pointer, violations) appends to violations
+Validator = Callable[[Any, str, list], None]
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) or isinstance(value, float) and value.is_integer()
+
+
+TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": _is_integer,
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+
+def escape_pointer(token: str) -> str:
+    """Escape one JSON pointer reference token (RFC 6901)."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    """Equality as JSON sees it (True != 1, 1 == 1.0)."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _describe(value: Any) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= 60 else text[:57] + "..."
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+
+class _Compiler:
+    def __init__(self, root: Any) -> None:
+        self.root = root
+        self.refs: dict[str, Validator] = {}
+
+    def resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise ValueError(f"unsupported $ref (only local pointers): {ref}")
+        node = self.root
+        for token in ref[1:].split("/")[1:]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError):
+                raise ValueError(f"unresolvable $ref: {ref}") from None
+        return node
+
+    def ref(self, ref: str) -> Validator:
+        if ref not in self.refs:
+            target: list[Validator] = []  # filled after compiling, so recursive refs work
+            self.refs[ref] = lambda inst, ptr, out: target[0](inst, ptr, out)
+            target.append(self.compile(self.resolve(ref)))
+        return self.refs[ref]
+
+    def compile(self, schema: Any) -> Validator:
+        if schema is True or schema == {}:
+            return lambda inst, ptr, out: None
+        if schema is False:
+            return lambda inst, ptr, out: out.append(SchemaViolation(ptr, "no value is allowed here"))
+        if not isinstance(schema, dict):
+            raise ValueError(f"schema must be an object or a boolean, got {_describe(schema)}")
+        if "$ref" in schema:  # draft-07: siblings of $ref are ignored
+            return self.ref(schema["$ref"])
+
+        checks: list[Validator] = []
+        type_check = self._type(schema)
+        for builder in (self._enum, self._string, self._number, self._object, self._array, self._combinators):
+            checks.extend(builder(schema))
+
+        if type_check is None:
+            if len(checks) == 1:
+                return checks[0]
+
+            def validate(inst, ptr, out):
+                for check in checks:
+                    check(inst, ptr, out)
+            return validate
+
+        # A value of the wrong type gets one violation, not one per keyword
+        def validate_typed(inst, ptr, out):
+            if type_check(inst, ptr, out):
+                for check in checks:
+                    check(inst, ptr, out)
+        return validate_typed
+
+    # -- keyword groups -----------------------------------------------------------
+
+    def _type(self, schema: dict):
+        if "type" not in schema:
+            return None
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        tests = [TYPE_CHECKS[n] for n in names]
+        expected = " or ".join(names)
+
+        def check_type(inst, ptr, out) -> bool:
+            for test in tests:
+                if test(inst):
+                    return True
+            out.append(SchemaViolation(ptr, f"expected {expected}, got {_describe(inst)}"))
+            return False
+        return check_type
+
+    def _enum(self, schema: dict) -> list[Validator]:
+        checks = []
+        if "enum" in schema:
+            options = schema["enum"]
+            hashable = all(isinstance(o, str) for o in options)
+            allowed = frozenset(options) if hashable else None
+            listed = ", ".join(_describe(o) for o in options)
+
+            def check_enum(inst, ptr, out):
+                ok = inst in allowed if hashable and isinstance(inst, str) else any(_json_equal(inst, o) for o in options)
+                if not ok:
+                    out.append(SchemaViolation(ptr, f"{_describe(inst)} is not one of {listed}"))
+            checks.append(check_enum)
+        if "const" in schema:
+            const = schema["const"]
+
+            def check_const(inst, ptr, out):
+                if not _json_equal(inst, const):
+                    out.append(SchemaViolation(ptr, f"expected {_describe(const)}, got {_describe(inst)}"))
+            checks.append(check_const)
+        return checks
+
+    def _string(self, schema: dict) -> list[Validator]:
+        checks = []
+        min_len, max_len = schema.get("minLength"), schema.get("maxLength")
+        if min_len is not None or max_len is not None:
+            def check_length(inst, ptr, out):
+                if isinstance(inst, str):
+                    if min_len is not None and len(inst) < min_len:
+                        out.append(SchemaViolation(ptr, f"shorter than {min_len} characters"))
+                    if max_len is not None and len(inst) > max_len:
+                        out.append(SchemaViolation(ptr, f"longer than {max_len} characters"))
+            checks.append(check_length)
+        if "pattern" in schema:
+            pattern = schema["pattern"]
+            search = re.compile(pattern).search
+
+            def check_pattern(inst, ptr, out):
+                if isinstance(inst, str) and search(inst) is None:
+                    out.append(SchemaViolation(ptr, f"{_describe(inst)} does not match {pattern}"))
+            checks.append(check_pattern)
+        return checks
+
+    def _number(self, schema: dict) -> list[Validator]:
+        bounds = [
+            (schema[k], op, text)
+            for k, op, text in (
+                ("minimum", lambda v, b: v >= b, "less than"),
+                ("maximum", lambda v, b: v <= b, "greater than"),
+                ("exclusiveMinimum", lambda v, b: v > b, "not greater than"),
+                ("exclusiveMaximum", lambda v, b: v < b, "not less than"),
+            )
+            if isinstance(schema.get(k), (int, float)) and not isinstance(schema.get(k), bool)
+        ]
+        if not bounds:
+            return []
+
+        def check_bounds(inst, ptr, out):
+            if isinstance(inst, (int, float)) and not isinstance(inst, bool):
+                for bound, op, text in bounds:
+                    if not op(inst, bound):
+                        out.append(SchemaViolation(ptr, f"{inst} is {text} {bound}"))
+        return [check_bounds]
+
+    def _object(self, schema: dict) -> list[Validator]:
+        keys = ("properties", "required", "additionalProperties", "patternProperties")
+        if not any(k in schema for k in keys):
+            return []
+        required = list(schema.get("required", []))
+        properties = {name: self.compile(sub) for name, sub in schema.get("properties", {}).items()}
+        patterns = [(re.compile(p).search, self.compile(sub)) for p, sub in schema.get("patternProperties", {}).items()]
+        additional = schema.get("additionalProperties", True)
+        extra = None if additional is True else self.compile(additional) if additional is not False else False
+
+        def check_object(inst, ptr, out):
+            if not isinstance(inst, dict):
+                return
+            for name in required:
+                if name not in inst:
+                    out.append(SchemaViolation(ptr, f"missing required property '{name}'"))
+            for name, value in inst.items():
+                child = f"{ptr}/{escape_pointer(name)}"
+                validate = properties.get(name)
+                matched = validate is not None
+                if matched:
+                    validate(value, child, out)
+                for search, validate_pattern in patterns:
+                    if search(name):
+                        matched = True
+                        validate_pattern(value, child, out)
+                if not matched and extra is not None:
+                    if extra is False:
+                        out.append(SchemaViolation(child, f"unexpected property '{name}'"))
+                    else:
+                        extra(value, child, out)
+        return [check_object]
+
+    def _array(self, schema: dict) -> list[Validator]:
+        checks = []
+        items = schema.get("items")
+        if isinstance(items, list):
+            tuple_items = [self.compile(sub) for sub in items]
+
+            def check_tuple(inst, ptr, out):
+                if isinstance(inst, list):
+                    for i, (value, validate) in enumerate(zip(inst, tuple_items)):
+                        validate(value, f"{ptr}/{i}", out)
+            checks.append(check_tuple)
+        elif items is not None and items is not True and items != {}:
+            validate_item = self.compile(items)
+
+            def check_items(inst, ptr, out):
+                if isinstance(inst, list):
+                    for i, value in enumerate(inst):
+                        validate_item(value, f"{ptr}/{i}", out)
+            checks.append(check_items)
+
+        min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+        unique = schema.get("uniqueItems") is True
+        if min_items is not None or max_items is not None or unique:
+            def check_size(inst, ptr, out):
+                if not isinstance(inst, list):
+                    return
+                if min_items is not None and len(inst) < min_items:
+                    out.append(SchemaViolation(ptr, f"fewer than {min_items} items"))
+                if max_items is not None and len(inst) > max_items:
+                    out.append(SchemaViolation(ptr, f"more than {max_items} items"))
+                if unique:
+                    for i, value in enumerate(inst):
+                        if any(_json_equal(value, other) for other in inst[:i]):
+                            out.append(SchemaViolation(f"{ptr}/{i}", f"duplicate item {_describe(value)}"))
+            checks.append(check_size)
+        return checks
+
+    def _combinators(self, schema: dict) -> list[Validator]:
+        checks = []
+        for sub in schema.get("allOf", []):
+            checks.append(self.compile(sub))
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in schema:
+                checks.append(self._branches(keyword, [self.compile(sub) for sub in schema[keyword]]))
+        if "not" in schema:
+            negated = self.compile(schema["not"])
+
+            def check_not(inst, ptr, out):
+                errors: list[SchemaViolation] = []
+                negated(inst, ptr, errors)
+                if not errors:
+                    out.append(SchemaViolation(ptr, "must not match the 'not' schema"))
+            checks.append(check_not)
+        return checks
+
+    @staticmethod
+    def _branches(keyword: str, branches: list[Validator]) -> Validator:
+        one = keyword == "oneOf"
+
+        def check_branches(inst, ptr, out):
+            matches = 0
+            first_errors: list[SchemaViolation] | None = None
+            for validate in branches:
+                errors: list[SchemaViolation] = []
+                validate(inst, ptr, errors)
+                if not errors:
+                    matches += 1
+                    if not one:
+                        return
+                elif first_errors is None:
+                    first_errors = errors
+            if matches == 1 and one:
+                return
+            if matches > 1:
+                out.append(SchemaViolation(ptr, f"matches {matches} of the oneOf schemas, expected exactly one"))
+            else:
+                detail = f" (first: {first_errors[0].message})" if first_errors else ""
+                out.append(SchemaViolation(ptr, f"matches none of the {keyword} schemas{detail}"))
+        return check_branches
+
+
+def compile_schema(schema: Any) -> Callable[[Any], list[SchemaViolation]]:
+    """Compile a schema into validate(instance) -> violations (empty when valid).
+
+    Raises ValueError if the schema itself is malformed or uses a remote $ref.
+    """
+    try:
+        validator = _Compiler(schema).compile(schema)
+    except (re.error, KeyError, TypeError) as e:
+        raise ValueError(f"invalid schema: {e}") from e
+
+    def validate(instance: Any, pointer: str = "") -> list[SchemaViolation]:
+        violations: list[SchemaViolation] = []
+        validator(instance, pointer, violations)
+        return violations
+    return validate
+
+
+_compiled: dict[str, Callable[[Any], list[SchemaViolation]]] = {}
+
+
+def compile_schema_text(text: str) -> Callable[[Any], list[SchemaViolation]]:
+    """compile_schema() for a schema given as JSON text, memoized by the text's SHA-256.
+
+    Raises ValueError if the text is not valid JSON or not a valid schema.
+    """
+    digest = sha256_bytes(text.encode("utf-8"))
+    if digest not in _compiled:
+        _compiled[digest] = compile_schema(json.loads(text))
+    return _compiled[digest]
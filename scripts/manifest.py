@@ -0,0 +1,174 @@
+"""Loading agents/manifest.json together with its agents/manifest.d/ shards.
+
+agents/manifest.json holds schema_version (and optionally an "agents" array).
+Agents can also live in shard files under agents/manifest.d/, e.g. one per
+domain or one per agent, so that adding an agent does not touch a shared file:
+
+    agents/manifest.d/aerospace.json   {"agents": [{...}, {...}]}
+    agents/manifest.d/miles.json       {"slug": "miles", ...}   # a single agent
+
+The merged manifest is manifest.json with its agents followed by those of each
+shard in file-name order. Parsed sources are kept in a pickle under
+.agentsouls-cache/ keyed by each file's (mtime, size), so a load only parses the
+files that changed since the last one. Slugs defined more than once are not
+merged away; duplicate_slugs() reports them (validate.py check 1).
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from pathlib import Path
+
+from cache import CACHE_FORMAT, cache_path
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+MANIFEST_REL = "agents/manifest.json"
+SHARDS_DIR_REL = "agents/manifest.d"
+
+MANIFEST_CACHE_NAME = "manifest.pickle"
+
+
+class ManifestError(ValueError):
+    """A manifest source is missing, unreadable or malformed (the cause is chained)."""
+
+    def __init__(self, rel_path: str, message: str) -> None:
+        super().__init__(f"{rel_path}: {message}")
+        self.rel_path = rel_path
+        self.message = message
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+def is_manifest_source(rel_path: str) -> bool:
+    """True for manifest.json and the shard files (repo-relative, / separated)."""
+    return rel_path == MANIFEST_REL or (
+        rel_path.startswith(SHARDS_DIR_REL + "/") and rel_path.endswith(".json") and rel_path.count("/") == 2
+    )
+
+
+def source_paths(repo_root: Path) -> list[str]:
+    """manifest.json followed by the shard files in name order."""
+    try:
+        names = sorted(
+            n for n in os.listdir(repo_root / SHARDS_DIR_REL)
+            if n.endswith(".json") and not n.startswith(".")
+        )
+    except OSError:
+        names = []
+    return [MANIFEST_REL] + [f"{SHARDS_DIR_REL}/{n}" for n in names]
+
+
+def _parse_source(repo_root: Path, rel_path: str) -> dict:
+    try:
+        text = (repo_root / rel_path).read_text(encoding="utf-8")
+    except FileNotFoundError as e:
+        raise ManifestError(rel_path, "not found") from e
+    except UnicodeDecodeError as e:
+        raise ManifestError(rel_path, f"Not valid UTF-8: {e}") from e
+    except OSError as e:
+        raise ManifestError(rel_path, f"cannot read: {e}") from e
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ManifestError(rel_path, f"Invalid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ManifestError(rel_path, "expected a JSON object")
+
+    if rel_path != MANIFEST_REL:
+        if "slug" in data and "agents" not in data:
+            data = {"agents": [data]}
+        elif not isinstance(data.get("agents"), list):
+            raise ManifestError(rel_path, "expected an 'agents' array or a single agent object")
+    return data
+
+
+def load_sources(repo_root: Path, use_cache: bool = True) -> list[tuple[str, dict]]:
+    """(rel_path, parsed JSON) of every manifest source; shards come back as {"agents": [...]}.
+
+    Sources whose (mtime_ns, size) match the pickle cache are not re-read.
+    Raises ManifestError for the first source that cannot be loaded.
+    """
+    path = cache_path(repo_root, MANIFEST_CACHE_NAME)
+    cached: dict[str, tuple[int, int, dict]] = {}
+    if use_cache:
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            if payload.get("format") == CACHE_FORMAT:
+                cached = payload["sources"]
+        except Exception:  # missing, truncated or from another version: start over
+            cached = {}
+
+    sources: list[tuple[str, dict]] = []
+    fresh: dict[str, tuple[int, int, dict]] = {}
+    for rel_path in source_paths(repo_root):
+        try:
+            st = (repo_root / rel_path).stat()
+        except OSError as e:
+            raise ManifestError(rel_path, "not found") from e
+        hit = cached.get(rel_path)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            data = hit[2]
+        else:
+            data = _parse_source(repo_root, rel_path)
+        fresh[rel_path] = (st.st_mtime_ns, st.st_size, data)
+        sources.append((rel_path, data))
+
+    changed = fresh.keys() != cached.keys() or any(cached[rel][:2] != entry[:2] for rel, entry in fresh.items())
+    if use_cache and changed:
+        _save(path, fresh)
+    return sources
+
+
+def _save(path: Path, sources: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump({"format": CACHE_FORMAT, "sources": sources}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # the cache only saves work
+
+
+# ---------------------------------------------------------------------------
+# Merging
+# ---------------------------------------------------------------------------
+
+
+def merge_sources(sources: list[tuple[str, dict]]) -> dict:
+    """Merge loaded sources into one manifest dict (manifest.json keys, all agents)."""
+    (_, base), *shards = sources
+    manifest = dict(base)
+    if shards:
+        agents = base.get("agents", [])
+        manifest["agents"] = (list(agents) if isinstance(agents, list) else []) + [
+            agent for _, shard in shards for agent in shard["agents"]
+        ]
+    return manifest
+
+
+def load_manifest(repo_root: Path, use_cache: bool = True) -> dict:
+    """The merged manifest. Raises ManifestError if a source cannot be loaded."""
+    return merge_sources(load_sources(repo_root, use_cache))
+
+
+def duplicate_slugs(sources: list[tuple[str, dict]]) -> dict[str, list[str]]:
+    """Slugs defined more than once, mapped to the source of each definition."""
+    seen: dict[str, list[str]] = {}
+    for rel_path, data in sources:
+        agents = data.get("agents")
+        for agent in agents if isinstance(agents, list) else []:
+            if isinstance(agent, dict) and isinstance(agent.get("slug"), str):
+                seen.setdefault(agent["slug"], []).append(rel_path)
+    return {slug: rels for slug, rels in seen.items() if len(rels) > 1}
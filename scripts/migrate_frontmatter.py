@@ -8,7 +8,7 @@ Usage:
 Frontmatter added:
     topic: <extracted from first H1 heading, or kebab-to-title from filename>
     confidence: TEXTBOOK
-    last_updated: <today>
+    last_updated: <date of the file's last commit (repo_metadata.py), else today>
     source: training-session
 
 Cheatsheets that already have frontmatter are skipped unchanged.
@@ -24,25 +24,21 @@ from pathlib import Path
 
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _REPO_ROOT = _SCRIPT_DIR.parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
 
-try:
-    import json
-    manifest_path = _REPO_ROOT / "agents" / "manifest.json"
-    _MANIFEST = json.loads(manifest_path.read_text(encoding="utf-8"))
-except Exception as e:
-    print(f"Error loading manifest: {e}", file=sys.stderr)
-    sys.exit(1)
+from frontmatter import read_frontmatter
+from manifest import ManifestError, load_manifest
+from repo_metadata import repo_metadata
 
 
-def has_frontmatter(text: str) -> bool:
-    """Return True if the text begins with a YAML frontmatter block."""
-    lines = text.split("\n")
-    if not lines or lines[0].strip() != "---":
-        return False
-    for line in lines[1:]:
-        if line.strip() == "---":
-            return True
-    return False
+def _load_manifest() -> dict:
+    """The merged manifest, loaded when a migration runs rather than on import."""
+    try:
+        return load_manifest(_REPO_ROOT)
+    except ManifestError as e:
+        print(f"Error loading manifest: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def extract_title(text: str, filename: str) -> str:
@@ -56,16 +52,16 @@ def extract_title(text: str, filename: str) -> str:
     return " ".join(word.capitalize() for word in name.split("-"))
 
 
-def build_frontmatter(topic: str) -> str:
-    today = date.today().strftime("%Y-%m-%d")
-    return f"---\ntopic: \"{topic}\"\nconfidence: TEXTBOOK\nlast_updated: \"{today}\"\nsource: training-session\n---\n\n"
+def build_frontmatter(topic: str, last_updated: str | None = None) -> str:
+    last_updated = last_updated or date.today().strftime("%Y-%m-%d")
+    return f"---\ntopic: \"{topic}\"\nconfidence: TEXTBOOK\nlast_updated: \"{last_updated}\"\nsource: training-session\n---\n\n"
 
 
-def migrate(write: bool) -> int:
+def migrate(write: bool, manifest: dict | None = None) -> int:
     migrated = 0
     skipped = 0
 
-    for agent in _MANIFEST["agents"]:
+    for agent in (manifest or _load_manifest())["agents"]:
         slug = agent["slug"]
         cs_dir = _REPO_ROOT / agent["paths"]["cheatsheets"]
         if not cs_dir.is_dir():
@@ -75,21 +71,22 @@ def migrate(write: bool) -> int:
             if not md_file.is_file() or md_file.suffix != ".md" or md_file.name == "_index.md":
                 continue
 
+            # Only the frontmatter block is read for files that already have one
+            if read_frontmatter(md_file) is not None:
+                skipped += 1
+                continue
+
             try:
                 text = md_file.read_text(encoding="utf-8")
             except (UnicodeDecodeError, OSError) as e:
                 print(f"  [ERROR] {md_file.relative_to(_REPO_ROOT)}: {e}")
                 continue
 
-            if has_frontmatter(text):
-                skipped += 1
-                continue
-
+            rel = md_file.relative_to(_REPO_ROOT)
             topic = extract_title(text, md_file.name)
-            fm = build_frontmatter(topic)
+            fm = build_frontmatter(topic, repo_metadata(_REPO_ROOT).last_modified(rel.as_posix()))
             new_text = fm + text
 
-            rel = md_file.relative_to(_REPO_ROOT)
             if write:
                 md_file.write_text(new_text, encoding="utf-8")
                 print(f"  [MIGRATED] {rel} — topic: {topic!r}")
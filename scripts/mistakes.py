@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Find repeated mistakes across agents' memory/mistakes.md and the global mistakes file.
+
+Usage:
+    python scripts/mistakes.py                    # Clusters of near-duplicate mistakes
+    python scripts/mistakes.py --threshold 0.4    # Looser matching (estimated Jaccard similarity)
+    python scripts/mistakes.py miles sam --json   # Only these agents, machine-readable
+
+Entry formats:
+    memory/mistakes.md (templates/mistakes-template.md):
+        ## [SEVERITY] Title
+        **Date:** / **Project:** / **What happened:** / **Root cause:** / **Prevention:** ...
+    shared-knowledge/global-mistakes.md:
+        ### [BLAST_RADIUS] Title
+        - **Severity:** / **Description:** / **Prevention:** ...
+
+Each entry's title, what happened, root cause, description and prevention are
+reduced to word 3-shingles and a 64-value MinHash signature. Signatures are
+split into 16 bands of 4 (locality-sensitive hashing), so only entries sharing a
+band bucket are compared: near-linear instead of all pairs. Candidate pairs
+whose estimated similarity reaches --threshold are joined into clusters.
+
+A cluster of one agent's entries is a mistake that was repeated ("Never repeat
+the same one twice"); a cluster spanning several agents with no global entry is
+a candidate for shared-knowledge/global-mistakes.md.
+
+Parsed entries and signatures are cached in .agentsouls-cache/mistakes.json:
+files whose (mtime, size) did not change are not re-read, and only entries
+whose text is new are hashed.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import load_cache, save_cache, sha256_bytes, source_hash
+from manifest import ManifestError, load_manifest
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+MISTAKES_CACHE_NAME = "mistakes.json"
+GLOBAL_MISTAKES_PATH = "shared-knowledge/global-mistakes.md"
+GLOBAL_SLUG = "global"
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_WORDS = 3
+DEFAULT_THRESHOLD = 0.5
+
+MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+ENTRY_RE = re.compile(r"^(?P<level>#{2,3})\s+\[(?P<tag>[^\]]+)\]\s*(?P<title>.+?)\s*$")
+FIELD_RE = re.compile(r"^(?:-\s+)?\*\*(?P<name>[^*:]+):\*\*\s*(?P<value>.*?)\s*$")
+WORD_RE = re.compile(r"[a-z0-9_]+")
+
+# Fields that describe the mistake itself (dates, projects and impacts vary between repeats)
+SIGNATURE_FIELDS = ("what happened", "root cause", "description", "prevention")
+PLACEHOLDER_TAGS = {"SEVERITY", "{BLAST_RADIUS}"}
+
+# ---------------------------------------------------------------------------
+# Records and parsing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Mistake:
+    """One entry of a mistakes file."""
+
+    slug: str  # owning agent, or "global"
+    source: str  # repo-relative path
+    line: int  # 1-based line of the heading
+    tag: str  # severity ([MINOR] ...) or blast radius for global entries
+    title: str
+    fields: dict[str, str] = field(default_factory=dict)  # lowercase field name -> text
+    digest: str = ""  # hash of the signature text; keys the MinHash cache
+
+    def signature_text(self) -> str:
+        return " ".join([self.title] + [self.fields.get(name, "") for name in SIGNATURE_FIELDS])
+
+
+def parse_mistakes(text: str, slug: str, source: str) -> list[Mistake]:
+    """Parse the entries of a mistakes.md or global-mistakes.md file (templates are skipped)."""
+    entries: list[Mistake] = []
+    current: Mistake | None = None
+    last_field: str | None = None
+    for number, line in enumerate(text.splitlines(), 1):
+        heading = ENTRY_RE.match(line)
+        if heading or line.startswith("## "):
+            current = None
+            if heading and heading["tag"] not in PLACEHOLDER_TAGS:
+                current = Mistake(slug, source, number, heading["tag"].strip(), heading["title"])
+                entries.append(current)
+            last_field = None
+            continue
+        if current is None:
+            continue
+        match = FIELD_RE.match(line.strip())
+        if match:
+            last_field = match["name"].strip().lower()
+            current.fields[last_field] = match["value"]
+        elif last_field is not None and line.strip() and line.strip() != "---":
+            current.fields[last_field] += " " + line.strip()
+        else:
+            last_field = None
+    for entry in entries:
+        entry.digest = sha256_bytes(entry.signature_text().lower().encode("utf-8"))[:16]
+    return entries
+
+
+# ---------------------------------------------------------------------------
+# MinHash / LSH
+# ---------------------------------------------------------------------------
+
+
+def shingles(text: str) -> set[str]:
+    """Word 3-grams of the text (the words themselves if it is shorter)."""
+    words = [w for w in WORD_RE.findall(text.lower()) if len(w) > 2]
+    if len(words) < SHINGLE_WORDS:
+        return set(words)
+    return {" ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def minhash(items: set[str]) -> list[int]:
+    """NUM_PERM-value MinHash signature of a set of strings."""
+    if not items:
+        return [MERSENNE_PRIME] * NUM_PERM
+    hashes = [
+        int.from_bytes(hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "little")
+        for item in items
+    ]
+    return [min((a * x + b) % MERSENNE_PRIME for x in hashes) for a, b in PERMUTATIONS]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def near_duplicate_pairs(signatures: list[list[int]], threshold: float) -> list[tuple[int, int, float]]:
+    """(i, j, similarity) for signature pairs that share an LSH band and reach threshold."""
+    candidates: set[tuple[int, int]] = set()
+    for band in range(BANDS):
+        buckets: dict[tuple[int, ...], list[int]] = {}
+        for i, sig in enumerate(signatures):
+            if sig[0] != MERSENNE_PRIME:  # empty text never matches
+                buckets.setdefault(tuple(sig[band * ROWS:(band + 1) * ROWS]), []).append(i)
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    candidates.add((i, j))
+    pairs = []
+    for i, j in sorted(candidates):
+        score = similarity(signatures[i], signatures[j])
+        if score >= threshold:
+            pairs.append((i, j, score))
+    return pairs
+
+
+def clusters(count: int, pairs: list[tuple[int, int, float]]) -> list[list[int]]:
+    """Connected components (union-find) of the pairs, each sorted, largest first."""
+    parent = list(range(count))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    groups: dict[int, list[int]] = {}
+    for i in range(count):
+        groups.setdefault(find(i), []).append(i)
+    return sorted((g for g in groups.values() if len(g) > 1), key=lambda g: (-len(g), g[0]))
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class MistakeIndex:
+    """Parsed entries per file and MinHash signatures per entry text, persisted between runs."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.salt = source_hash(Path(__file__).resolve())
+        data = load_cache(repo_root, MISTAKES_CACHE_NAME)
+        fresh = data.get("salt") == self.salt
+        self._files: dict[str, dict] = data.get("files", {}) if fresh else {}
+        self._signatures: dict[str, list[int]] = data.get("signatures", {}) if fresh else {}
+        self._dirty = False
+        self.hashed = 0  # entries whose signature was computed this run
+
+    def entries(self, rel_path: str, slug: str) -> list[Mistake]:
+        """Entries of one file, re-parsed only if its (mtime, size) changed."""
+        path = self.repo_root / rel_path
+        try:
+            st = path.stat()
+        except OSError:
+            return []
+        stat_sig = [st.st_mtime_ns, st.st_size]
+        cached = self._files.get(rel_path)
+        if cached is not None and cached["stat"] == stat_sig and cached["slug"] == slug:
+            return [Mistake(**e) for e in cached["entries"]]
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return []
+        entries = parse_mistakes(text, slug, rel_path)
+        self._files[rel_path] = {"stat": stat_sig, "slug": slug, "entries": [asdict(e) for e in entries]}
+        self._dirty = True
+        return entries
+
+    def signature(self, entry: Mistake) -> list[int]:
+        sig = self._signatures.get(entry.digest)
+        if sig is None:
+            sig = self._signatures[entry.digest] = minhash(shingles(entry.signature_text()))
+            self.hashed += 1
+            self._dirty = True
+        return sig
+
+    def save(self, keep: set[str]) -> None:
+        """Persist the index, dropping files and signatures not seen in this run."""
+        files = {rel: f for rel, f in self._files.items() if rel in keep}
+        digests = {e["digest"] for f in files.values() for e in f["entries"]}
+        signatures = {d: s for d, s in self._signatures.items() if d in digests}
+        if self._dirty or len(files) != len(self._files) or len(signatures) != len(self._signatures):
+            save_cache(self.repo_root, MISTAKES_CACHE_NAME, {"salt": self.salt, "files": files, "signatures": signatures})
+            self._dirty = False
+
+
+def find_repeated_mistakes(
+    repo_root: Path, agents: list[dict], threshold: float = DEFAULT_THRESHOLD
+) -> tuple[list[Mistake], list[dict], int]:
+    """Return (entries, clusters, entries hashed this run).
+
+    Each cluster is {"entries": [positions], "agents": [slugs], "similarity":
+    lowest pairwise estimate that joined it, "global": bool, "promote": bool}.
+    """
+    index = MistakeIndex(repo_root)
+    sources = [(a["paths"]["mistakes"], a["slug"]) for a in agents] + [(GLOBAL_MISTAKES_PATH, GLOBAL_SLUG)]
+    entries = [e for rel, slug in sources for e in index.entries(rel, slug)]
+    signatures = [index.signature(e) for e in entries]
+    index.save({rel for rel, _ in sources})
+
+    pairs = near_duplicate_pairs(signatures, threshold)
+    lowest: dict[int, float] = {}
+    for i, j, score in pairs:
+        lowest[i] = min(lowest.get(i, 1.0), score)
+        lowest[j] = min(lowest.get(j, 1.0), score)
+
+    result = []
+    for members in clusters(len(entries), pairs):
+        slugs = sorted({entries[i].slug for i in members} - {GLOBAL_SLUG})
+        has_global = any(entries[i].slug == GLOBAL_SLUG for i in members)
+        result.append({
+            "entries": members,
+            "agents": slugs,
+            "similarity": round(min(lowest[i] for i in members), 3),
+            "global": has_global,
+            "promote": len(slugs) > 1 and not has_global,
+        })
+    return entries, result, index.hashed
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report near-duplicate mistakes across agents")
+    parser.add_argument("slugs", nargs="*", help="Agent slugs (default: every agent in the manifest)")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Minimum estimated Jaccard similarity of shingles (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--json", action="store_true", help="Print entries and clusters as JSON")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    agents = {a["slug"]: a for a in manifest["agents"]}
+    unknown = [s for s in args.slugs if s not in agents]
+    if unknown:
+        print(f"ERROR: unknown agent slug(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    selected = [agents[s] for s in (args.slugs or sorted(agents))]
+    entries, found, hashed = find_repeated_mistakes(repo_root, selected, args.threshold)
+
+    if args.json:
+        print(json.dumps({
+            "entries": [asdict(e) for e in entries],
+            "clusters": found,
+        }, indent=2))
+        return
+
+    for n, cluster in enumerate(found, 1):
+        kind = "repeated across agents" if len(cluster["agents"]) > 1 else "repeated"
+        print(f"Cluster {n}: {len(cluster['entries'])} entries, {kind} (similarity >= {cluster['similarity']})")
+        for i in cluster["entries"]:
+            e = entries[i]
+            print(f"  {e.slug:<12} [{e.tag}] {e.title}  ({e.source}:{e.line})")
+        if cluster["promote"]:
+            print(f"  -> candidate for {GLOBAL_MISTAKES_PATH}")
+        elif cluster["global"]:
+            print(f"  (already in {GLOBAL_MISTAKES_PATH})")
+    promote = sum(1 for c in found if c["promote"])
+    print(
+        f"{len(entries)} mistakes in {len(selected)} agents + global; {len(found)} clusters, "
+        f"{promote} promotion candidate(s); {hashed} new entries hashed"
+    )
+
+
+if __name__ == "__main__":
+    main()
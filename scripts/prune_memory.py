@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Apply the GENERAL_RULES.md "Memory Pruning" policy to every agent's session log.
+
+Usage:
+    python scripts/prune_memory.py                # Dry run (report only)
+    python scripts/prune_memory.py --write        # Prune logs that exceed the limit
+    python scripts/prune_memory.py miles --write  # Only the given agents
+    python scripts/prune_memory.py --write --jobs 0  # One process per CPU
+
+Policy (GENERAL_RULES.md, section "Memory Pruning"):
+    When memory/session-log.md holds more than 100 sessions, the 20 most recent
+    stay, the rest are appended to memory/session-log-archive.md, and
+    memory/long-term-summary.md gets one date-keyed line per archived day:
+        - **YYYY-MM-DD**: Brief outcome description. Key decision or discovery. [sessions: slug-YYYY-MM-DD-NNN through -NNN]
+
+Logs are processed as byte ranges found by a streaming header scan, so memory
+stays flat regardless of log size. The archive and summary are only appended
+to. Sessions already present in the archive (and summary lines already
+written) are skipped, so re-running, or resuming after an interrupted run, is
+a no-op. The pruned log replaces the original atomically.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from manifest import ManifestError, load_manifest
+from session_log import SessionRecord, iter_sessions, read_session
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+MAX_SESSIONS = 100  # prune when a log holds more than this many sessions
+KEEP_SESSIONS = 20  # most recent sessions left in the log
+
+ARCHIVE_NAME = "session-log-archive.md"
+SUMMARY_NAME = "long-term-summary.md"
+
+COPY_CHUNK = 1 << 20
+TASK_SUMMARY_CHARS = 80
+
+SUMMARY_SESSIONS_RE = re.compile(r"\[sessions: ([\w-]+)")
+
+ARCHIVE_HEADER = """# Session Log Archive — {name}
+
+> Sessions moved out of session-log.md by scripts/prune_memory.py. Appended in batches; newest first within a batch.
+
+---
+
+"""
+
+SUMMARY_HEADER = """# Long-Term Summary — {name}
+
+> Compressed, date-keyed summaries of archived sessions (full entries in session-log-archive.md).
+
+"""
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int) -> None:
+    src.seek(offset)
+    while length > 0:
+        chunk = src.read(min(COPY_CHUNK, length))
+        if not chunk:
+            break
+        dst.write(chunk)
+        length -= len(chunk)
+
+
+def _shorten(text: str, limit: int) -> str:
+    text = text.strip().rstrip(".")
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+def _first_bullet(record: SessionRecord, *sections: str) -> str:
+    for name in sections:
+        for line in record.sections.get(name, []):
+            bullet = line.lstrip("-* ").strip()
+            if line[:1] in "-*" and bullet:
+                return bullet
+    return ""
+
+
+def summary_line(records: list[SessionRecord]) -> str:
+    """Build the long-term-summary line for the sessions of one day (oldest first)."""
+    date = records[0].date
+    outcomes: dict[str, int] = {}
+    for r in records:
+        outcomes[r.outcome or "UNKNOWN"] = outcomes.get(r.outcome or "UNKNOWN", 0) + 1
+    outcome_text = ", ".join(f"{n} {o}" for o, n in sorted(outcomes.items()))
+    projects = sorted({r.project for r in records if r.project})
+    tasks = "; ".join(_shorten(r.task, TASK_SUMMARY_CHARS) for r in records if r.task)
+
+    description = f"{len(records)} session{'s' if len(records) != 1 else ''} ({outcome_text})"
+    if projects:
+        description += f" on {', '.join(projects)}"
+    if tasks:
+        description += f": {tasks}"
+    key = next(
+        (b for b in (_first_bullet(r, "Decisions Made", "What I Learned") for r in records) if b),
+        "",
+    )
+    key_text = f" {_shorten(key, 160)}." if key else ""
+
+    first, last = records[0].session_id, records[-1].session_id
+    span = first if first == last else f"{first} through -{last.rsplit('-', 1)[1]}"
+    return f"- **{date}**: {description}.{key_text} [sessions: {span}]"
+
+
+# ---------------------------------------------------------------------------
+# Pruning
+# ---------------------------------------------------------------------------
+
+
+def prune_log(
+    log_path: Path,
+    agent_name: str,
+    write: bool,
+    max_sessions: int = MAX_SESSIONS,
+    keep: int = KEEP_SESSIONS,
+) -> tuple[int, int, int]:
+    """Prune one session log. Returns (sessions, archived, summary lines added).
+
+    Without write, reports what would be done and changes nothing.
+    """
+    if not log_path.is_file():
+        return 0, 0, 0
+    headers = list(iter_sessions(log_path, headers_only=True))
+    if len(headers) <= max_sessions:
+        return len(headers), 0, 0
+
+    ranked = sorted(headers, key=lambda r: (r.date, r.seq), reverse=True)
+    kept_ids = {r.session_id for r in ranked[:keep]}
+    moved = [r for r in headers if r.session_id not in kept_ids]  # file order
+
+    archive_path = log_path.with_name(ARCHIVE_NAME)
+    summary_path = log_path.with_name(SUMMARY_NAME)
+    archived_ids = (
+        {r.session_id for r in iter_sessions(archive_path, headers_only=True)}
+        if archive_path.is_file()
+        else set()
+    )
+    summarized: set[str] = set()
+    if summary_path.is_file():
+        with open(summary_path, encoding="utf-8") as f:
+            for line in f:
+                summarized.update(SUMMARY_SESSIONS_RE.findall(line))
+
+    # Summary lines, one per day, oldest day first; only one day's records are held at a time
+    to_archive = [r for r in moved if r.session_id not in archived_ids]
+    lines: list[str] = []
+    day: list[SessionRecord] = []
+    for header in sorted(to_archive, key=lambda r: (r.date, r.seq)) + [None]:
+        if day and (header is None or header.date != day[0].date):
+            if day[0].session_id not in summarized:
+                lines.append(summary_line(day))
+            day = []
+        if header is not None:
+            record = read_session(log_path, header.offset, header.length)
+            if record is not None:
+                day.append(record)
+
+    if not write:
+        return len(headers), len(moved), len(lines)
+
+    if lines:
+        new_summary = not summary_path.is_file()
+        with open(summary_path, "a", encoding="utf-8", newline="\n") as f:
+            if new_summary:
+                f.write(SUMMARY_HEADER.format(name=agent_name))
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    with open(log_path, "rb") as src:
+        if to_archive:
+            new_archive = not archive_path.is_file()
+            with open(archive_path, "ab") as dst:
+                if new_archive:
+                    dst.write(ARCHIVE_HEADER.format(name=agent_name).encode("utf-8"))
+                for r in to_archive:
+                    _copy_range(src, dst, r.offset, r.length)
+                    if not _ends_with_newline(src, r):
+                        dst.write(b"\n")
+                dst.flush()
+                os.fsync(dst.fileno())
+
+        tmp_path = log_path.with_name(f".{log_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as dst:
+            pos = 0
+            for r in headers:
+                _copy_range(src, dst, pos, r.offset - pos)  # preamble / non-session content
+                if r.session_id in kept_ids:
+                    _copy_range(src, dst, r.offset, r.length)
+                pos = r.offset + r.length
+            _copy_range(src, dst, pos, log_path.stat().st_size - pos)
+            dst.flush()
+            os.fsync(dst.fileno())
+    os.replace(tmp_path, log_path)
+    return len(headers), len(moved), len(lines)
+
+
+def _ends_with_newline(src: BinaryIO, record: SessionRecord) -> bool:
+    if record.length == 0:
+        return True
+    src.seek(record.offset + record.length - 1)
+    return src.read(1) == b"\n"
+
+
+def _prune_agent(repo_root: Path, agent: dict, write: bool, max_sessions: int, keep: int):
+    log_path = repo_root / agent["paths"]["session_log"]
+    return agent["slug"], prune_log(log_path, agent["name"], write, max_sessions, keep)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Archive old session-log entries per GENERAL_RULES.md")
+    parser.add_argument("slugs", nargs="*", help="Agent slugs (default: every agent in the manifest)")
+    parser.add_argument("--write", action="store_true", help="Apply changes (default is a dry run)")
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="Prune N agents in parallel (0 = one per CPU; default: 1)",
+    )
+    parser.add_argument("--max", type=int, default=MAX_SESSIONS, help=f"Prune above this many sessions (default: {MAX_SESSIONS})")
+    parser.add_argument("--keep", type=int, default=KEEP_SESSIONS, help=f"Sessions to keep (default: {KEEP_SESSIONS})")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    agents = {a["slug"]: a for a in manifest["agents"]}
+    unknown = [s for s in args.slugs if s not in agents]
+    if unknown:
+        print(f"ERROR: unknown agent slug(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+    selected = [agents[s] for s in (args.slugs or sorted(agents))]
+
+    job_args = [(repo_root, a, args.write, args.max, args.keep) for a in selected]
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if jobs > 1 and len(job_args) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(job_args))) as pool:
+            results = list(pool.map(_prune_agent, *zip(*job_args)))
+    else:
+        results = [_prune_agent(*a) for a in job_args]
+
+    verb = "Archived" if args.write else "Would archive"
+    pruned = 0
+    for slug, (sessions, archived, lines) in results:
+        if archived:
+            pruned += 1
+            print(f"  {slug}: {verb.lower()} {archived} of {sessions} sessions, {lines} summary line(s)")
+    print(f"{verb} sessions for {pruned} of {len(results)} agents (limit {args.max}, keep {args.keep})")
+    if pruned and not args.write:
+        print("Run with --write to apply.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Last-modified dates of repository files, from one `git log` per commit.
+
+Usage:
+    python scripts/repo_metadata.py                          # HEAD and number of dated files
+    python scripts/repo_metadata.py agents/aerospace/miles   # Dates of the files under a path
+
+A file's last-modified date is the committer date (YYYY-MM-DD) of the most
+recent commit that touched it. All dates come from a single
+`git log --name-only` over the whole history, parsed newest first, and are
+cached in .agentsouls-cache/repo-metadata.json keyed by the HEAD commit. HEAD is
+read from .git/ directly, so a run at an unchanged HEAD starts no process at all.
+
+Unlike file mtimes, these dates are the same in every checkout of a commit, so
+output built from them (migrated frontmatter, staleness reports) does not
+drift with checkout time. Files with no commit (new or
+outside a git repository) have no date; callers decide the fallback.
+
+Requirements: Python 3.10+, git on PATH (optional: without it no file has a date).
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import load_cache, save_cache
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+METADATA_CACHE_NAME = "repo-metadata.json"
+COMMIT_MARKER = "\x01"  # starts the header line of each commit in the log output
+
+GIT_LOG_ARGS = [
+    "-c", "core.quotepath=off",
+    "log", "--relative", "--no-renames", "--name-only", "--date=short",
+    f"--format={COMMIT_MARKER}%H %cd",
+]
+
+# ---------------------------------------------------------------------------
+# HEAD
+# ---------------------------------------------------------------------------
+
+
+def _git_dir(repo_root: Path) -> Path | None:
+    dot_git = repo_root / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    try:
+        line = dot_git.read_text(encoding="utf-8").strip()  # worktrees and submodules: "gitdir: <path>"
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    return (repo_root / line[len("gitdir:"):].strip()).resolve()
+
+
+def read_head(repo_root: Path) -> str | None:
+    """The commit hash HEAD points to, read from .git/ without running git; None if unknown."""
+    git_dir = _git_dir(repo_root)
+    if git_dir is None:
+        return None
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if not head.startswith("ref:"):
+        return head or None
+    ref = head[len("ref:"):].strip()
+    # Linked worktrees keep their refs in the common directory
+    common = git_dir
+    try:
+        common = (git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()).resolve()
+    except OSError:
+        pass
+    for base in dict.fromkeys([git_dir, common]):
+        try:
+            return (base / ref).read_text(encoding="utf-8").strip() or None
+        except OSError:
+            pass
+        try:
+            with open(base / "packed-refs", encoding="utf-8") as f:
+                for line in f:
+                    if line.endswith(f" {ref}\n"):
+                        return line.split(" ", 1)[0]
+        except OSError:
+            pass
+    return None  # unborn branch
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+def parse_git_log(output: str) -> tuple[str | None, dict[str, str]]:
+    """(newest commit hash, path -> date of the newest commit touching it) from GIT_LOG_ARGS output."""
+    newest: str | None = None
+    dates: dict[str, str] = {}
+    current = ""
+    for line in output.splitlines():
+        if line.startswith(COMMIT_MARKER):
+            commit, _, current = line[1:].partition(" ")
+            newest = newest or commit
+        elif line:
+            dates.setdefault(line, current)
+    return newest, dates
+
+
+class RepoMetadata:
+    """Per-file last-modified dates as of one commit."""
+
+    def __init__(self, head: str | None, dates: dict[str, str]) -> None:
+        self.head = head
+        self.dates = dates
+        self.git_runs = 0  # git invocations made to build this store (0 on a cache hit)
+
+    @classmethod
+    def load(cls, repo_root: Path, use_cache: bool = True) -> RepoMetadata:
+        """The dates at the current HEAD: from the cache if HEAD is unchanged, else one git log."""
+        head = read_head(repo_root)
+        if use_cache and head is not None:
+            data = load_cache(repo_root, METADATA_CACHE_NAME)
+            if data.get("head") == head:
+                return cls(head, data.get("dates", {}))
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(repo_root), *GIT_LOG_ARGS],
+                capture_output=True, text=True, encoding="utf-8", errors="replace", check=False,
+            )
+        except OSError:  # git not installed
+            return cls(None, {})
+        newest, dates = parse_git_log(result.stdout) if result.returncode == 0 else (None, {})
+        store = cls(head or newest, dates)
+        store.git_runs = 1
+        if use_cache and store.head is not None:
+            try:
+                save_cache(repo_root, METADATA_CACHE_NAME, {"head": store.head, "dates": dates})
+            except OSError:
+                pass  # the cache only saves work
+        return store
+
+    def last_modified(self, rel_path: str) -> str | None:
+        """YYYY-MM-DD of the last commit touching a repo-relative path, or None if it has none."""
+        return self.dates.get(rel_path.replace("\\", "/").removeprefix("./"))
+
+
+_stores: dict[Path, RepoMetadata] = {}
+
+
+def repo_metadata(repo_root: Path) -> RepoMetadata:
+    """The RepoMetadata of a repository, loaded once per process."""
+    key = repo_root.resolve()
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = RepoMetadata.load(key)
+    return store
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Show the git-derived last-modified dates of repository files")
+    parser.add_argument("paths", nargs="*", help="Repo-relative files or directories to list")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    store = RepoMetadata.load(repo_root)
+    if store.head is None:
+        print("ERROR: not a git checkout (or git is not installed); no dates available", file=sys.stderr)
+        sys.exit(1)
+    if not args.paths:
+        source = "git log" if store.git_runs else "cache"
+        print(f"HEAD {store.head}: {len(store.dates)} files dated (from {source})")
+        return
+    prefixes = [p.rstrip("/") for p in args.paths]
+    for rel in sorted(store.dates):
+        if any(rel == p or rel.startswith(p + "/") for p in prefixes):
+            print(f"  {store.dates[rel]}  {rel}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Route a task to agents by capability, tag, domain or model.
+
+Usage:
+    python scripts/route.py python pandas               # Agents with both (capability or tag)
+    python scripts/route.py capability:ros domain:aerospace --limit 3
+    python scripts/route.py tag:lead model:opus --json
+
+Terms:
+    capability:X, tag:X, domain:X and model:X match that field exactly
+    (case-insensitive); a bare X matches a capability or a tag.
+
+Index (.agents/routing-index.json, written by generate-tool-configs.py):
+    Agents are numbered in roster order (sort_agents) and every term maps to a
+    bitset (hex integer) of the agents that have it. Agents with every
+    requested term are the AND of the term bitsets and are ranked in roster
+    order; if fewer than --limit match, agents with some of the terms follow,
+    ranked by the IDF-weighted share of terms they match. The index is an
+    ordinary generated output, so it is only rewritten when the manifest
+    changes. Without it, route.py builds the same index from the manifest.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from manifest import ManifestError, load_manifest
+from templates import sort_agents
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+ROUTING_INDEX_PATH = ".agents/routing-index.json"
+ROUTING_INDEX_FORMAT = 1
+
+FIELDS = {"capability": "capabilities", "tag": "tags", "domain": "domain", "model": "model"}
+BARE_TERM_FIELDS = ("capability", "tag")
+
+DEFAULT_LIMIT = 10
+MAX_SUBSET_TERMS = 7  # queries up to this long rank partial matches by term subset
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class Match(NamedTuple):
+    slug: str
+    score: float  # IDF-weighted share of the requested terms matched (1.0 = all)
+    matched: list[str]
+    missing: list[str]
+
+
+def _values(agent: dict, field: str) -> list[str]:
+    value = agent.get(FIELDS[field])
+    values = value if isinstance(value, list) else [value] if value is not None else []
+    return [str(v).strip().lower() for v in values if str(v).strip()]
+
+
+def build_routing_index(agents: list[dict], schema_version: str) -> dict:
+    """Inverted index term -> bitset of agent positions (agents in the given order)."""
+    bits: dict[str, int] = {}
+    for position, agent in enumerate(agents):
+        bit = 1 << position
+        for field in FIELDS:
+            for value in _values(agent, field):
+                key = f"{field}:{value}"
+                bits[key] = bits.get(key, 0) | bit
+    return {
+        "_generated": "AUTO-GENERATED from agents/manifest.json by generate-tool-configs.py — DO NOT EDIT MANUALLY",
+        "format": ROUTING_INDEX_FORMAT,
+        "schema_version": schema_version,
+        "agents": [a["slug"] for a in agents],
+        "terms": {key: format(bits[key], "x") for key in sorted(bits)},
+    }
+
+
+def render_routing_index(agents: list[dict], schema_version: str) -> str:
+    """Render .agents/routing-index.json for agents in roster order."""
+    return json.dumps(build_routing_index(agents, schema_version), indent=1, ensure_ascii=False) + "\n"
+
+
+def _positions(bits: int):
+    """Set bit positions of bits, lowest first."""
+    digits = format(bits, "b")[::-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+
+class RoutingIndex:
+    """Term bitsets decoded once; route() is a handful of big-integer operations."""
+
+    def __init__(self, data: dict) -> None:
+        self.agents: list[str] = data["agents"]
+        self.bits: dict[str, int] = {key: int(value, 16) for key, value in data["terms"].items()}
+
+    @classmethod
+    def load(cls, repo_root: Path) -> RoutingIndex:
+        """Read the generated index, or build it from the manifest when it is missing or unreadable."""
+        try:
+            data = json.loads((repo_root / ROUTING_INDEX_PATH).read_text(encoding="utf-8"))
+            if data.get("format") == ROUTING_INDEX_FORMAT:
+                return cls(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        manifest = load_manifest(repo_root)
+        return cls(build_routing_index(sort_agents(manifest["agents"]), manifest["schema_version"]))
+
+    def term_bits(self, term: str) -> int:
+        """Bitset of the agents matching one query term."""
+        term = term.strip().lower()
+        field, sep, _ = term.partition(":")
+        if sep and field in FIELDS:
+            return self.bits.get(term, 0)
+        bits = 0
+        for field in BARE_TERM_FIELDS:
+            bits |= self.bits.get(f"{field}:{term}", 0)
+        return bits
+
+    def route(self, terms: list[str], limit: int = DEFAULT_LIMIT) -> list[Match]:
+        """Agents ranked for the required terms: full matches first, then partial ones."""
+        terms = list(dict.fromkeys(t.strip().lower() for t in terms if t.strip()))
+        if not terms or limit <= 0:
+            return []
+        term_bits = [self.term_bits(t) for t in terms]
+        n = len(self.agents)
+        weights = [math.log(1 + n / max(b.bit_count(), 1)) for b in term_bits]  # unknown terms weigh most
+        total = sum(weights)
+
+        full = -1
+        for b in term_bits:
+            full &= b
+        matches = []
+        for position in _positions(full):
+            matches.append(Match(self.agents[position], 1.0, terms, []))
+            if len(matches) == limit:
+                return matches
+
+        for score, group in self._partial_groups(term_bits, weights, full):
+            for position in _positions(group):
+                matched = [t for t, b in zip(terms, term_bits) if b >> position & 1]
+                missing = [t for t in terms if t not in matched]
+                matches.append(Match(self.agents[position], round(score / total, 3), matched, missing))
+                if len(matches) == limit:
+                    return matches
+        return matches
+
+    @staticmethod
+    def _partial_groups(term_bits: list[int], weights: list[float], full: int):
+        """Yield (score, bitset) of agents matching some but not all terms, best score first.
+
+        With up to MAX_SUBSET_TERMS terms, each group is the agents matching exactly
+        one subset of the terms (a few bitset operations per subset), so the
+        caller stops as soon as it has enough agents. Longer queries score
+        agents one by one.
+        """
+        k = len(term_bits)
+        if k > MAX_SUBSET_TERMS:
+            partial: dict[int, float] = {}
+            for b, weight in zip(term_bits, weights):
+                for position in _positions(b & ~full):
+                    partial[position] = partial.get(position, 0.0) + weight
+            by_score: dict[float, int] = {}
+            for position, score in partial.items():
+                by_score[score] = by_score.get(score, 0) | 1 << position
+        else:
+            by_score = {}
+            for mask in range(1, (1 << k) - 1):
+                score = sum(w for i, w in enumerate(weights) if mask >> i & 1)
+                group = -1
+                for i, b in enumerate(term_bits):
+                    group &= b if mask >> i & 1 else ~b
+                if group:
+                    by_score[score] = by_score.get(score, 0) | group
+        for score in sorted(by_score, reverse=True):
+            yield score, by_score[score]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rank agents for a set of required capabilities/tags")
+    parser.add_argument("terms", nargs="+", help="Required terms (X, capability:X, tag:X, domain:X, model:X)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Maximum agents to list (default: {DEFAULT_LIMIT})")
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON")
+    args = parser.parse_args()
+
+    try:
+        index = RoutingIndex.load(_SCRIPT_DIR.parent)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    matches = index.route(args.terms, args.limit)
+
+    if args.json:
+        print(json.dumps([m._asdict() for m in matches], indent=2))
+        return
+    if not matches:
+        print("No agent matches any of the terms")
+        sys.exit(1)
+    for m in matches:
+        note = f" (missing: {', '.join(m.missing)})" if m.missing else ""
+        print(f"  {m.score:5.3f}  {m.slug}{note}")
+
+
+if __name__ == "__main__":
+    main()
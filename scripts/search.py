@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""Full-text search over every agent's cheatsheets (BM25 over an on-disk inverted index).
+
+Usage:
+    python scripts/search.py "stability derivatives"            # Ranked cheatsheets, all agents
+    python scripts/search.py "unit conversion" --agent miles     # One agent's cheatsheets
+    python scripts/search.py "roll damping" --limit 5 --json     # Machine-readable output
+    python scripts/search.py --build                             # Update the index (changed files only)
+    python scripts/search.py --build --rebuild --jobs 0          # Rebuild from scratch, one process per CPU
+
+Index layout (.agentsouls-cache/search/):
+    meta.json                  document table (path, agent, mtime, size, length, topic), segment list
+                               and the unreadable cheatsheets with their (agent, mtime, size)
+    seg-NNNNNN/postings.bin    per-term postings: zlib(doc id deltas as uint32 + term frequencies as uint16)
+    seg-NNNNNN/lex-SS.json     term -> [offset, bytes, doc count], one file per term-hash shard
+
+Each cheatsheet is tokenized from its frontmatter fields, headings and body
+(topic weighted x3, headings x2). --build stats every cheatsheet and only
+re-tokenizes new or changed files: they get fresh document ids in a new small
+segment and their old ids are dropped from the document table. Segments are
+immutable; when too many accumulate (MAX_SMALL_SEGMENTS incremental ones, or
+MAX_SEGMENTS in total) they are merged shard by shard, dropping removed
+documents; a merge of every segment also renumbers document ids, so replaced
+and removed documents leave the document table. Memory stays bounded by one shard. A query loads the document table plus one
+lexicon shard per query term and decodes only those terms' postings.
+validate.py warns when the index no longer matches the cheatsheets on disk.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import accumulate
+from operator import sub
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import CACHE_DIR_NAME, load_cache, save_cache
+from frontmatter import parse_frontmatter
+from manifest import ManifestError, load_manifest
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+INDEX_DIR = "search"
+META_NAME = f"{INDEX_DIR}/meta.json"
+INDEX_VERSION = 1  # bump when tokenization or layout changes
+
+SHARD_COUNT = 64
+SEGMENT_DOCS = 5000  # documents per segment written during a build
+MAX_SMALL_SEGMENTS = 8  # merge incremental (smaller) segments beyond this
+MAX_SEGMENTS = 16  # merge everything beyond this
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+TOPIC_WEIGHT = 3
+HEADING_WEIGHT = 2
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+HEADING_RE = re.compile(r"^#{1,6}[ \t]+(.*)$", re.MULTILINE)
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+# ---------------------------------------------------------------------------
+# Tokenization
+# ---------------------------------------------------------------------------
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric tokens of two or more characters, minus stopwords."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def document_terms(text: str) -> tuple[dict[str, int], int, str]:
+    """Return (weighted term frequencies, document length, topic) for one cheatsheet."""
+    fm = parse_frontmatter(text) or {}
+    body = text
+    if fm and text.startswith("---"):
+        end = text.find("\n---", 3)
+        if end != -1:
+            body = text[end + 4:]
+
+    counts = Counter(TOKEN_RE.findall(body.lower()))
+    for heading in HEADING_RE.findall(body):
+        for token in TOKEN_RE.findall(heading.lower()):
+            counts[token] += HEADING_WEIGHT - 1
+    topic = fm.get("topic", "")
+    for key, value in fm.items():
+        weight = TOPIC_WEIGHT if key == "topic" else 1
+        if isinstance(value, list):
+            value = " ".join(value)
+        for token in TOKEN_RE.findall(value.lower()):
+            counts[token] += weight
+
+    tf = {t: n if n <= 0xFFFF else 0xFFFF for t, n in counts.items() if len(t) > 1 and t not in STOPWORDS}
+    return tf, sum(tf.values()), topic
+
+
+def _tokenize_file(repo_root: Path, rel_path: str) -> tuple[dict[str, int], int, str] | None:
+    try:
+        text = (repo_root / rel_path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    return document_terms(text)
+
+
+def shard_of(term: str) -> int:
+    return zlib.crc32(term.encode("utf-8")) % SHARD_COUNT
+
+
+def _encode(ids: array, tfs: array) -> bytes:
+    deltas = array("I", map(sub, ids, array("I", [0]) + ids[:-1]))
+    return zlib.compress(deltas.tobytes() + tfs.tobytes(), 1)
+
+
+def _decode(blob: bytes, df: int) -> tuple[list[int], array]:
+    raw = zlib.decompress(blob)
+    deltas = array("I")
+    deltas.frombytes(raw[: 4 * df])
+    tfs = array("H")
+    tfs.frombytes(raw[4 * df:])
+    return list(accumulate(deltas)), tfs
+
+
+# ---------------------------------------------------------------------------
+# Cheatsheet discovery
+# ---------------------------------------------------------------------------
+
+
+def scan_cheatsheets(repo_root: Path, manifest: dict, snapshot=None) -> dict[str, tuple[str, int, int]]:
+    """Map each cheatsheet (repo-relative path) to (agent slug, mtime_ns, size)."""
+    found: dict[str, tuple[str, int, int]] = {}
+    for agent in manifest["agents"]:
+        cs_rel = agent.get("paths", {}).get("cheatsheets", "").rstrip("/")
+        if not cs_rel:
+            continue
+        if snapshot is not None:
+            for entry in snapshot.list_dir(cs_rel, ".md"):
+                if entry.name != "_index.md":
+                    found[entry.rel] = (agent["slug"], entry.mtime_ns, entry.size)
+            continue
+        try:
+            with os.scandir(repo_root / cs_rel) as it:
+                for de in it:
+                    if de.name.endswith(".md") and de.name != "_index.md" and de.is_file():
+                        st = de.stat()
+                        found[f"{cs_rel}/{de.name}"] = (agent["slug"], st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Segments
+# ---------------------------------------------------------------------------
+
+
+class _Segment:
+    """One immutable segment directory: a postings file plus per-shard lexicons."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lexicons: dict[int, dict[str, list[int]]] = {}
+
+    def lexicon(self, shard: int) -> dict[str, list[int]]:
+        if shard not in self._lexicons:
+            try:
+                self._lexicons[shard] = json.loads((self.path / f"lex-{shard:02d}.json").read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._lexicons[shard] = {}
+        return self._lexicons[shard]
+
+    def postings(self, term: str, f=None) -> tuple[list[int], array] | None:
+        entry = self.lexicon(shard_of(term)).get(term)
+        if entry is None:
+            return None
+        offset, length, df = entry
+        if f is None:
+            with open(self.path / "postings.bin", "rb") as fh:
+                fh.seek(offset)
+                return _decode(fh.read(length), df)
+        f.seek(offset)
+        return _decode(f.read(length), df)
+
+
+def _write_segment(path: Path, postings: dict[str, tuple[array, array]]) -> None:
+    """Write postings grouped by shard (so a shard is one contiguous region) and the lexicons."""
+    shards: dict[int, dict[str, tuple[array, array]]] = {}
+    for term, entry in postings.items():
+        shards.setdefault(shard_of(term), {})[term] = entry
+    path.mkdir(parents=True, exist_ok=True)
+    with open(path / "postings.bin", "wb") as f:
+        for shard in sorted(shards):
+            lexicon: dict[str, list[int]] = {}
+            for term in sorted(shards[shard]):
+                ids, tfs = shards[shard][term]
+                blob = _encode(ids, tfs)
+                lexicon[term] = [f.tell(), len(blob), len(ids)]
+                f.write(blob)
+            (path / f"lex-{shard:02d}.json").write_text(json.dumps(lexicon, separators=(",", ":")), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class SearchIndex:
+    """The on-disk inverted index: document table plus immutable postings segments."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.dir = repo_root / CACHE_DIR_NAME / INDEX_DIR
+        meta = load_cache(repo_root, META_NAME)
+        if meta.get("version") != INDEX_VERSION:
+            meta = {}
+        self.exists = bool(meta)
+        # docs[i] = [path, slug, mtime_ns, size, length, topic], or None once removed/replaced
+        self.docs: list[list | None] = meta.get("docs", [])
+        # Cheatsheets that could not be read: path -> [slug, mtime_ns, size], retried once they change
+        self.unreadable: dict[str, list] = meta.get("unreadable", {})
+        self.total_length: int = meta.get("total_length", 0)
+        self.segments: list[list] = meta.get("segments", [])  # [name, documents written]
+        self.next_segment: int = meta.get("next_segment", 0)
+        self._segments: dict[str, _Segment] = {}
+
+    @property
+    def live_count(self) -> int:
+        return sum(1 for d in self.docs if d is not None)
+
+    def _segment(self, name: str) -> _Segment:
+        if name not in self._segments:
+            self._segments[name] = _Segment(self.dir / name)
+        return self._segments[name]
+
+    def _new_segment_name(self) -> str:
+        name = f"seg-{self.next_segment:06d}"
+        self.next_segment += 1
+        return name
+
+    def stale(self, current: dict[str, tuple[str, int, int]]) -> list[str]:
+        """Paths whose indexed (agent, mtime, size) differs from current (added, changed or removed)."""
+        indexed = {d[0]: (d[1], d[2], d[3]) for d in self.docs if d is not None}
+        indexed.update((rel, tuple(sig)) for rel, sig in self.unreadable.items())
+        changed = [rel for rel, sig in current.items() if indexed.get(rel) != sig]
+        removed = [rel for rel in indexed if rel not in current]
+        return sorted(changed + removed)
+
+    # -- building -------------------------------------------------------------
+
+    def update(self, current: dict[str, tuple[str, int, int]], rebuild: bool = False, jobs: int = 1) -> tuple[int, int]:
+        """Bring the index in line with current. Returns (documents indexed, documents removed)."""
+        if rebuild or not self.exists:
+            self.docs, self.total_length, self.segments, self.unreadable = [], 0, [], {}
+
+        by_path = {d[0]: i for i, d in enumerate(self.docs) if d is not None}
+        stale = self.stale(current)
+        removed = 0
+        for rel in stale:
+            self.unreadable.pop(rel, None)
+            doc_id = by_path.get(rel)
+            if doc_id is not None:
+                self.total_length -= self.docs[doc_id][4]
+                self.docs[doc_id] = None
+            if rel not in current:
+                removed += 1
+        to_index = [rel for rel in stale if rel in current]
+
+        executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(to_index) > 1 else None
+        try:
+            tokenize_one = partial(_tokenize_file, self.repo_root)
+            for start in range(0, len(to_index), SEGMENT_DOCS):
+                batch = to_index[start:start + SEGMENT_DOCS]
+                results = executor.map(tokenize_one, batch, chunksize=64) if executor else map(tokenize_one, batch)
+                postings: dict[str, tuple[array, array]] = {}
+                for rel, result in zip(batch, results):
+                    slug, mtime_ns, size = current[rel]
+                    if result is None:
+                        self.unreadable[rel] = [slug, mtime_ns, size]  # not reported stale until it changes
+                        continue
+                    tf, length, topic = result
+                    doc_id = len(self.docs)
+                    self.docs.append([rel, slug, mtime_ns, size, length, topic])
+                    self.total_length += length
+                    for term, count in tf.items():
+                        entry = postings.get(term)
+                        if entry is None:
+                            entry = postings[term] = (array("I"), array("H"))
+                        entry[0].append(doc_id)
+                        entry[1].append(count)
+                if postings:
+                    name = self._new_segment_name()
+                    _write_segment(self.dir / name, postings)
+                    self.segments.append([name, len(batch)])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        small = [seg for seg in self.segments if seg[1] < SEGMENT_DOCS]
+        if len(small) > MAX_SMALL_SEGMENTS:
+            self._merge(small)
+        if len(self.segments) > MAX_SEGMENTS:
+            self._merge(list(self.segments))
+        self._save()
+        return len(to_index), removed
+
+    def _merge(self, merging: list[list]) -> None:
+        """Merge the given segments into one, dropping postings of removed documents.
+
+        When every segment is merged, document ids are renumbered to drop the
+        removed entries from the document table (ids stay in ascending order).
+        """
+        name = self._new_segment_name()
+        path = self.dir / name
+        path.mkdir(parents=True, exist_ok=True)
+        live = self.docs
+        any_removed = any(d is None for d in live)
+        renumber = any_removed and len(merging) == len(self.segments)
+        new_id: list[int] = []
+        if renumber:
+            next_id = 0
+            for doc in live:
+                new_id.append(next_id)
+                next_id += doc is not None
+        segments = [self._segment(seg[0]) for seg in merging]
+        handles = [open(s.path / "postings.bin", "rb") for s in segments]
+        try:
+            with open(path / "postings.bin", "wb") as out:
+                for shard in range(SHARD_COUNT):
+                    terms = sorted({t for s in segments for t in s.lexicon(shard)})
+                    lexicon: dict[str, list[int]] = {}
+                    for term in terms:
+                        ids, tfs = array("I"), array("H")
+                        for segment, handle in zip(segments, handles):
+                            found = segment.postings(term, handle)
+                            if found is None:
+                                continue
+                            if not any_removed:
+                                ids.extend(found[0])
+                                tfs.extend(found[1])
+                                continue
+                            for doc_id, tf in zip(*found):
+                                if live[doc_id] is not None:
+                                    ids.append(new_id[doc_id] if renumber else doc_id)
+                                    tfs.append(tf)
+                        if ids:
+                            blob = _encode(ids, tfs)
+                            lexicon[term] = [out.tell(), len(blob), len(ids)]
+                            out.write(blob)
+                    if lexicon:
+                        (path / f"lex-{shard:02d}.json").write_text(
+                            json.dumps(lexicon, separators=(",", ":")), encoding="utf-8"
+                        )
+        finally:
+            for handle in handles:
+                handle.close()
+        # The merged segment takes the place of the first one merged (segment order = doc id order)
+        merged_names = {seg[0] for seg in merging}
+        position = next(i for i, seg in enumerate(self.segments) if seg[0] in merged_names)
+        kept = [seg for seg in self.segments if seg[0] not in merged_names]
+        if renumber:
+            self.docs = [doc for doc in live if doc is not None]
+        kept.insert(position, [name, len(self.docs) if renumber else sum(seg[1] for seg in merging)])
+        self.segments = kept
+        self._segments = {k: v for k, v in self._segments.items() if k not in merged_names}
+
+    def _save(self) -> None:
+        save_cache(self.repo_root, META_NAME, {
+            "version": INDEX_VERSION,
+            "docs": self.docs,
+            "unreadable": self.unreadable,
+            "total_length": self.total_length,
+            "segments": self.segments,
+            "next_segment": self.next_segment,
+        })
+        self.exists = True
+        # Segments no longer referenced (merged away, or left by an interrupted build)
+        keep = {seg[0] for seg in self.segments}
+        for child in self.dir.iterdir():
+            if child.is_dir() and child.name.startswith("seg-") and child.name not in keep:
+                shutil.rmtree(child, ignore_errors=True)
+
+    # -- querying ---------------------------------------------------------------
+
+    def search(self, query: str, agent: str | None = None, limit: int = 10) -> list[tuple[float, list]]:
+        """BM25-ranked (score, doc) pairs for a query, optionally limited to one agent."""
+        n = self.live_count
+        if n == 0:
+            return []
+        avg_length = self.total_length / n or 1.0
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            matches: list[tuple[int, int]] = []
+            for name, _ in self.segments:
+                found = self._segment(name).postings(term)
+                if found is not None:
+                    matches.extend((d, tf) for d, tf in zip(*found) if self.docs[d] is not None)
+            if not matches:
+                continue
+            idf = math.log(1 + (n - len(matches) + 0.5) / (len(matches) + 0.5))
+            for doc_id, tf in matches:
+                doc = self.docs[doc_id]
+                if agent is not None and doc[1] != agent:
+                    continue
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * doc[4] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], self.docs[item[0]][0]))
+        return [(score, self.docs[doc_id]) for doc_id, score in ranked]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search cheatsheets across agents (BM25)")
+    parser.add_argument("query", nargs="*", help="Search terms")
+    parser.add_argument("--agent", metavar="SLUG", help="Only search this agent's cheatsheets")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--build", action="store_true", help="Update the index for changed cheatsheets")
+    parser.add_argument("--rebuild", action="store_true", help="With --build, rebuild the index from scratch")
+    parser.add_argument(
+        "--jobs", type=int, default=1, metavar="N",
+        help="Tokenize in N worker processes while building (0 = one per CPU; default: 1)",
+    )
+    args = parser.parse_args()
+    if not args.query and not args.build:
+        parser.error("a query or --build is required")
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.agent and args.agent not in {a["slug"] for a in manifest["agents"]}:
+        print(f"ERROR: unknown agent slug: {args.agent}", file=sys.stderr)
+        sys.exit(1)
+
+    index = SearchIndex(repo_root)
+    if args.build or not index.exists:
+        started = time.perf_counter()
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        indexed, removed = index.update(scan_cheatsheets(repo_root, manifest), rebuild=args.rebuild, jobs=jobs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"Search index: {index.live_count} cheatsheets ({indexed} indexed, {removed} removed, "
+            f"{len(index.segments)} segment(s)) in {elapsed_ms:.0f} ms",
+            file=sys.stderr if args.query else sys.stdout,
+        )
+    if not args.query:
+        return
+
+    results = index.search(" ".join(args.query), agent=args.agent, limit=args.limit)
+    if args.json:
+        print(json.dumps(
+            [{"path": d[0], "agent": d[1], "topic": d[5], "score": round(s, 4)} for s, d in results],
+            indent=2,
+        ))
+        return
+    if not results:
+        print("No matches.")
+    for score, doc in results:
+        topic = f" — {doc[5]}" if doc[5] else ""
+        print(f"{score:7.3f}  {doc[0]} [{doc[1]}]{topic}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Pick the cheatsheets an agent should load for a task (step 5 of the loading sequence).
+
+Usage:
+    python scripts/select_cheatsheets.py miles "pitch damping sign for the x-tail"
+    python scripts/select_cheatsheets.py miles "unit conversion" --top-k 2 --budget 16000
+    python scripts/select_cheatsheets.py sam "flaky pytest fixtures" --json
+
+Prints the repo-relative paths of the best-matching cheatsheets, best first,
+at most --top-k of them and at most --budget bytes in total (a cheatsheet that
+does not fit is skipped in favour of the next smaller one).
+
+Scoring:
+    Each cheatsheet is reduced once to a term vector: search.py's weighted
+    term frequencies (topic x3, headings x2, body and other frontmatter x1),
+    log-scaled and L2-normalized. A task is scored against a cheatsheet as the
+    dot product of the task's IDF-weighted terms (IDF over the agent's own
+    cheatsheets) with that vector, then multiplied by a confidence factor (VERIFIED > TEXTBOOK >
+    DERIVED > UNCERTAIN) and a recency factor that halves the last_updated
+    bonus every RECENCY_HALF_LIFE_DAYS. Cheatsheets sharing no term with the
+    task are never selected.
+
+Vectors are kept per agent in .agentsouls-cache/cheatsheets/{slug}.json keyed
+by each file's (mtime, size): a selection lists the cheatsheets directory and
+stats each file, but only new or changed cheatsheets are read and tokenized.
+Summon bundles (bundles.py) rank with the same vectors, using the agent's
+profile as the task.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import load_cache, save_cache, source_hash
+from frontmatter import parse_frontmatter
+from manifest import ManifestError, load_manifest
+from search import document_terms, tokenize
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+VECTORS_CACHE_DIR = "cheatsheets"  # under .agentsouls-cache/, one file per agent
+
+DEFAULT_TOP_K = 3
+DEFAULT_BUDGET_BYTES = 24000  # ~6000 tokens at ~4 characters per token
+
+CONFIDENCE_FACTOR = {"VERIFIED": 1.0, "TEXTBOOK": 0.9, "DERIVED": 0.8, "UNCERTAIN": 0.6}
+UNKNOWN_CONFIDENCE_FACTOR = 0.7
+RECENCY_HALF_LIFE_DAYS = 180
+RECENCY_WEIGHT = 0.25  # share of the score that depends on last_updated
+
+# ---------------------------------------------------------------------------
+# Term vectors
+# ---------------------------------------------------------------------------
+
+
+class Selection(NamedTuple):
+    rel_path: str
+    score: float  # relevance x confidence x recency
+    relevance: float
+    size: int  # bytes
+
+
+def cheatsheet_vector(text: str) -> dict:
+    """Normalized term vector and ranking metadata of one cheatsheet."""
+    fm = parse_frontmatter(text) or {}
+    tf, _, _ = document_terms(text)
+    vector = {term: 1.0 + math.log(count) for term, count in tf.items()}
+    norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+    return {
+        "confidence": str(fm.get("confidence", "")).strip("[]").upper(),  # [VERIFIED] as in GENERAL_RULES.md
+        "last_updated": str(fm.get("last_updated", "")),
+        "terms": {term: round(w / norm, 5) for term, w in vector.items()},
+    }
+
+
+class CheatsheetVectors:
+    """One agent's cheatsheet vectors, refreshed for changed files only and persisted."""
+
+    def __init__(self, repo_root: Path, agent: dict) -> None:
+        self.repo_root = repo_root
+        self.cheatsheets_dir = agent["paths"]["cheatsheets"].rstrip("/")
+        self.cache_name = f"{VECTORS_CACHE_DIR}/{agent['slug']}.json"
+        self.salt = source_hash(  # code, tokenizer and frontmatter parser
+            Path(__file__).resolve(), _SCRIPT_DIR / "search.py", _SCRIPT_DIR / "frontmatter.py"
+        )
+        data = load_cache(repo_root, self.cache_name)
+        self.entries: dict[str, dict] = data.get("files", {}) if data.get("salt") == self.salt else {}
+        self.updated = 0  # cheatsheets (re)vectorized by the last refresh()
+
+    def refresh(self) -> dict[str, dict]:
+        """Bring the vectors in line with the cheatsheets directory and save if anything changed."""
+        try:
+            names = sorted(
+                n for n in os.listdir(self.repo_root / self.cheatsheets_dir)
+                if n.endswith(".md") and n != "_index.md"
+            )
+        except OSError:
+            names = []
+        fresh: dict[str, dict] = {}
+        self.updated = 0
+        for name in names:
+            rel = f"{self.cheatsheets_dir}/{name}"
+            try:
+                st = (self.repo_root / rel).stat()
+            except OSError:
+                continue
+            stat_sig = [st.st_mtime_ns, st.st_size]
+            cached = self.entries.get(rel)
+            if cached is not None and cached["stat"] == stat_sig:
+                fresh[rel] = cached
+                continue
+            try:
+                text = (self.repo_root / rel).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                continue
+            fresh[rel] = {"stat": stat_sig, **cheatsheet_vector(text)}
+            self.updated += 1
+        if self.updated or fresh.keys() != self.entries.keys():
+            self.entries = fresh
+            try:
+                save_cache(self.repo_root, self.cache_name, {"salt": self.salt, "files": fresh})
+            except OSError:
+                pass  # the cache only saves work
+        return self.entries
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def _recency(last_updated: str, today: date) -> float:
+    try:
+        age = max((today - date.fromisoformat(last_updated)).days, 0)
+    except ValueError:
+        return 1.0 - RECENCY_WEIGHT
+    return 1.0 - RECENCY_WEIGHT + RECENCY_WEIGHT * 0.5 ** (age / RECENCY_HALF_LIFE_DAYS)
+
+
+def rank(entries: dict[str, dict], task: str, today: date | None = None) -> list[Selection]:
+    """Every cheatsheet sharing a term with the task, best first."""
+    today = today or date.today()
+    query: dict[str, int] = {}
+    for term in tokenize(task):
+        query[term] = query.get(term, 0) + 1
+    n = len(entries)
+    df = {t: sum(1 for e in entries.values() if t in e["terms"]) for t in query}
+    weights = {t: count * math.log(1 + n / df[t]) for t, count in query.items() if df[t]}
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+    ranked = []
+    for rel, entry in entries.items():
+        vector = entry["terms"]
+        relevance = sum(w * vector.get(t, 0.0) for t, w in weights.items()) / norm
+        if relevance <= 0:
+            continue
+        score = (
+            relevance
+            * CONFIDENCE_FACTOR.get(entry["confidence"], UNKNOWN_CONFIDENCE_FACTOR)
+            * _recency(entry["last_updated"], today)
+        )
+        ranked.append(Selection(rel, round(score, 4), round(relevance, 4), entry["stat"][1]))
+    ranked.sort(key=lambda s: (-s.score, s.rel_path))
+    return ranked
+
+
+def select_cheatsheets(
+    repo_root: Path,
+    agent: dict,
+    task: str,
+    top_k: int = DEFAULT_TOP_K,
+    budget: int = DEFAULT_BUDGET_BYTES,
+) -> list[Selection]:
+    """Top-K cheatsheets for the task whose sizes add up to at most budget bytes."""
+    chosen: list[Selection] = []
+    remaining = budget
+    for candidate in rank(CheatsheetVectors(repo_root, agent).refresh(), task):
+        if len(chosen) == top_k:
+            break
+        if candidate.size <= remaining:
+            chosen.append(candidate)
+            remaining -= candidate.size
+    return chosen
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Select an agent's most relevant cheatsheets for a task")
+    parser.add_argument("slug", help="Agent slug")
+    parser.add_argument("task", nargs="+", help="Task description")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help=f"Maximum cheatsheets (default: {DEFAULT_TOP_K})")
+    parser.add_argument(
+        "--budget", type=int, default=DEFAULT_BUDGET_BYTES,
+        help=f"Maximum total size in bytes (default: {DEFAULT_BUDGET_BYTES})",
+    )
+    parser.add_argument("--json", action="store_true", help="Print selections with scores as JSON")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    agent = next((a for a in manifest["agents"] if a.get("slug") == args.slug), None)
+    if agent is None:
+        print(f"ERROR: unknown agent slug: {args.slug}", file=sys.stderr)
+        sys.exit(1)
+
+    chosen = select_cheatsheets(repo_root, agent, " ".join(args.task), args.top_k, args.budget)
+    if args.json:
+        print(json.dumps([s._asdict() for s in chosen], indent=2))
+        return
+    if not chosen:
+        print(f"No cheatsheet matches; scan {agent['paths']['cheatsheet_index']}")
+        return
+    for s in chosen:
+        print(s.rel_path)
+
+
+if __name__ == "__main__":
+    main()
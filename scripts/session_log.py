@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Streaming parser and indexed queries over agents' memory/session-log.md.
+
+Usage:
+    python scripts/session_log.py                       # Last 10 sessions of every agent
+    python scripts/session_log.py miles --last 5        # Last 5 sessions of one agent
+    python scripts/session_log.py --outcome FAILED --project "agentsouls setup"
+    python scripts/session_log.py sam --json            # Full records as JSON
+
+Log format (see templates/session-log-template.md):
+    ## Session: {slug}-YYYY-MM-DD-NNN
+    **Project:** / **Task:** / **Duration:** / **Outcome:** SUCCESS | PARTIAL | FAILED
+    ### What I Did, ### What I Learned, ... (bullet lists)
+
+Parsing streams the file line by line, so memory is bounded by one session, not
+the whole log. A sidecar index in .agentsouls-cache/sessions.json maps each
+session id to its byte offset and length plus date, outcome and project, grouped
+by outcome and project; it is rebuilt only when a log's (mtime, size) changes.
+Queries read the index and seek straight to the matching sessions.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cache import load_cache, save_cache, source_hash
+from manifest import ManifestError, load_manifest
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+SESSION_INDEX_CACHE_NAME = "sessions.json"
+
+SESSION_HEADING_RE = re.compile(
+    r"^## Session:\s*(?P<id>(?P<slug>[\w-]+?)-(?P<date>\d{4}-\d{2}-\d{2})-(?P<seq>\d+))\s*$"
+)
+FIELD_RE = re.compile(r"^\*\*(?P<name>Project|Task|Duration|Outcome):\*\*\s*(?P<value>.*?)\s*$")
+SECTION_RE = re.compile(r"^###\s+(?P<name>.+?)\s*$")
+
+VALID_OUTCOMES = ("SUCCESS", "PARTIAL", "FAILED")
+
+# ---------------------------------------------------------------------------
+# Records and parsing
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SessionRecord:
+    """One `## Session:` entry of a session log."""
+
+    session_id: str
+    slug: str
+    date: str
+    seq: int
+    offset: int  # byte offset of the heading line
+    length: int = 0  # bytes up to the next level-2 heading (or end of file)
+    project: str = ""
+    task: str = ""
+    duration: str = ""
+    outcome: str = ""  # SUCCESS / PARTIAL / FAILED, or the raw text if nonstandard
+    sections: dict[str, list[str]] = field(default_factory=dict)  # heading -> non-blank lines
+
+
+def normalize_outcome(value: str) -> str:
+    """Map "SUCCESS — shipped" or "failed" to its outcome keyword; other text is kept."""
+    word = re.split(r"[^A-Za-z]", value.strip(), maxsplit=1)[0].upper()
+    return word if word in VALID_OUTCOMES else value.strip()
+
+
+def project_key(project: str) -> str:
+    """Key used to group sessions by project (case- and whitespace-insensitive)."""
+    return " ".join(project.split()).casefold()
+
+
+def parse_stream(f: BinaryIO, base_offset: int = 0, headers_only: bool = False) -> Iterator[SessionRecord]:
+    """Yield sessions from a binary stream positioned at its start, one line at a time.
+
+    Offsets are reported relative to base_offset (the stream's position in the
+    log file). With headers_only, section bodies are skipped (used for indexing).
+    """
+    record: SessionRecord | None = None
+    section: list[str] | None = None
+    offset = base_offset
+    for raw in f:
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        line_offset = offset
+        offset += len(raw)
+
+        if line.startswith("## "):
+            if record is not None:
+                record.length = line_offset - record.offset
+                yield record
+            match = SESSION_HEADING_RE.match(line)
+            record = None
+            if match:
+                record = SessionRecord(
+                    session_id=match["id"],
+                    slug=match["slug"],
+                    date=match["date"],
+                    seq=int(match["seq"]),
+                    offset=line_offset,
+                )
+            section = None
+            continue
+        if record is None:
+            continue
+
+        if section is None:
+            field_match = FIELD_RE.match(line)
+            if field_match:
+                name, value = field_match["name"].lower(), field_match["value"]
+                setattr(record, name, normalize_outcome(value) if name == "outcome" else value)
+                continue
+        section_match = SECTION_RE.match(line)
+        if section_match:
+            section = [] if headers_only else record.sections.setdefault(section_match["name"], [])
+            continue
+        stripped = line.strip()
+        if section is not None and not headers_only and stripped and stripped != "---":
+            section.append(stripped)
+
+    if record is not None:
+        record.length = offset - record.offset
+        yield record
+
+
+def iter_sessions(path: Path, headers_only: bool = False) -> Iterator[SessionRecord]:
+    """Stream the sessions of a log file in file order (newest first by convention)."""
+    with open(path, "rb") as f:
+        yield from parse_stream(f, 0, headers_only)
+
+
+def read_session(path: Path, offset: int, length: int) -> SessionRecord | None:
+    """Parse the single session stored at [offset, offset + length) of a log file."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        chunk = f.read(length)
+    return next(parse_stream(io.BytesIO(chunk), offset), None)
+
+
+# ---------------------------------------------------------------------------
+# Sidecar index
+# ---------------------------------------------------------------------------
+
+
+class SessionIndex:
+    """Persisted per-log index: session positions plus outcome/project groupings.
+
+    For each log (repo-relative path) the cache holds its (mtime_ns, size), the
+    sessions sorted newest first as [id, offset, length, date, outcome, project],
+    and {outcome: {project_key: [positions]}} so grouped queries touch only
+    their results.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.salt = source_hash(Path(__file__).resolve())
+        data = load_cache(repo_root, SESSION_INDEX_CACHE_NAME)
+        self._logs: dict[str, dict] = data.get("logs", {}) if data.get("salt") == self.salt else {}
+        self._dirty = False
+
+    def _entry(self, rel_path: str) -> dict:
+        """Return the up-to-date index entry for a log, rebuilding it if the file changed."""
+        path = self.repo_root / rel_path
+        try:
+            st = path.stat()
+            stat_sig = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stat_sig = None
+        entry = self._logs.get(rel_path)
+        if entry is not None and entry["stat"] == stat_sig:
+            return entry
+
+        records = list(iter_sessions(path, headers_only=True)) if stat_sig else []
+        records.sort(key=lambda r: (r.date, r.seq), reverse=True)
+        by_outcome: dict[str, dict[str, list[int]]] = {}
+        for pos, r in enumerate(records):
+            by_outcome.setdefault(r.outcome, {}).setdefault(project_key(r.project), []).append(pos)
+        entry = {
+            "stat": stat_sig,
+            "sessions": [[r.session_id, r.offset, r.length, r.date, r.outcome, r.project] for r in records],
+            "by_outcome": by_outcome,
+        }
+        self._logs[rel_path] = entry
+        self._dirty = True
+        return entry
+
+    def _load(self, rel_path: str, rows: list[list]) -> list[SessionRecord]:
+        path = self.repo_root / rel_path
+        records = []
+        with open(path, "rb") as f:
+            for _, offset, length, *_ in rows:
+                f.seek(offset)
+                record = next(parse_stream(io.BytesIO(f.read(length)), offset), None)
+                if record is not None:
+                    records.append(record)
+        return records
+
+    def count(self, rel_path: str) -> int:
+        """Number of sessions in a log."""
+        return len(self._entry(rel_path)["sessions"])
+
+    def last(self, rel_path: str, n: int) -> list[SessionRecord]:
+        """The n most recent sessions of a log (by date, then sequence number)."""
+        return self._load(rel_path, self._entry(rel_path)["sessions"][:n])
+
+    def find(self, rel_path: str, outcome: str, project: str | None = None) -> list[SessionRecord]:
+        """Sessions with the given outcome (and project, if given), newest first."""
+        entry = self._entry(rel_path)
+        groups = entry["by_outcome"].get(normalize_outcome(outcome), {})
+        if project is not None:
+            positions = groups.get(project_key(project), [])
+        else:
+            positions = sorted(p for group in groups.values() for p in group)
+        return self._load(rel_path, [entry["sessions"][p] for p in positions])
+
+    def save(self) -> None:
+        """Persist the index if anything was rebuilt."""
+        if self._dirty:
+            save_cache(self.repo_root, SESSION_INDEX_CACHE_NAME, {"salt": self.salt, "logs": self._logs})
+            self._dirty = False
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _format_record(record: SessionRecord) -> str:
+    task = f" — {record.task}" if record.task else ""
+    return f"  {record.session_id}  {record.outcome or '?':<8} {record.project or '(no project)'}{task}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query agents' session logs")
+    parser.add_argument("slugs", nargs="*", help="Agent slugs (default: every agent in the manifest)")
+    parser.add_argument("--last", type=int, default=10, metavar="N", help="Show the N most recent sessions (default: 10)")
+    parser.add_argument("--outcome", choices=VALID_OUTCOMES, help="Only sessions with this outcome")
+    parser.add_argument("--project", help="With --outcome, only sessions for this project")
+    parser.add_argument("--json", action="store_true", help="Print full records as JSON")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.project is not None and args.outcome is None:
+        parser.error("--project requires --outcome")
+
+    agents = {a["slug"]: a for a in manifest["agents"]}
+    unknown = [s for s in args.slugs if s not in agents]
+    if unknown:
+        print(f"ERROR: unknown agent slug(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    index = SessionIndex(repo_root)
+    results: dict[str, list[SessionRecord]] = {}
+    for slug in args.slugs or sorted(agents):
+        log_rel = agents[slug]["paths"]["session_log"]
+        if args.outcome:
+            results[slug] = index.find(log_rel, args.outcome, args.project)
+        else:
+            results[slug] = index.last(log_rel, args.last)
+    index.save()
+
+    if args.json:
+        print(json.dumps({slug: [asdict(r) for r in records] for slug, records in results.items()}, indent=2))
+        return
+    for slug, records in results.items():
+        print(f"{slug}: {len(records)} session(s)")
+        for record in records:
+            print(_format_record(record))
+
+
+if __name__ == "__main__":
+    main()
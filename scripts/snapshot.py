@@ -0,0 +1,352 @@
+"""In-memory snapshot of the repository tree shared by the validation checks.
+
+The tree is walked once with os.scandir (pruning .git, node_modules and the
+script cache early). Each file's bytes are read at most once, decoded at most
+once and its frontmatter parsed at most once; every check asks the snapshot
+instead of touching the filesystem again.
+
+UTF-8 validation and content hashing of files nobody else has loaded stream
+them in fixed-size chunks instead, so large session logs and archives are
+never held in memory.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import io
+import os
+import posixpath
+import stat
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from cache import CACHE_DIR_NAME
+from frontmatter import read_frontmatter
+
+# Directories never descended into
+SKIP_DIRS = {".git", "node_modules", CACHE_DIR_NAME}
+
+CHUNK_SIZE = 1 << 20  # bytes per read when streaming a file
+
+
+class Utf8Error(NamedTuple):
+    """Position of the first invalid UTF-8 sequence in a file."""
+
+    offset: int  # byte offset
+    line: int  # 1-based line number
+    reason: str
+
+
+def find_utf8_error(f: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Utf8Error | None:
+    """Scan a binary stream for invalid UTF-8 with an incremental decoder.
+
+    Reads into one reusable buffer, so memory stays at chunk_size whatever the
+    stream length; all-ASCII chunks skip decoding. Sequences split across
+    chunks are carried over by the decoder.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    offset = 0  # stream position of buf[0]
+    newlines = 0  # newlines before buf[0]
+    while n := f.readinto(buf):
+        pending = len(decoder.getstate()[0])
+        if pending or n < chunk_size or not buf.isascii():
+            try:
+                decoder.decode(view[:n])
+            except UnicodeDecodeError as e:
+                position = offset - pending + e.start
+                line = newlines + buf.count(b"\n", 0, max(position - offset, 0)) + 1
+                return Utf8Error(position, line, e.reason)
+        newlines += buf.count(b"\n", 0, n)
+        offset += n
+    pending = len(decoder.getstate()[0])
+    try:
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError as e:
+        return Utf8Error(offset - pending + e.start, newlines + 1, e.reason)
+    return None
+
+
+class FileEntry:
+    """One file in the snapshot, with lazily loaded and memoized contents."""
+
+    __slots__ = (
+        "rel", "path", "mtime_ns", "size", "_snapshot",
+        "_data", "_read_error", "_text", "_decode_error", "_fm", "_fm_done", "_utf8", "_utf8_done",
+    )
+
+    def __init__(self, snapshot: RepoSnapshot, rel: str, mtime_ns: int, size: int) -> None:
+        self.rel = rel
+        self.path = snapshot.repo_root / rel
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._snapshot = snapshot
+        self._reset()
+
+    def _reset(self) -> None:
+        self._data: bytes | None = None
+        self._read_error: OSError | None = None
+        self._text: str | None = None
+        self._decode_error: UnicodeDecodeError | None = None
+        self._fm: dict | None = None
+        self._fm_done = False
+        self._utf8: Utf8Error | None = None
+        self._utf8_done = False
+
+    def __getstate__(self) -> dict:
+        # Loaded contents stay in the process that read them (see RepoSnapshot.__getstate__).
+        return {"rel": self.rel, "path": self.path, "mtime_ns": self.mtime_ns, "size": self.size}
+
+    def __setstate__(self, state: dict) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._snapshot = None
+        self._reset()
+
+    @property
+    def name(self) -> str:
+        return posixpath.basename(self.rel)
+
+    @property
+    def suffix(self) -> str:
+        return posixpath.splitext(self.rel)[1]
+
+    @property
+    def data(self) -> bytes | None:
+        """Raw file bytes (read on first access), or None if the file cannot be read."""
+        if self._data is None:
+            try:
+                with open(self.path, "rb") as f:
+                    self._data = f.read()
+            except OSError as e:
+                self._read_error = e
+                return None
+            if self._snapshot is not None:
+                self._snapshot.reads += 1
+                self._snapshot.bytes_read += len(self._data)
+        return self._data
+
+    @property
+    def text(self) -> str | None:
+        """UTF-8 decoded contents, or None if unreadable or not valid UTF-8."""
+        if self._text is None and self._decode_error is None:
+            data = self.data
+            if data is None:
+                return None
+            try:
+                self._text = data.decode("utf-8")
+            except UnicodeDecodeError as e:
+                self._decode_error = e
+        return self._text
+
+    @property
+    def decode_error(self) -> UnicodeDecodeError | None:
+        """The UnicodeDecodeError raised when decoding, if any."""
+        self.text
+        return self._decode_error
+
+    @property
+    def error(self) -> Exception | None:
+        """The OSError or UnicodeDecodeError hit while loading the text, if any."""
+        self.text
+        return self._read_error or self._decode_error
+
+    def _open_counted(self) -> BinaryIO:
+        f = open(self.path, "rb")
+        if self._snapshot is not None:
+            self._snapshot.reads += 1
+            self._snapshot.bytes_read += self.size
+        return f
+
+    @property
+    def utf8_error(self) -> Utf8Error | None:
+        """First invalid UTF-8 sequence, or None if the file is valid (or unreadable).
+
+        Uses the loaded bytes if another check already read the file; otherwise
+        streams it (see find_utf8_error) without keeping its contents.
+        """
+        if not self._utf8_done:
+            if self._data is not None:
+                self._utf8 = find_utf8_error(io.BytesIO(self._data))
+            else:
+                try:
+                    with self._open_counted() as f:
+                        self._utf8 = find_utf8_error(f)
+                except OSError:
+                    self._utf8 = None
+            self._utf8_done = True
+        return self._utf8
+
+    def sha256(self) -> str | None:
+        """Hex SHA-256 of the contents (chunked read unless already loaded); None if unreadable."""
+        if self._data is not None:
+            return hashlib.sha256(self._data).hexdigest()
+        h = hashlib.sha256()
+        try:
+            with self._open_counted() as f:
+                while chunk := f.read(CHUNK_SIZE):
+                    h.update(chunk)
+        except OSError:
+            return None
+        return h.hexdigest()
+
+    @property
+    def frontmatter(self) -> dict | None:
+        """Parsed YAML frontmatter, or None if absent or the file is not readable text."""
+        if not self._fm_done:
+            # Memoized by (path, mtime, size), so rebuilt snapshots (watch mode) reuse it
+            text = self.text
+            self._fm = read_frontmatter(self.path, (self.mtime_ns, self.size), text) if text else None
+            self._fm_done = True
+        return self._fm
+
+
+class RepoSnapshot:
+    """A single walk of the repository: files (rel path -> FileEntry) and directories.
+
+    Paths are repo-relative POSIX strings. Lookups that fall outside the walked
+    tree (pruned directories, paths escaping the repo) go to the filesystem.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.files: dict[str, FileEntry] = {}
+        self.dirs: dict[str, list[str]] = {}  # rel dir ("" = root) -> sorted child file names
+        self.links: set[str] = set()  # symlinked directories (not descended into)
+        self.reads = 0
+        self.bytes_read = 0
+        self._walk()
+
+    def __getstate__(self) -> dict:
+        # Shipped to worker processes: the listing travels, file contents do not.
+        return {"repo_root": self.repo_root, "files": self.files, "dirs": self.dirs, "links": self.links}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.reads = 0
+        self.bytes_read = 0
+        for entry in self.files.values():
+            entry._snapshot = self
+
+    def _walk(self, start: str = "") -> None:
+        stack = [start]
+        while stack:
+            rel_dir = stack.pop()
+            names: list[str] = []
+            try:
+                with os.scandir(self.repo_root / rel_dir) as it:
+                    for de in it:
+                        rel = f"{rel_dir}/{de.name}" if rel_dir else de.name
+                        if de.is_dir(follow_symlinks=False):
+                            if de.name not in SKIP_DIRS:
+                                stack.append(rel)
+                        elif de.is_symlink() and de.is_dir():
+                            self.links.add(rel)
+                        elif de.is_file():
+                            try:
+                                st = de.stat()
+                            except OSError:
+                                continue
+                            self.files[rel] = FileEntry(self, rel, st.st_mtime_ns, st.st_size)
+                            names.append(de.name)
+            except OSError:
+                continue
+            self.dirs[rel_dir] = sorted(names)
+
+    @staticmethod
+    def normalize(rel_path: str) -> str:
+        """Normalize a manifest-style relative path ("dir/", "./x") to a snapshot key."""
+        key = posixpath.normpath(rel_path.replace("\\", "/"))
+        return "" if key == "." else key
+
+    def _outside_walk(self, key: str) -> bool:
+        parts = key.split("/")
+        if posixpath.isabs(key) or parts[0] == ".." or any(p in SKIP_DIRS for p in parts):
+            return True
+        return bool(self.links) and any(
+            "/".join(parts[:i]) in self.links for i in range(1, len(parts) + 1)
+        )
+
+    def get(self, rel_path: str) -> FileEntry | None:
+        """Return the entry for a file, or None if it does not exist."""
+        key = self.normalize(rel_path)
+        entry = self.files.get(key)
+        if entry is None and self._outside_walk(key):
+            try:
+                st = (self.repo_root / key).stat()
+            except OSError:
+                return None
+            if not stat.S_ISREG(st.st_mode):
+                return None
+            entry = self.files[key] = FileEntry(self, key, st.st_mtime_ns, st.st_size)
+        return entry
+
+    def is_file(self, rel_path: str) -> bool:
+        return self.get(rel_path) is not None
+
+    def is_dir(self, rel_path: str) -> bool:
+        key = self.normalize(rel_path)
+        if key in self.dirs:
+            return True
+        return self._outside_walk(key) and (self.repo_root / key).is_dir()
+
+    def list_dir(self, rel_dir: str, suffix: str = "") -> list[FileEntry]:
+        """Return the files directly inside a directory, sorted by name."""
+        key = self.normalize(rel_dir)
+        prefix = f"{key}/" if key else ""
+        return [
+            self.files[prefix + name]
+            for name in self.dirs.get(key, [])
+            if name.endswith(suffix)
+        ]
+
+    def iter_files(self, suffix: str = "") -> list[FileEntry]:
+        """Return all walked files with the given suffix, sorted by path."""
+        return [self.files[rel] for rel in sorted(self.files) if rel.endswith(suffix)]
+
+    def refresh(self, rel_path: str) -> None:
+        """Bring one path up to date after it changed on disk (file or directory).
+
+        Loaded contents are dropped; a new directory is walked, a removed one is
+        forgotten together with everything below it.
+        """
+        key = self.normalize(rel_path)
+        full_path = self.repo_root / key
+        parent, name = posixpath.split(key)
+        try:
+            st = full_path.stat()
+        except OSError:
+            st = None
+
+        if st is not None and stat.S_ISDIR(st.st_mode):
+            prefix = f"{key}/"
+            for rel in [r for r in self.files if r.startswith(prefix)]:
+                del self.files[rel]
+            for rel in [d for d in self.dirs if d == key or d.startswith(prefix)]:
+                del self.dirs[rel]
+            self._walk(key)
+            if parent not in self.dirs:
+                self.refresh(parent)
+            return
+
+        self.files.pop(key, None)
+        if key in self.dirs:  # a directory that disappeared
+            prefix = f"{key}/"
+            for rel in [r for r in self.files if r.startswith(prefix)]:
+                del self.files[rel]
+            for rel in [d for d in self.dirs if d == key or d.startswith(prefix)]:
+                del self.dirs[rel]
+        names = self.dirs.get(parent)
+        if st is None or not stat.S_ISREG(st.st_mode):
+            if names is not None and name in names:
+                names.remove(name)
+            return
+        if names is None:
+            self.refresh(parent)
+            return
+        if name not in names:
+            names.append(name)
+            names.sort()
+        self.files[key] = FileEntry(self, key, st.st_mtime_ns, st.st_size)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Rank cheatsheets by staleness: how much of their confidence has decayed with age.
+
+Usage:
+    python scripts/staleness.py                          # Markdown report: most stale first, per-agent totals
+    python scripts/staleness.py --format json --output staleness.json
+    python scripts/staleness.py --agent miles --limit 10
+    python scripts/staleness.py --today 2026-06-01       # Reproducible report as of a date
+
+Scoring:
+    A cheatsheet starts with a trust level set by its confidence
+    (CONFIDENCE_TRUST) and loses half of it every HALF_LIFE_DAYS for that
+    confidence: UNCERTAIN and DERIVED knowledge decays within months (training
+    data may already be 6-18 months stale, GENERAL_RULES.md), VERIFIED within a
+    year or so, TEXTBOOK material slowest. Staleness is 1 - remaining trust, from
+    0 (fresh and verified) to 1. A cheatsheet without any date scores 1.
+
+    Age is measured from last_updated; without one, from the cheatsheet's last
+    commit (repo_metadata.py). Cheatsheets at or above --threshold are stale.
+
+Input:
+    Topic, confidence, date and size come from the cached frontmatter rows of
+    cheatsheet_index.py (.agentsouls-cache/cheatsheet-index.json), so only new
+    or changed cheatsheets are read; a run over tens of thousands of unchanged
+    cheatsheets is a directory listing and a stat per file. Commit dates are
+    looked up only for cheatsheets without last_updated.
+
+Requirements: Python 3.10+, no external dependencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from cheatsheet_index import RowCache
+from manifest import ManifestError, load_manifest
+from repo_metadata import repo_metadata
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+CONFIDENCE_TRUST = {"VERIFIED": 1.0, "TEXTBOOK": 0.95, "DERIVED": 0.8, "UNCERTAIN": 0.5}
+HALF_LIFE_DAYS = {"VERIFIED": 365, "TEXTBOOK": 730, "DERIVED": 270, "UNCERTAIN": 120}
+UNKNOWN_CONFIDENCE = "UNCERTAIN"  # missing or unrecognized confidence is scored as this
+
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_LIMIT = 50
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+
+class Entry(NamedTuple):
+    agent: str
+    path: str
+    topic: str
+    confidence: str
+    last_updated: str
+    age_days: int | None  # None without a usable date
+    staleness: float
+
+
+def staleness_score(confidence: str, age_days: int | None) -> float:
+    """1 - the trust left after age_days for a cheatsheet of the given confidence."""
+    if age_days is None:
+        return 1.0
+    level = confidence if confidence in CONFIDENCE_TRUST else UNKNOWN_CONFIDENCE
+    return 1.0 - CONFIDENCE_TRUST[level] * 0.5 ** (age_days / HALF_LIFE_DAYS[level])
+
+
+def _age_days(last_updated: str, today: date) -> int | None:
+    try:
+        return max((today - date.fromisoformat(last_updated.strip()[:10])).days, 0)
+    except ValueError:
+        return None
+
+
+def collect(repo_root: Path, agents: list[dict], today: date) -> tuple[list[Entry], int]:
+    """Scored entries of every cheatsheet of the agents, and the number of files read."""
+    row_cache = RowCache(repo_root)
+    metadata = None  # loaded on the first cheatsheet without last_updated
+    entries: list[Entry] = []
+    ages: dict[str, int | None] = {}  # many cheatsheets share a date
+    for agent in agents:
+        cs_rel = agent["paths"]["cheatsheets"].rstrip("/")
+        for row in row_cache.rows(cs_rel):
+            rel = f"{cs_rel}/{row.name}"
+            last_updated = row.last_updated
+            if not last_updated:
+                metadata = metadata or repo_metadata(repo_root)
+                last_updated = metadata.last_modified(rel) or ""
+            if last_updated not in ages:
+                ages[last_updated] = _age_days(last_updated, today)
+            age = ages[last_updated]
+            confidence = row.confidence.strip("[]").upper()
+            entries.append(Entry(
+                agent["slug"], rel, row.topic, confidence, last_updated, age,
+                round(staleness_score(confidence, age), 4),
+            ))
+    row_cache.save()
+    return entries, row_cache.read
+
+
+def rank(entries: list[Entry]) -> list[Entry]:
+    """Most stale first; ties go to the oldest, then by path."""
+    return sorted(entries, key=lambda e: (-e.staleness, -(e.age_days if e.age_days is not None else 1 << 30), e.path))
+
+
+def aggregate(entries: list[Entry], threshold: float) -> list[dict]:
+    """Per-agent totals, most stale agent (by mean staleness) first."""
+    by_agent: dict[str, list[Entry]] = {}
+    for e in entries:
+        by_agent.setdefault(e.agent, []).append(e)
+    totals = []
+    for slug, items in by_agent.items():
+        dated = [e.last_updated for e in items if e.age_days is not None]
+        totals.append({
+            "agent": slug,
+            "cheatsheets": len(items),
+            "stale": sum(1 for e in items if e.staleness >= threshold),
+            "undated": len(items) - len(dated),
+            "mean_staleness": round(sum(e.staleness for e in items) / len(items), 4),
+            "max_staleness": max(e.staleness for e in items),
+            "oldest": min(dated) if dated else None,
+        })
+    totals.sort(key=lambda t: (-t["mean_staleness"], t["agent"]))
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+
+def build_report(entries: list[Entry], today: date, threshold: float, limit: int) -> dict:
+    ranked = rank(entries)
+    return {
+        "generated": today.isoformat(),
+        "threshold": threshold,
+        "cheatsheets": len(entries),
+        "stale": sum(1 for e in entries if e.staleness >= threshold),
+        "ranked": [e._asdict() for e in ranked[:limit]],
+        "agents": aggregate(entries, threshold),
+    }
+
+
+def format_markdown(report: dict) -> str:
+    lines = [
+        "# Cheatsheet Staleness Report",
+        "",
+        f"As of {report['generated']}: {report['stale']} of {report['cheatsheets']} cheatsheets "
+        f"have staleness >= {report['threshold']} (0 = fresh and verified, 1 = no trust left).",
+        "",
+        f"## Most Stale ({len(report['ranked'])})",
+        "",
+        "| # | Agent | Cheatsheet | Confidence | Last Updated | Age (days) | Staleness |",
+        "|---|-------|------------|------------|--------------|------------|-----------|",
+    ]
+    for n, e in enumerate(report["ranked"], 1):
+        age = e["age_days"] if e["age_days"] is not None else "—"
+        topic = e["topic"].replace("|", "\\|")
+        lines.append(
+            f"| {n} | {e['agent']} | {topic} (`{e['path']}`) | {e['confidence'] or 'UNKNOWN'} | "
+            f"{e['last_updated'] or '—'} | {age} | {e['staleness']:.2f} |"
+        )
+    lines += [
+        "",
+        "## By Agent",
+        "",
+        "| Agent | Cheatsheets | Stale | Undated | Mean | Max | Oldest |",
+        "|-------|-------------|-------|---------|------|-----|--------|",
+    ]
+    for t in report["agents"]:
+        lines.append(
+            f"| {t['agent']} | {t['cheatsheets']} | {t['stale']} | {t['undated']} | "
+            f"{t['mean_staleness']:.2f} | {t['max_staleness']:.2f} | {t['oldest'] or '—'} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report stale cheatsheets, ranked by confidence-weighted age")
+    parser.add_argument("--agent", action="append", metavar="SLUG", help="Only this agent (repeatable)")
+    parser.add_argument("--format", choices=["markdown", "json"], default="markdown", help="Output format")
+    parser.add_argument("--output", type=Path, help="Write the report to this file instead of stdout")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help=f"Cheatsheets in the ranked list (default: {DEFAULT_LIMIT})")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Staleness at which a cheatsheet counts as stale (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--today", type=date.fromisoformat, default=date.today(), help="Report date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    repo_root = _SCRIPT_DIR.parent
+    try:
+        manifest = load_manifest(repo_root)
+    except ManifestError as e:
+        print(f"ERROR: cannot load manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+    agents = {a["slug"]: a for a in manifest["agents"]}
+    unknown = [s for s in args.agent or [] if s not in agents]
+    if unknown:
+        print(f"ERROR: unknown agent slug(s): {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(1)
+
+    selected = [agents[s] for s in args.agent] if args.agent else list(agents.values())
+    entries, read = collect(repo_root, selected, args.today)
+    report = build_report(entries, args.today, args.threshold, args.limit)
+    text = json.dumps(report, indent=2) + "\n" if args.format == "json" else format_markdown(report)
+
+    if args.output is None:
+        sys.stdout.write(text)
+        return
+    args.output.write_text(text, encoding="utf-8")
+    print(f"Wrote {args.output}: {report['stale']} of {report['cheatsheets']} cheatsheets stale ({read} read)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
 """Shared templates, constants, and helpers for agent file generation.
 
 Used by both generate-tool-configs.py and validate.py to avoid duplication.
+
+The per-agent templates are split into literal and placeholder segments once
+(CompiledTemplate), with schema_version folded into the literals per batch.
+render_agent() derives each agent's fields once for both the wrapper and the
+SKILL.md and memoizes the pair by (schema_version, manifest entry), so the
+generator, the drift check and watch mode share one render per process.
 """
 
 from __future__ import annotations
 
+import json
+import string
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Mapping, NamedTuple
+
+from bundles import bundle_path
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -31,6 +45,8 @@ VALID_PERMISSION_MODES = {"default", "plan", "bypassPermissions", "acceptEdits"}
 VALID_MEMORY_SCOPES = {None, "user", "project", "local"}
 VALID_ISOLATION_MODES = {None, "worktree"}
 
+RENDER_CACHE_SIZE = 4096  # agents whose rendered wrapper/SKILL.md pair is memoized
+
 # ---------------------------------------------------------------------------
 # Templates
 # ---------------------------------------------------------------------------
@@ -47,13 +63,16 @@ CLAUDE_AGENT_TEMPLATE = """\
 
 ## Activation
 
-You are {name}. Follow this loading sequence:
+You are {name}. If `{bundle_path}` exists and is newer than `{mistakes_path}`
+and `{brief_path}`, read it first: it holds steps 1-4 plus your brief and most
+relevant cheatsheets in one file (built locally by
+`python scripts/generate-tool-configs.py`). Otherwise follow this loading sequence:
 
 1. Read `GENERAL_RULES.md`
 2. Read `{core_path}`
 3. Check `{mistakes_path}`
 4. Scan `{cheatsheet_index_path}`
-5. Load relevant cheatsheets as needed
+5. Load relevant cheatsheets as needed: `python scripts/select_cheatsheets.py {slug} "<task>"` lists the best matches
 
 When finishing work, follow the Session End Protocol in GENERAL_RULES.md.
 """
@@ -79,11 +98,13 @@ Summon {name} for {description_lower}.{delegates_sentence}
 
 ## Loading Sequence
 
+Fast path: if `{bundle_path}` exists and is newer than `{mistakes_path}` and `{brief_path}`, read it — steps 1-4 plus {name}'s brief and most relevant cheatsheets, precompiled into one file by `python scripts/generate-tool-configs.py` (local, not committed). Otherwise:
+
 1. Read `GENERAL_RULES.md` — universal rules for all agents
 2. Read `{core_path}` — {name}'s identity and hard rules
 3. Check `{mistakes_path}` — pitfalls to avoid
 4. Scan `{cheatsheet_index_path}` — available knowledge
-5. Load relevant cheatsheets for the current task (progressive disclosure)
+5. Load relevant cheatsheets for the current task (progressive disclosure) — `python scripts/select_cheatsheets.py {slug} "<task>"` ranks them within a byte budget
 
 ## Session End
 
@@ -238,33 +259,138 @@ def build_frontmatter(agent: dict) -> str:
     return "\n".join(lines) + "\n"
 
 
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+class CompiledTemplate:
+    """A str.format template pre-split into literal and placeholder segments.
+
+    literals always has one more item than fields: the output is
+    literals[0] + value(fields[0]) + literals[1] + ... + literals[-1].
+    Only bare {name} placeholders are supported (no conversions or format specs).
+    """
+
+    __slots__ = ("literals", "fields")
+
+    def __init__(self, literals: list[str], fields: list[str]) -> None:
+        self.literals = literals
+        self.fields = fields
+
+    @classmethod
+    def compile(cls, template: str) -> CompiledTemplate:
+        literals = [""]
+        fields: list[str] = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            literals[-1] += literal
+            if field is None:
+                continue
+            if spec or conversion or not field.isidentifier():
+                raise ValueError(f"unsupported placeholder in template: {{{field}}}")
+            fields.append(field)
+            literals.append("")
+        return cls(literals, fields)
+
+    def bind(self, **values: str) -> CompiledTemplate:
+        """Fold the given placeholders into the literals (for values shared by a whole batch)."""
+        literals = [self.literals[0]]
+        fields: list[str] = []
+        for field, literal in zip(self.fields, self.literals[1:]):
+            if field in values:
+                literals[-1] += values[field] + literal
+            else:
+                fields.append(field)
+                literals.append(literal)
+        return CompiledTemplate(literals, fields)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        parts = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            parts.append(values[field])
+            parts.append(literal)
+        return "".join(parts)
+
+
+CLAUDE_AGENT_COMPILED = CompiledTemplate.compile(CLAUDE_AGENT_TEMPLATE)
+SKILL_COMPILED = CompiledTemplate.compile(SKILL_TEMPLATE)
+
+
+class RenderedAgent(NamedTuple):
+    claude_agent: str  # .claude/agents/{slug}.md
+    skill: str  # .agents/skills/{slug}/SKILL.md
+
+
+@lru_cache(maxsize=8)
+def _bound_templates(schema_version: str) -> tuple[CompiledTemplate, CompiledTemplate]:
+    return (
+        CLAUDE_AGENT_COMPILED.bind(schema_version=schema_version),
+        SKILL_COMPILED.bind(schema_version=schema_version),
+    )
+
+
+def agent_fields(agent: dict) -> dict[str, str]:
+    """Placeholder values shared by the wrapper and SKILL.md templates of one agent."""
+    paths = agent["paths"]
+    return {
+        "frontmatter": build_frontmatter(agent),
+        "slug": agent["slug"],
+        "name": agent["name"],
+        "role": agent["role"],
+        "description": agent["description"],
+        "domain": agent["domain"],
+        "model": agent["model"],
+        "capabilities": ", ".join(agent.get("capabilities", [])),
+        "description_lower": lower_no_trailing_period(agent["description"]),
+        "delegates_sentence": build_delegates_sentence(agent),
+        "core_path": paths["core"],
+        "mistakes_path": paths["mistakes"],
+        "brief_path": paths["brief"],
+        "cheatsheet_index_path": paths["cheatsheet_index"],
+        "bundle_path": bundle_path(agent["slug"]),
+    }
+
+
+_rendered: OrderedDict[tuple[str, str], RenderedAgent] = OrderedDict()
+
+
+def render_agent(agent: dict, schema_version: str) -> RenderedAgent:
+    """Render an agent's wrapper and SKILL.md together, memoized by (schema_version, entry)."""
+    key = (schema_version, json.dumps(agent, sort_keys=True))
+    cached = _rendered.get(key)
+    if cached is not None:
+        _rendered.move_to_end(key)
+        return cached
+    claude_template, skill_template = _bound_templates(schema_version)
+    fields = agent_fields(agent)
+    rendered = RenderedAgent(claude_template.render(fields), skill_template.render(fields))
+    _rendered[key] = rendered
+    if len(_rendered) > RENDER_CACHE_SIZE:
+        _rendered.popitem(last=False)
+    return rendered
+
+
+def render_agent_files(agents: list[dict], schema_version: str) -> list[tuple[str, str]]:
+    """(relative_path, content) of the wrapper and SKILL.md of every agent, in the given order."""
+    files: list[tuple[str, str]] = []
+    for agent in agents:
+        slug = agent["slug"]
+        rendered = render_agent(agent, schema_version)
+        files.append((f".claude/agents/{slug}.md", rendered.claude_agent))
+        files.append((f".agents/skills/{slug}/SKILL.md", rendered.skill))
+    return files
+
+
+def clear_render_cache() -> None:
+    """Forget every memoized render_agent() result."""
+    _rendered.clear()
+
+
 def render_claude_agent(agent: dict, schema_version: str) -> str:
     """Render a .claude/agents/{slug}.md file."""
-    return CLAUDE_AGENT_TEMPLATE.format(
-        schema_version=schema_version,
-        frontmatter=build_frontmatter(agent),
-        name=agent["name"],
-        role=agent["role"],
-        description=agent["description"],
-        core_path=agent["paths"]["core"],
-        mistakes_path=agent["paths"]["mistakes"],
-        cheatsheet_index_path=agent["paths"]["cheatsheet_index"],
-    )
+    return render_agent(agent, schema_version).claude_agent
 
 
 def render_skill(agent: dict, schema_version: str) -> str:
     """Render a .agents/skills/{slug}/SKILL.md file."""
-    return SKILL_TEMPLATE.format(
-        schema_version=schema_version,
-        name=agent["name"],
-        role=agent["role"],
-        description=agent["description"],
-        domain=agent["domain"],
-        model=agent["model"],
-        capabilities=", ".join(agent.get("capabilities", [])),
-        description_lower=lower_no_trailing_period(agent["description"]),
-        delegates_sentence=build_delegates_sentence(agent),
-        core_path=agent["paths"]["core"],
-        mistakes_path=agent["paths"]["mistakes"],
-        cheatsheet_index_path=agent["paths"]["cheatsheet_index"],
-    )
+    return render_agent(agent, schema_version).skill
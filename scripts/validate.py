@@ -5,18 +5,61 @@ Usage:
     python scripts/validate.py          # Run all checks, exit non-zero on any FAIL
     python scripts/validate.py --check  # Same as above (read-only mode is default)
     python scripts/validate.py --fix    # Auto-fix safe issues (_index.md regeneration only)
+    python scripts/validate.py --incremental  # Reuse cached results for unchanged files
+    python scripts/validate.py --jobs 8       # Spread per-agent work over 8 processes
+    python scripts/validate.py --watch        # Re-run affected checks on every file change
+    python scripts/validate.py --profile      # Add a per-check time / I/O / cache table
+    python scripts/validate.py --format json  # Results and per-check metrics as JSON
+    python scripts/validate.py --cprofile utf8-validation  # cProfile one check
+    python scripts/validate.py --format junit > validate.xml  # JUnit XML for CI
+    python scripts/validate.py --checks manifest,path-resolution,core-frontmatter --fail-fast  # Pre-commit
 
 Checks performed:
-    1.  Manifest validation (schema, required fields)
+    1.  Manifest validation (schema, required fields, no slug defined twice across agents/manifest.d/ shards)
     2.  Path resolution (all manifest paths exist)
     3.  CORE.md frontmatter (required YAML fields)
     4.  Cheatsheet frontmatter (FAIL if missing — all cheatsheets must have frontmatter)
-    5.  _index.md accuracy (matches actual cheatsheet files)
-    6.  UTF-8 validation (all .md files)
-    7.  Generated file drift (.claude/agents/*.md, .agents/skills/*/SKILL.md)
+    5.  _index.md accuracy (lists the cheatsheet files present; paginated indexes: pages linked and complete)
+    6.  UTF-8 validation (all .md files; streamed in fixed-size chunks, errors give byte offset and line)
+    7.  Generated file drift (.claude/agents/*.md, .agents/skills/*/SKILL.md; summon bundles: check 14)
     8.  Memory file structure (session-log.md, mistakes.md, decisions.md)
     9.  Skills validation (framework skills exist with valid frontmatter)
     10. v2 fields (skills refs resolve; optional field values valid when present)
+    11. Search index freshness (WARN if the scripts/search.py index is stale; skipped if not built)
+    12. Manifest schema (every violation of agents/manifest.schema.json, with its JSON pointer)
+    13. Delegation graph (references resolve; no defers_to/escalates_to cycles; escalation chains terminate)
+    14. Summon bundle freshness (WARN if a locally built bundle predates its inputs; skipped if none is built)
+
+Selecting checks:
+    Checks are registered by name in CHECKS (see CHECK_NAMES). --checks runs a
+    subset in registry order; the manifest check always runs since every other
+    check needs the manifest. --fail-fast stops after the first check that
+    records a FAIL; the checks not run are reported as skipped.
+
+Incremental mode:
+    --incremental keeps a per-file (mtime, size, sha256) table and the results of
+    checks 3-7 per agent/file in .agentsouls-cache/validate.json. A unit is re-run
+    only when one of the files it read changed, or its manifest entry changed;
+    editing validate.py or any scripts/ module it loads (templates.py,
+    cheatsheet_index.py, cache.py, ...) discards the whole cache.
+
+File access:
+    The tree is walked once (scripts/snapshot.py); every check reads, decodes and
+    parses each file through that shared snapshot, so a file is read at most once
+    per run (at most once per worker process with --jobs).
+
+Instrumentation:
+    Every check runs through run_check(), which records its elapsed time, the
+    files and bytes read through the snapshot, --incremental cache hits/misses
+    and the number of result records in a CheckMetrics entry of the structured
+    ValidationResults. --profile prints them slowest first; --format json emits
+    results, summary and metrics; --cprofile CHECK dumps cProfile stats for one
+    check to .agentsouls-cache/profile-CHECK.prof and prints the top entries.
+
+Parallel mode:
+    --jobs N runs the per-agent/per-file units of checks 2-7 in a pool of N worker
+    processes (0 = one per CPU). Results are merged in manifest order, so output is
+    identical to a serial run.
 
 Requirements: Python 3.10+, no external dependencies.
 """
@@ -24,22 +67,48 @@ Requirements: Python 3.10+, no external dependencies.
 from __future__ import annotations
 
 import argparse
+import io
 import json
-import re
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 # Ensure scripts/ is on sys.path for sibling imports
 _SCRIPT_DIR = Path(__file__).resolve().parent
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+from bundles import SnapshotSource, bundle_path, inputs_fingerprint, recorded_fingerprint
+from cache import CACHE_DIR_NAME, ResultCache, source_hash, stable_hash
+from cheatsheet_index import (
+    INDEX_NAME,
+    PAGES_DIR,
+    apply_index,
+    index_row,
+    listed_files,
+    listed_pages,
+    render_index,
+)
+from delegation import RELATIONS, STRICT_RELATIONS, DelegationGraph
+from json_schema import compile_schema_text
+from manifest import (
+    MANIFEST_REL,
+    ManifestError,
+    duplicate_slugs,
+    load_sources as load_manifest_sources,
+    merge_sources,
+)
+from search import SearchIndex, scan_cheatsheets
+from snapshot import RepoSnapshot
 from templates import (
     VALID_ISOLATION_MODES,
     VALID_MEMORY_SCOPES,
     VALID_PERMISSION_MODES,
-    render_claude_agent,
-    render_skill,
+    render_agent_files,
     sort_agents,
 )
 
@@ -47,6 +116,8 @@ from templates import (
 # Constants
 # ---------------------------------------------------------------------------
 
+MANIFEST_SCHEMA_REL = "agents/manifest.schema.json"
+
 REQUIRED_MANIFEST_FIELDS = [
     "name",
     "slug",
@@ -74,11 +145,132 @@ AUTO_GENERATED_HEADER = "<!-- AUTO-GENERATED from agents/manifest.json"
 
 FRAMEWORK_SKILLS = ["summon", "session-end", "learn", "debug"]
 
+# Name of the --incremental result cache under .agentsouls-cache/
+INCREMENTAL_CACHE_NAME = "validate.json"
+
 # ---------------------------------------------------------------------------
 # Result tracking
 # ---------------------------------------------------------------------------
 
-_results: list[tuple[str, str, str]] = []  # (status, check_name, message)
+Record = tuple[str, str, str]  # (status, check_name, message)
+
+
+@dataclass
+class CheckMetrics:
+    """Cost of one check: time, files read through the snapshot and cache use."""
+
+    name: str
+    elapsed_ms: float = 0.0
+    files_read: int = 0
+    bytes_read: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    records: int = 0
+
+
+class ValidationResults:
+    """Structured outcome of a run: the result records plus per-check metrics.
+
+    Iterating yields the (status, check_name, message) records in order.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[Record] = []
+        self.metrics: list[CheckMetrics] = []
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, rec: Record) -> None:
+        self.records.append(rec)
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.metrics.clear()
+
+    def counts(self) -> dict[str, int]:
+        """Number of records per status (PASS / FAIL / WARN)."""
+        counts = {"PASS": 0, "FAIL": 0, "WARN": 0}
+        for status, _, _ in self.records:
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    @property
+    def failed(self) -> bool:
+        return any(status == "FAIL" for status, _, _ in self.records)
+
+    def by_check(self) -> list[tuple[CheckMetrics, list[Record]]]:
+        """Pair each check's metrics with the records it emitted (in run order)."""
+        pairs = []
+        start = 0
+        for m in self.metrics:
+            pairs.append((m, self.records[start:start + m.records]))
+            start += m.records
+        return pairs
+
+    def to_json(self, skipped: list[str] | None = None) -> dict:
+        counts = self.counts()
+        checks = []
+        walk = None
+        for m, records in self.by_check():
+            if m.name == "walk":
+                walk = asdict(m)
+                continue
+            checks.append({
+                **asdict(m),
+                "status": _worst_status(records),
+                "results": [{"status": s, "check": c, "message": msg} for s, c, msg in records],
+            })
+        return {
+            "summary": {"total": len(self.records), **{k.lower(): v for k, v in counts.items()}},
+            "checks": checks,
+            "skipped": skipped or [],
+            "walk": walk,
+        }
+
+    def to_junit(self, skipped: list[str] | None = None) -> str:
+        """JUnit XML: one test case per check, one <failure> per FAIL record."""
+        import xml.etree.ElementTree as ET
+
+        checks = [(m, r) for m, r in self.by_check() if m.name != "walk"]
+        suite = ET.Element("testsuite", {
+            "name": "agentsouls-validate",
+            "tests": str(len(checks) + len(skipped or [])),
+            "failures": str(sum(1 for _, r in checks if _worst_status(r) == "FAIL")),
+            "skipped": str(len(skipped or [])),
+            "time": f"{sum(m.elapsed_ms for m in self.metrics) / 1000:.3f}",
+        })
+        for m, records in checks:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": "validate", "name": m.name, "time": f"{m.elapsed_ms / 1000:.3f}",
+            })
+            for status, check, message in records:
+                if status == "FAIL":
+                    ET.SubElement(case, "failure", {"type": check, "message": message}).text = message
+            other = [f"[{s}] {c}: {msg}" for s, c, msg in records if s != "FAIL"]
+            if other:
+                ET.SubElement(case, "system-out").text = "\n".join(other)
+        for name in skipped or []:
+            case = ET.SubElement(suite, "testcase", {"classname": "validate", "name": name, "time": "0"})
+            ET.SubElement(case, "skipped", {"message": "not run (--fail-fast)"})
+        root = ET.Element("testsuites", {"tests": suite.get("tests"), "failures": suite.get("failures")})
+        root.append(suite)
+        ET.indent(root)
+        return '<?xml version="1.0" encoding="utf-8"?>\n' + ET.tostring(root, encoding="unicode")
+
+
+def _worst_status(records: list[Record]) -> str:
+    statuses = {status for status, _, _ in records}
+    for status in ("FAIL", "WARN"):
+        if status in statuses:
+            return status
+    return "PASS"
+
+
+_results = ValidationResults()
 
 
 def record(status: str, check: str, message: str) -> None:
@@ -88,108 +280,43 @@ def record(status: str, check: str, message: str) -> None:
 
 def print_results() -> int:
     """Print all results and return exit code (0 = all pass, 1 = any FAIL)."""
-    has_fail = False
     for status, check, message in _results:
-        tag = {"PASS": "PASS", "FAIL": "FAIL", "WARN": "WARN"}.get(status, status)
-        print(f"  [{tag}] {check}: {message}")
-        if status == "FAIL":
-            has_fail = True
+        print(f"  [{status}] {check}: {message}")
     print()
-    total = len(_results)
-    passes = sum(1 for s, _, _ in _results if s == "PASS")
-    fails = sum(1 for s, _, _ in _results if s == "FAIL")
-    warns = sum(1 for s, _, _ in _results if s == "WARN")
-    print(f"Summary: {total} checks — {passes} PASS, {fails} FAIL, {warns} WARN")
-    return 1 if has_fail else 0
-
+    counts = _results.counts()
+    print(f"Summary: {len(_results)} checks — {counts['PASS']} PASS, {counts['FAIL']} FAIL, {counts['WARN']} WARN")
+    return 1 if _results.failed else 0
 
-# ---------------------------------------------------------------------------
-# YAML frontmatter parser (minimal, no external deps)
-# ---------------------------------------------------------------------------
 
-def parse_frontmatter(text: str) -> dict[str, str] | None:
-    """Parse YAML frontmatter between --- delimiters. Returns None if no frontmatter."""
-    lines = text.split("\n")
-    if not lines or lines[0].strip() != "---":
-        return None
-    fields: dict[str, str] = {}
-    for line in lines[1:]:
-        if line.strip() == "---":
-            return fields
-        match = re.match(r'^(\w[\w_-]*)\s*:\s*"?([^"]*)"?\s*$', line)
-        if match:
-            fields[match.group(1)] = match.group(2).strip()
-    return None  # Never found closing ---
+def print_profile() -> None:
+    """Print the per-check metrics, slowest first."""
+    print()
+    print(f"  {'check':<24} {'ms':>9} {'files':>7} {'bytes read':>12} {'cache hit/miss':>15} {'records':>8}")
+    for m in sorted(_results.metrics, key=lambda m: m.elapsed_ms, reverse=True):
+        cache = f"{m.cache_hits}/{m.cache_misses}" if m.cache_hits or m.cache_misses else "-"
+        print(
+            f"  {m.name:<24} {m.elapsed_ms:>9.1f} {m.files_read:>7} {m.bytes_read:>12,} "
+            f"{cache:>15} {m.records:>8}"
+        )
+    total = sum(m.elapsed_ms for m in _results.metrics)
+    print(f"  {'total':<24} {total:>9.1f}")
 
 
 # ---------------------------------------------------------------------------
-# Index generation logic (mirrors update-indexes.sh)
+# Index generation logic (see cheatsheet_index.py)
 # ---------------------------------------------------------------------------
 
-def kebab_to_title(filename: str) -> str:
-    """Convert a kebab-case .md filename to Title Case."""
-    name = filename.removesuffix(".md")
-    return " ".join(word.capitalize() for word in name.split("-"))
-
+def build_index_files(cheatsheets_dir: Path, snapshot: RepoSnapshot | None = None) -> dict[str, str]:
+    """Build the expected _index.md (and its pages, if paginated) for a cheatsheets directory.
 
-def build_index_content(cheatsheets_dir: Path) -> str:
-    """Build the expected _index.md content for a cheatsheets directory."""
-    md_files = sorted(
-        f for f in cheatsheets_dir.iterdir()
-        if f.is_file() and f.suffix == ".md" and f.name != "_index.md"
-    )
-
-    if not md_files:
-        return "# Cheatsheet Index\n\nNo cheatsheets yet.\n"
-
-    rows: list[str] = []
-    for cs_file in md_files:
-        try:
-            text = cs_file.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            text = ""
-
-        fm = parse_frontmatter(text) if text else None
-        if fm:
-            topic = fm.get("topic", "") or ""
-            confidence = fm.get("confidence", "") or "UNKNOWN"
-            last_updated = fm.get("last_updated", "") or ""
-        else:
-            topic = ""
-            confidence = "UNKNOWN"
-            last_updated = ""
-
-        # Fallback topic: first H1 heading
-        if not topic:
-            for line in text.split("\n"):
-                m = re.match(r"^#\s+(.+)$", line)
-                if m:
-                    topic = m.group(1).strip()
-                    break
-
-        # Final fallback: kebab-to-title from filename
-        if not topic:
-            topic = kebab_to_title(cs_file.name)
-
-        if not last_updated:
-            try:
-                import datetime
-                mtime = cs_file.stat().st_mtime
-                last_updated = datetime.datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-            except OSError:
-                last_updated = "unknown"
-
-        rows.append(f"| {cs_file.name} | {topic} | {confidence} | {last_updated} |")
-
-    table = "\n".join(rows)
-    return (
-        "# Cheatsheet Index\n"
-        "\n"
-        "| Cheatsheet | Topic | Confidence | Last Updated |\n"
-        "|------------|-------|------------|--------------|"
-        "\n"
-        f"{table}\n"
-    )
+    Keys are relative to the cheatsheets directory. With a snapshot, cheatsheet
+    contents and frontmatter come from its cache instead of being read again.
+    """
+    if snapshot is None:
+        snapshot = RepoSnapshot(cheatsheets_dir)
+    cs_rel = cheatsheets_dir.relative_to(snapshot.repo_root).as_posix()
+    rows = [index_row(e.name, e.text or "", e.frontmatter, e.size) for e in _cheatsheet_entries(snapshot, cs_rel)]
+    return render_index(rows)
 
 
 # ---------------------------------------------------------------------------
@@ -198,37 +325,30 @@ def build_index_content(cheatsheets_dir: Path) -> str:
 
 def generate_expected_files(manifest: dict) -> list[tuple[str, str]]:
     """Return list of (relative_path, expected_content) for all generated files."""
-    schema_version = manifest["schema_version"]
-    agents = sort_agents(manifest["agents"])
-    files: list[tuple[str, str]] = []
-    for agent in agents:
-        slug = agent["slug"]
-        files.append((f".claude/agents/{slug}.md", render_claude_agent(agent, schema_version)))
-        files.append((f".agents/skills/{slug}/SKILL.md", render_skill(agent, schema_version)))
-    return files
+    return render_agent_files(sort_agents(manifest["agents"]), manifest["schema_version"])
 
 
 # ---------------------------------------------------------------------------
-# Check implementations (1–8: existing, 9–12: new)
+# Check implementations (numbered as in the module docstring; registered in CHECKS)
 # ---------------------------------------------------------------------------
 
-def check_manifest(repo_root: Path) -> dict | None:
-    """Check 1: Manifest validation."""
-    manifest_path = repo_root / "agents" / "manifest.json"
-
-    if not manifest_path.exists():
-        record("FAIL", "manifest-exists", "agents/manifest.json not found")
-        return None
-
+def check_manifest(repo_root: Path, use_cache: bool = False) -> dict | None:
+    """Check 1: Manifest validation (manifest.json merged with agents/manifest.d/ shards)."""
     try:
-        text = manifest_path.read_text(encoding="utf-8")
-        manifest = json.loads(text)
-    except json.JSONDecodeError as e:
-        record("FAIL", "manifest-json", f"Invalid JSON: {e}")
-        return None
-    except UnicodeDecodeError as e:
-        record("FAIL", "manifest-utf8", f"Not valid UTF-8: {e}")
+        sources = load_manifest_sources(repo_root, use_cache)
+    except ManifestError as e:
+        cause = e.__cause__
+        where = "" if e.rel_path == MANIFEST_REL else f"{e.rel_path}: "
+        if isinstance(cause, FileNotFoundError) and e.rel_path == MANIFEST_REL:
+            record("FAIL", "manifest-exists", "agents/manifest.json not found")
+        elif isinstance(cause, json.JSONDecodeError):
+            record("FAIL", "manifest-json", f"{where}Invalid JSON: {cause}")
+        elif isinstance(cause, UnicodeDecodeError):
+            record("FAIL", "manifest-utf8", f"{where}Not valid UTF-8: {cause}")
+        else:
+            record("FAIL", "manifest-shards", str(e))
         return None
+    manifest = merge_sources(sources)
 
     if "schema_version" not in manifest:
         record("FAIL", "manifest-schema", "Missing 'schema_version' field")
@@ -239,6 +359,10 @@ def check_manifest(repo_root: Path) -> dict | None:
         return None
 
     all_ok = True
+    for slug, rels in sorted(duplicate_slugs(sources).items()):
+        record("FAIL", "manifest-slugs", f"Agent slug '{slug}' defined {len(rels)} times: {', '.join(rels)}")
+        all_ok = False
+
     for agent in manifest["agents"]:
         slug = agent.get("slug", agent.get("name", "UNKNOWN"))
         for field in REQUIRED_MANIFEST_FIELDS:
@@ -258,214 +382,400 @@ def check_manifest(repo_root: Path) -> dict | None:
     return manifest
 
 
+# ---------------------------------------------------------------------------
+# Unit execution (caching and parallelism for per-agent / per-file work)
+# ---------------------------------------------------------------------------
+
+class Unit(NamedTuple):
+    """One independent piece of a check: fn(*args) over a single agent or file.
+
+    deps/token describe the unit's inputs for the --incremental result cache.
+    fn must be a module-level function so it can be shipped to a worker process;
+    it reads files through the process-wide snapshot (get_snapshot()).
+    """
+
+    key: str
+    deps: list[str]
+    token: str
+    fn: Callable
+    args: tuple
+
+
+_executor: ProcessPoolExecutor | None = None
+_jobs = 1
+_snapshot: RepoSnapshot | None = None
+
+
+def get_snapshot(repo_root: Path | None = None) -> RepoSnapshot:
+    """Return the shared repository snapshot, walking the tree on first use."""
+    global _snapshot
+    if _snapshot is None or (repo_root is not None and _snapshot.repo_root != repo_root):
+        _snapshot = RepoSnapshot(repo_root or _SCRIPT_DIR.parent)
+    return _snapshot
+
+
+def incremental_salt() -> str:
+    """Hash of validate.py and every scripts/ module it has loaded.
+
+    Cached --incremental results are only valid for the code that produced
+    them: a change to any module a check imports (cheatsheet_index.py,
+    json_schema.py, delegation.py, templates.py, ...) invalidates them all.
+    """
+    sources = {
+        Path(module.__file__).resolve()
+        for module in list(sys.modules.values())
+        if getattr(module, "__file__", None) and Path(module.__file__).resolve().parent == _SCRIPT_DIR
+    }
+    sources.add(Path(__file__).resolve())
+    return source_hash(*sorted(sources))
+
+
+def _init_worker(snapshot: RepoSnapshot) -> None:
+    """Pool initializer: workers share the parent's tree listing (not its file contents)."""
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _call_unit(item: tuple[Callable, tuple]):
+    fn, args = item
+    return fn(*args)
+
+
+def run_units(check: str, units: list[Unit], cache: ResultCache | None = None) -> list:
+    """Run units and return their results in unit order.
+
+    Cached results are reused; the remaining units run in the process pool when
+    --jobs > 1. Results are merged by position, so the records a check emits are
+    identical to a serial run.
+    """
+    results: list = [None] * len(units)
+    pending: list[int] = []
+    for i, unit in enumerate(units):
+        if cache is not None:
+            cached = cache.lookup(check, unit.key, unit.deps, unit.token)
+            if cached is not None:
+                results[i] = cached
+                continue
+        pending.append(i)
+
+    items = [(units[i].fn, units[i].args) for i in pending]
+    if _executor is not None and len(items) > 1:
+        chunksize = max(1, len(items) // (_jobs * 4))
+        computed = list(_executor.map(_call_unit, items, chunksize=chunksize))
+    else:
+        computed = [_call_unit(item) for item in items]
+
+    for i, result in zip(pending, computed):
+        results[i] = result
+        if cache is not None:
+            unit = units[i]
+            cache.store(check, unit.key, unit.deps, unit.token, result)
+    return results
+
+
+def _cheatsheet_entries(snapshot: RepoSnapshot, cs_rel: str) -> list:
+    """Return the cheatsheet file entries of a directory, sorted (excluding _index.md)."""
+    return [e for e in snapshot.list_dir(cs_rel, ".md") if e.name != "_index.md"]
+
+
+def _path_resolution_unit(slug: str, paths: dict) -> list[Record]:
+    """Check 2 for a single agent."""
+    snapshot = get_snapshot()
+    records: list[Record] = []
+    for key, rel_path in paths.items():
+        if rel_path.endswith("/"):
+            if not snapshot.is_dir(rel_path):
+                records.append(("FAIL", "path-resolution", f"Agent '{slug}': {key} directory not found: {rel_path}"))
+        else:
+            if not snapshot.is_file(rel_path):
+                records.append(("FAIL", "path-resolution", f"Agent '{slug}': {key} file not found: {rel_path}"))
+    return records
+
+
 def check_path_resolution(repo_root: Path, manifest: dict) -> None:
     """Check 2: All paths in manifest resolve to existing files/directories."""
+    get_snapshot(repo_root)
+    units = [
+        Unit(agent["slug"], [], "", _path_resolution_unit, (agent["slug"], agent.get("paths", {})))
+        for agent in manifest["agents"]
+    ]
     all_ok = True
-    for agent in manifest["agents"]:
-        slug = agent["slug"]
-        paths = agent.get("paths", {})
-        for key, rel_path in paths.items():
-            full_path = repo_root / rel_path
-            if rel_path.endswith("/"):
-                if not full_path.is_dir():
-                    record("FAIL", "path-resolution", f"Agent '{slug}': {key} directory not found: {rel_path}")
-                    all_ok = False
-            else:
-                if not full_path.is_file():
-                    record("FAIL", "path-resolution", f"Agent '{slug}': {key} file not found: {rel_path}")
-                    all_ok = False
+    for records in run_units("path-resolution", units):
+        for r in records:
+            record(*r)
+        all_ok = all_ok and not records
 
     if all_ok:
         record("PASS", "path-resolution", "All manifest paths resolve to existing files/directories")
 
 
-def check_core_frontmatter(repo_root: Path, manifest: dict) -> None:
+def _core_frontmatter_unit(core_rel: str, slug: str) -> tuple[list[Record], bool]:
+    """Check 3 for a single agent."""
+    entry = get_snapshot().get(core_rel)
+    if entry is None or entry.text is None:
+        e = entry.error if entry is not None else FileNotFoundError(core_rel)
+        return [("FAIL", "core-frontmatter", f"Agent '{slug}': Cannot read CORE.md: {e}")], False
+
+    fm = entry.frontmatter
+    if fm is None:
+        return [("FAIL", "core-frontmatter", f"Agent '{slug}': CORE.md has no YAML frontmatter")], False
+
+    records: list[Record] = []
+    for field in REQUIRED_CORE_FRONTMATTER:
+        if field not in fm or not fm[field]:
+            records.append(("FAIL", "core-frontmatter", f"Agent '{slug}': CORE.md missing frontmatter field: {field}"))
+    return records, not records
+
+
+def check_core_frontmatter(repo_root: Path, manifest: dict, cache: ResultCache | None = None) -> None:
     """Check 3: Each CORE.md has required YAML frontmatter fields."""
-    all_ok = True
+    snapshot = get_snapshot(repo_root)
+    units: list[Unit] = []
     for agent in manifest["agents"]:
         slug = agent["slug"]
-        core_path = repo_root / agent["paths"]["core"]
-        if not core_path.is_file():
-            continue
-
-        try:
-            text = core_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError) as e:
-            record("FAIL", "core-frontmatter", f"Agent '{slug}': Cannot read CORE.md: {e}")
-            all_ok = False
+        core_rel = snapshot.normalize(agent["paths"]["core"])
+        if not snapshot.is_file(core_rel):
             continue
+        units.append(Unit(slug, [core_rel], "", _core_frontmatter_unit, (core_rel, slug)))
 
-        fm = parse_frontmatter(text)
-        if fm is None:
-            record("FAIL", "core-frontmatter", f"Agent '{slug}': CORE.md has no YAML frontmatter")
-            all_ok = False
-            continue
-
-        for field in REQUIRED_CORE_FRONTMATTER:
-            if field not in fm or not fm[field]:
-                record("FAIL", "core-frontmatter", f"Agent '{slug}': CORE.md missing frontmatter field: {field}")
-                all_ok = False
+    all_ok = True
+    for records, ok in run_units("core-frontmatter", units, cache):
+        for r in records:
+            record(*r)
+        all_ok = all_ok and ok
 
     if all_ok:
         record("PASS", "core-frontmatter", "All CORE.md files have required frontmatter")
 
 
-def check_cheatsheet_frontmatter(repo_root: Path, manifest: dict) -> None:
-    """Check 4: Cheatsheet .md files MUST have YAML frontmatter (FAIL if missing)."""
-    fail_count = 0
-    total_checked = 0
+def _cheatsheet_frontmatter_unit(rel: str, slug: str) -> tuple[list[Record], bool]:
+    """Check 4 for a single cheatsheet file."""
+    entry = get_snapshot().get(rel)
+    if entry is None or entry.text is None:
+        return [], False
+
+    if entry.frontmatter is None:
+        return [(
+            "FAIL",
+            "cheatsheet-frontmatter",
+            f"Agent '{slug}': {entry.name} has no YAML frontmatter",
+        )], False
+    return [], True
 
+
+def check_cheatsheet_frontmatter(repo_root: Path, manifest: dict, cache: ResultCache | None = None) -> None:
+    """Check 4: Cheatsheet .md files MUST have YAML frontmatter (FAIL if missing)."""
+    snapshot = get_snapshot(repo_root)
+    units: list[Unit] = []
     for agent in manifest["agents"]:
         slug = agent["slug"]
-        cs_dir = repo_root / agent["paths"]["cheatsheets"]
-        if not cs_dir.is_dir():
+        cs_rel = agent["paths"]["cheatsheets"]
+        if not snapshot.is_dir(cs_rel):
             continue
 
-        for md_file in sorted(cs_dir.iterdir()):
-            if not md_file.is_file() or md_file.suffix != ".md" or md_file.name == "_index.md":
-                continue
-            total_checked += 1
-
-            try:
-                text = md_file.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, OSError):
-                fail_count += 1
-                continue
+        for entry in _cheatsheet_entries(snapshot, cs_rel):
+            units.append(Unit(entry.rel, [entry.rel], slug, _cheatsheet_frontmatter_unit, (entry.rel, slug)))
 
-            fm = parse_frontmatter(text)
-            if fm is None:
-                record(
-                    "FAIL",
-                    "cheatsheet-frontmatter",
-                    f"Agent '{slug}': {md_file.name} has no YAML frontmatter",
-                )
-                fail_count += 1
+    fail_count = 0
+    for records, ok in run_units("cheatsheet-frontmatter", units, cache):
+        for r in records:
+            record(*r)
+        if not ok:
+            fail_count += 1
 
     if fail_count == 0:
-        record("PASS", "cheatsheet-frontmatter", f"All {total_checked} cheatsheets have frontmatter")
-
-
-def check_index_accuracy(repo_root: Path, manifest: dict, fix: bool) -> None:
-    """Check 5: _index.md lists exactly the cheatsheet files present."""
-    stale_count = 0
-    fixed_count = 0
-    total_checked = 0
-
+        record("PASS", "cheatsheet-frontmatter", f"All {len(units)} cheatsheets have frontmatter")
+
+
+def _list_mismatch(expected: set[str], actual: set[str]) -> str | None:
+    details = []
+    if expected - actual:
+        details.append(f"missing: {', '.join(sorted(expected - actual))}")
+    if actual - expected:
+        details.append(f"extra: {', '.join(sorted(actual - expected))}")
+    return "; ".join(details) or None
+
+
+def index_problems(expected: dict[str, str], current: dict[str, str | None]) -> list[str]:
+    """Differences in listed files/pages between the expected and current index files.
+
+    Both map paths relative to the cheatsheets directory to content (current:
+    None if unreadable). Only which cheatsheets and pages are listed where is
+    compared, not topics, dates or sizes.
+    """
+    top = current.get(INDEX_NAME)
+    if top is None:
+        return [f"{INDEX_NAME} not found" if INDEX_NAME not in current else f"{INDEX_NAME} is unreadable"]
+    problems = []
+    expected_pages = {rel for rel in expected if rel != INDEX_NAME}
+    if expected_pages:
+        mismatch = _list_mismatch(expected_pages, listed_pages(top))
+        if mismatch:
+            problems.append(f"{INDEX_NAME} page list mismatch ({mismatch})")
+        for rel in sorted(expected_pages):
+            if rel not in current:
+                problems.append(f"{rel} not found")
+            elif current[rel] is None:
+                problems.append(f"{rel} is unreadable")
+            elif mismatch := _list_mismatch(listed_files(expected[rel]), listed_files(current[rel])):
+                problems.append(f"{rel} file list mismatch ({mismatch})")
+    else:
+        mismatch = _list_mismatch(listed_files(expected[INDEX_NAME]), listed_files(top))
+        if mismatch:
+            problems.append(f"{INDEX_NAME} file list mismatch ({mismatch})")
+    stale = sorted(rel for rel in current if rel != INDEX_NAME and rel not in expected)
+    if stale:
+        problems.append(f"stale index pages: {', '.join(stale)}")
+    return problems
+
+
+def _index_accuracy_unit(cs_rel: str, index_rel: str, slug: str, fix: bool) -> tuple[list[Record], str]:
+    """Check 5 for a single agent. Returns (records, outcome) with outcome ok/stale/fixed."""
+    snapshot = get_snapshot()
+    expected = build_index_files(snapshot.repo_root / cs_rel, snapshot)
+    current: dict[str, str | None] = {}
+    entry = snapshot.get(index_rel)
+    if entry is not None:
+        current[INDEX_NAME] = entry.text
+    for page in snapshot.list_dir(f"{cs_rel}/{PAGES_DIR}", ".md"):
+        current[f"{PAGES_DIR}/{page.name}"] = page.text
+
+    problems = index_problems(expected, current)
+    if not problems:
+        return [], "ok"
+    if fix:
+        apply_index(snapshot.repo_root / cs_rel, expected, current)
+        return [], "fixed"
+    return [("FAIL", "index-accuracy", f"Agent '{slug}': {problem}") for problem in problems], "stale"
+
+
+def check_index_accuracy(repo_root: Path, manifest: dict, fix: bool, cache: ResultCache | None = None) -> None:
+    """Check 5: _index.md (and its pages, if paginated) lists exactly the cheatsheet files present."""
+    snapshot = get_snapshot(repo_root)
+    units: list[Unit] = []
     for agent in manifest["agents"]:
         slug = agent["slug"]
-        cs_dir = repo_root / agent["paths"]["cheatsheets"]
-        if not cs_dir.is_dir():
+        cs_rel = snapshot.normalize(agent["paths"]["cheatsheets"])
+        if not snapshot.is_dir(cs_rel):
             continue
 
-        total_checked += 1
-        index_path = repo_root / agent["paths"]["cheatsheet_index"]
-        expected = build_index_content(cs_dir)
-
-        if not index_path.is_file():
-            if fix:
-                index_path.write_text(expected, encoding="utf-8")
-                fixed_count += 1
-            else:
-                record("FAIL", "index-accuracy", f"Agent '{slug}': _index.md not found")
-                stale_count += 1
-            continue
+        index_rel = snapshot.normalize(agent["paths"]["cheatsheet_index"])
+        deps = [e.rel for e in _cheatsheet_entries(snapshot, cs_rel)]
+        pages = [e.rel for e in snapshot.list_dir(f"{cs_rel}/{PAGES_DIR}", ".md")]
+        token = "\n".join(deps + pages)  # the set of cheatsheets and pages, so additions/removals invalidate
+        units.append(Unit(slug, deps + [index_rel] + pages, token, _index_accuracy_unit, (cs_rel, index_rel, slug, fix)))
 
-        try:
-            actual = index_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
+    # --fix writes files, so its results are never served from (or stored in) the cache.
+    stale_count = 0
+    fixed_count = 0
+    for unit, (records, outcome) in zip(units, run_units("index-accuracy", units, None if fix else cache)):
+        for r in records:
+            record(*r)
+        if outcome == "fixed":
+            fixed_count += 1
+            snapshot.refresh(unit.args[1])
+            snapshot.refresh(f"{unit.args[0]}/{PAGES_DIR}")
+        elif outcome == "stale":
             stale_count += 1
-            continue
-
-        expected_files = set(re.findall(r"\|\s*(\S+\.md)\s*\|", expected))
-        actual_files = set(re.findall(r"\|\s*`?(\S+\.md)`?\s*\|", actual))
-
-        if expected_files != actual_files:
-            if fix:
-                index_path.write_text(expected, encoding="utf-8")
-                fixed_count += 1
-            else:
-                missing = expected_files - actual_files
-                extra = actual_files - expected_files
-                details = []
-                if missing:
-                    details.append(f"missing: {', '.join(sorted(missing))}")
-                if extra:
-                    details.append(f"extra: {', '.join(sorted(extra))}")
-                record(
-                    "FAIL",
-                    "index-accuracy",
-                    f"Agent '{slug}': _index.md file list mismatch ({'; '.join(details)})",
-                )
-                stale_count += 1
 
     if fix and fixed_count > 0:
         record("PASS", "index-accuracy", f"Fixed {fixed_count} _index.md files")
     elif stale_count == 0:
-        record("PASS", "index-accuracy", f"All {total_checked} _index.md files are accurate")
+        record("PASS", "index-accuracy", f"All {len(units)} _index.md files are accurate")
 
 
-def check_utf8(repo_root: Path) -> None:
-    """Check 6: All .md files are valid UTF-8."""
-    bad_files: list[str] = []
-    total = 0
+def _utf8_unit(rel: str) -> list:
+    """Check 6 for a single file. Returns [] if it is valid UTF-8, else [offset, line, reason]."""
+    entry = get_snapshot().get(rel)
+    error = entry.utf8_error if entry is not None else None
+    return [] if error is None else list(error)
 
-    for md_file in repo_root.rglob("*.md"):
-        parts = md_file.relative_to(repo_root).parts
-        if ".git" in parts:
-            continue
-        if "node_modules" in parts:
-            continue
 
-        total += 1
-        try:
-            md_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            rel = md_file.relative_to(repo_root)
-            bad_files.append(str(rel))
+def utf8_message(rel: str, error: list) -> str:
+    offset, line, reason = error
+    return f"Invalid UTF-8: {rel} (byte {offset}, line {line}: {reason})"
+
+
+def check_utf8(repo_root: Path, cache: ResultCache | None = None) -> None:
+    """Check 6: All .md files are valid UTF-8 (streamed in chunks; known-good files come from the cache)."""
+    md_files = [e.rel for e in get_snapshot(repo_root).iter_files(".md")]
+    units = [Unit(rel, [rel], "", _utf8_unit, (rel,)) for rel in md_files]
+
+    bad_files = [
+        (rel, error)
+        for rel, error in zip(md_files, run_units("utf8-validation", units, cache))
+        if error
+    ]
 
     if bad_files:
-        for f in bad_files:
-            record("FAIL", "utf8-validation", f"Invalid UTF-8: {f}")
+        for rel, error in bad_files:
+            record("FAIL", "utf8-validation", utf8_message(rel, error))
     else:
-        record("PASS", "utf8-validation", f"All {total} .md files are valid UTF-8")
+        record("PASS", "utf8-validation", f"All {len(md_files)} .md files are valid UTF-8")
 
 
-def check_generated_drift(repo_root: Path, manifest: dict) -> None:
-    """Check 7: Generated files match what manifest would produce."""
-    expected_files = generate_expected_files(manifest)
+def _generated_drift_unit(agent: dict, schema_version: str) -> tuple[list[Record], int, int]:
+    """Check 7 for one agent's generated files. Returns (records, drift_count, missing_count)."""
+    snapshot = get_snapshot()
+    records: list[Record] = []
     drift_count = 0
     missing_count = 0
 
+    expected_files = generate_expected_files({"schema_version": schema_version, "agents": [agent]})
     for rel_path, expected_content in expected_files:
-        full_path = repo_root / rel_path
-        if not full_path.exists():
-            record("FAIL", "generated-drift", f"Missing generated file: {rel_path}")
+        entry = snapshot.get(rel_path)
+        if entry is None:
+            records.append(("FAIL", "generated-drift", f"Missing generated file: {rel_path}"))
             missing_count += 1
             continue
 
-        try:
-            actual = full_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError) as e:
-            record("FAIL", "generated-drift", f"Cannot read {rel_path}: {e}")
+        actual = entry.text
+        if actual is None:
+            records.append(("FAIL", "generated-drift", f"Cannot read {rel_path}: {entry.error}"))
             drift_count += 1
             continue
 
         if AUTO_GENERATED_HEADER not in actual:
-            record("FAIL", "generated-drift", f"Missing AUTO-GENERATED header: {rel_path}")
+            records.append(("FAIL", "generated-drift", f"Missing AUTO-GENERATED header: {rel_path}"))
             drift_count += 1
             continue
 
         if actual != expected_content:
-            record("FAIL", "generated-drift", f"Content drift detected: {rel_path}")
+            records.append(("FAIL", "generated-drift", f"Content drift detected: {rel_path}"))
             drift_count += 1
 
-    total = len(expected_files)
+    return records, drift_count, missing_count
+
+
+def check_generated_drift(repo_root: Path, manifest: dict, cache: ResultCache | None = None) -> None:
+    """Check 7: Generated files match what manifest would produce."""
+    get_snapshot(repo_root)
+    schema_version = manifest["schema_version"]
+    units: list[Unit] = []
+    for agent in sort_agents(manifest["agents"]):
+        slug = agent["slug"]
+        deps = [f".claude/agents/{slug}.md", f".agents/skills/{slug}/SKILL.md"]
+        units.append(Unit(
+            slug, deps, stable_hash([schema_version, agent]),
+            _generated_drift_unit, (agent, schema_version),
+        ))
+
+    drift_count = 0
+    missing_count = 0
+    for records, drift, missing in run_units("generated-drift", units, cache):
+        for r in records:
+            record(*r)
+        drift_count += drift
+        missing_count += missing
+
+    total = 2 * len(units)
     if drift_count == 0 and missing_count == 0:
         record("PASS", "generated-drift", f"All {total} generated files match manifest")
 
 
 def check_memory_structure(repo_root: Path, manifest: dict) -> None:
     """Check 8: Memory files exist for each agent."""
+    snapshot = get_snapshot(repo_root)
     all_ok = True
     memory_files = ["session_log", "mistakes", "decisions", "brief", "open_questions"]
 
@@ -477,8 +787,7 @@ def check_memory_structure(repo_root: Path, manifest: dict) -> None:
                 record("FAIL", "memory-structure", f"Agent '{slug}': missing paths.{mf} in manifest")
                 all_ok = False
                 continue
-            full_path = repo_root / rel_path
-            if not full_path.is_file():
+            if not snapshot.is_file(rel_path):
                 record("FAIL", "memory-structure", f"Agent '{slug}': {mf} file not found: {rel_path}")
                 all_ok = False
 
@@ -488,23 +797,22 @@ def check_memory_structure(repo_root: Path, manifest: dict) -> None:
 
 def check_skills_validation(repo_root: Path) -> None:
     """Check 9: Framework skills exist with valid frontmatter."""
+    snapshot = get_snapshot(repo_root)
     all_ok = True
 
     for skill_name in FRAMEWORK_SKILLS:
-        skill_path = repo_root / ".claude" / "skills" / skill_name / "SKILL.md"
-        if not skill_path.is_file():
+        entry = snapshot.get(f".claude/skills/{skill_name}/SKILL.md")
+        if entry is None:
             record("FAIL", "skills-validation", f"Framework skill missing: .claude/skills/{skill_name}/SKILL.md")
             all_ok = False
             continue
 
-        try:
-            text = skill_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError) as e:
-            record("FAIL", "skills-validation", f"Cannot read skill {skill_name}: {e}")
+        if entry.text is None:
+            record("FAIL", "skills-validation", f"Cannot read skill {skill_name}: {entry.error}")
             all_ok = False
             continue
 
-        fm = parse_frontmatter(text)
+        fm = entry.frontmatter
         if fm is None:
             record("FAIL", "skills-validation", f"Skill '{skill_name}' has no YAML frontmatter")
             all_ok = False
@@ -528,6 +836,7 @@ def check_v2_fields(repo_root: Path, manifest: dict) -> None:
         record("PASS", "v2-fields", "Skipped (schema < 2.0)")
         return
 
+    snapshot = get_snapshot(repo_root)
     all_ok = True
 
     for agent in manifest["agents"]:
@@ -564,8 +873,7 @@ def check_v2_fields(repo_root: Path, manifest: dict) -> None:
             all_ok = False
         else:
             for skill_ref in skills:
-                skill_path = repo_root / ".claude" / "skills" / skill_ref / "SKILL.md"
-                if not skill_path.is_file():
+                if not snapshot.is_file(f".claude/skills/{skill_ref}/SKILL.md"):
                     record("FAIL", "v2-fields", f"Agent '{slug}': skill ref '{skill_ref}' does not resolve to .claude/skills/{skill_ref}/SKILL.md")
                     all_ok = False
 
@@ -573,10 +881,198 @@ def check_v2_fields(repo_root: Path, manifest: dict) -> None:
         record("PASS", "v2-fields", "All v2.0 fields valid and skill refs resolve")
 
 
+def check_manifest_schema(repo_root: Path, manifest: dict) -> None:
+    """Check 12: The merged manifest conforms to agents/manifest.schema.json."""
+    try:
+        validator = compile_schema_text((repo_root / MANIFEST_SCHEMA_REL).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        record("WARN", "schema-validation", f"{MANIFEST_SCHEMA_REL} not found; schema not enforced")
+        return
+    except (OSError, ValueError) as e:
+        record("FAIL", "schema-validation", f"Cannot load {MANIFEST_SCHEMA_REL}: {e}")
+        return
+
+    violations = validator(manifest)
+    for pointer, message in violations:
+        where = pointer or "/"
+        parts = pointer.split("/")
+        if len(parts) > 2 and parts[1] == "agents" and parts[2].isdigit():
+            agent = manifest["agents"][int(parts[2])]
+            if isinstance(agent, dict) and isinstance(agent.get("slug"), str):
+                where = f"{pointer} (agent '{agent['slug']}')"
+        record("FAIL", "schema-validation", f"{where}: {message}")
+    if not violations:
+        record("PASS", "schema-validation", f"Manifest conforms to {MANIFEST_SCHEMA_REL}")
+
+
+def check_delegation_graph(repo_root: Path, manifest: dict) -> None:
+    """Check 13: delegates_to / defers_to / escalates_to resolve, without cycles or broken escalation chains."""
+    graph = DelegationGraph(manifest["agents"])
+    all_ok = True
+
+    for slug, relation, ref in graph.dangling:
+        record("FAIL", "delegation-graph", f"Agent '{slug}': {relation} '{ref}' does not match any agent")
+        all_ok = False
+
+    for relation, cycles in graph.cycles.items():
+        status = "FAIL" if relation in STRICT_RELATIONS else "WARN"
+        for cycle in cycles:
+            record(status, "delegation-graph", f"Cycle in {relation}: {' → '.join(cycle + cycle[:1])}")
+            all_ok = False
+
+    broken = graph.broken_escalations()
+    if broken:
+        record(
+            "FAIL", "delegation-graph",
+            f"Escalation chain never reaches the human operator for {len(broken)} agent(s): {', '.join(broken)}",
+        )
+        all_ok = False
+
+    if all_ok:
+        edges = sum(len(t) for relation in RELATIONS for t in graph.edges[relation].values())
+        record("PASS", "delegation-graph", f"{edges} delegation references resolve; no cycles")
+
+
+def check_search_index(repo_root: Path, manifest: dict) -> None:
+    """Check 11: The cheatsheet search index, if built, matches the cheatsheets on disk."""
+    index = SearchIndex(repo_root)
+    if not index.exists:
+        return
+    stale = index.stale(scan_cheatsheets(repo_root, manifest, get_snapshot(repo_root)))
+    if stale:
+        record(
+            "WARN", "search-index",
+            f"Search index is stale ({len(stale)} cheatsheet(s) added, changed or removed) "
+            f"— run: python scripts/search.py --build",
+        )
+    else:
+        record("PASS", "search-index", f"Search index covers all {index.live_count} cheatsheets")
+
+
+def check_bundle_freshness(repo_root: Path, manifest: dict) -> None:
+    """Check 14: Summon bundles built locally still match their inputs (memory, cheatsheets, rules)."""
+    source = SnapshotSource(get_snapshot(repo_root))
+    built = 0
+    stale = []
+    for agent in sort_agents(manifest["agents"]):
+        rel = bundle_path(agent["slug"])
+        recorded = recorded_fingerprint(repo_root / rel)
+        if recorded is None:
+            continue  # not built (bundles are local output)
+        built += 1
+        if recorded != inputs_fingerprint(agent, manifest["schema_version"], source):
+            stale.append(rel)
+    for rel in stale:
+        record(
+            "WARN", "bundle-freshness",
+            f"Stale summon bundle: {rel} (its rules, memory or cheatsheets changed since it was built) "
+            f"— run: python scripts/generate-tool-configs.py",
+        )
+    if built and not stale:
+        record("PASS", "bundle-freshness", f"All {built} built summon bundles match their inputs")
+
+
+# ---------------------------------------------------------------------------
+# Instrumentation
+# ---------------------------------------------------------------------------
+
+PROFILE_TOP_N = 25  # functions shown for --cprofile
+
+
+def run_check(name: str, fn: Callable, *args, cache: ResultCache | None = None, profile: Path | None = None, **kwargs):
+    """Run one check and append its CheckMetrics to the results.
+
+    Files read and bytes read are counted through the shared snapshot (reads
+    done in --jobs worker processes are not included); cache hits and misses
+    come from the --incremental result cache. With profile, the check runs
+    under cProfile and the stats are dumped to that path.
+    """
+    metrics = CheckMetrics(name)
+    snapshot = _snapshot
+    reads, nbytes = (snapshot.reads, snapshot.bytes_read) if snapshot is not None else (0, 0)
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+    records = len(_results)
+
+    profiler = None
+    if profile is not None:
+        import cProfile
+        profiler = cProfile.Profile()
+    started = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        metrics.elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+        snapshot = _snapshot
+        if snapshot is not None:
+            metrics.files_read = snapshot.reads - reads
+            metrics.bytes_read = snapshot.bytes_read - nbytes
+        if cache is not None:
+            metrics.cache_hits = cache.hits - hits
+            metrics.cache_misses = cache.misses - misses
+        metrics.records = len(_results) - records
+        _results.metrics.append(metrics)
+        if profiler is not None:
+            _dump_profile(profiler, name, profile)
+
+
+def _dump_profile(profiler, name: str, path: Path) -> None:
+    import pstats
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+    print(f"cProfile for check '{name}' written to {path}", file=sys.stderr)
+    print(out.getvalue(), file=sys.stderr)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
+class CheckContext(NamedTuple):
+    """Inputs shared by the registered checks."""
+
+    repo_root: Path
+    manifest: dict
+    cache: ResultCache | None
+    fix: bool
+
+
+# Checks 2-14 in run order (check 1, the manifest, always runs first: the rest need it)
+CHECKS: dict[str, Callable[[CheckContext], None]] = {
+    "path-resolution": lambda c: check_path_resolution(c.repo_root, c.manifest),
+    "core-frontmatter": lambda c: check_core_frontmatter(c.repo_root, c.manifest, c.cache),
+    "cheatsheet-frontmatter": lambda c: check_cheatsheet_frontmatter(c.repo_root, c.manifest, c.cache),
+    "index-accuracy": lambda c: check_index_accuracy(c.repo_root, c.manifest, c.fix, c.cache),
+    "utf8-validation": lambda c: check_utf8(c.repo_root, c.cache),
+    "generated-drift": lambda c: check_generated_drift(c.repo_root, c.manifest, c.cache),
+    "memory-structure": lambda c: check_memory_structure(c.repo_root, c.manifest),
+    "skills-validation": lambda c: check_skills_validation(c.repo_root),
+    "v2-fields": lambda c: check_v2_fields(c.repo_root, c.manifest),
+    "search-index": lambda c: check_search_index(c.repo_root, c.manifest),
+    "schema-validation": lambda c: check_manifest_schema(c.repo_root, c.manifest),
+    "delegation-graph": lambda c: check_delegation_graph(c.repo_root, c.manifest),
+    "bundle-freshness": lambda c: check_bundle_freshness(c.repo_root, c.manifest),
+}
+
+CHECK_NAMES = ["manifest", *CHECKS]
+
+
+def _parse_checks(value: str) -> list[str]:
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    unknown = [n for n in names if n not in CHECK_NAMES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown check(s): {', '.join(unknown)} (choose from {', '.join(CHECK_NAMES)})"
+        )
+    return names
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate agentsouls repository structure")
     parser.add_argument(
@@ -589,50 +1085,119 @@ def main() -> None:
         action="store_true",
         help="Auto-fix safe issues (only _index.md regeneration)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-run checks for files that changed since the last --incremental run",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes for per-agent checks (default: 1, 0 = CPU count)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-run only the affected checks on each file change",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, poll os.stat instead of using inotify (e.g. network filesystems)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "junit"],
+        default="text",
+        help="Output format (default: text); json and junit carry per-check records and metrics",
+    )
+    parser.add_argument(
+        "--checks",
+        type=_parse_checks,
+        metavar="NAMES",
+        help=f"Comma-separated checks to run (default: all): {', '.join(CHECK_NAMES)}",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first check that records a FAIL",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a table of per-check time, files and bytes read, and cache hits (slowest first)",
+    )
+    parser.add_argument(
+        "--cprofile",
+        choices=["walk", *CHECK_NAMES],
+        metavar="CHECK",
+        help="Run one check under cProfile; stats go to .agentsouls-cache/profile-CHECK.prof",
+    )
     args = parser.parse_args()
 
     repo_root = _SCRIPT_DIR.parent
+    if args.watch:
+        from watch import watch
+        watch(repo_root, generate=False, polling=args.poll)
+        return
 
-    print(f"Validating agentsouls repository at: {repo_root}")
-    print()
+    def check(name: str, fn: Callable, *fn_args, **kwargs):
+        profile = repo_root / CACHE_DIR_NAME / f"profile-{name}.prof" if args.cprofile == name else None
+        return run_check(name, fn, *fn_args, cache=cache, profile=profile, **kwargs)
 
-    # Check 1: Manifest validation
-    manifest = check_manifest(repo_root)
+    cache = None
+    snapshot = check("walk", get_snapshot, repo_root)
+    if args.incremental:
+        cache = ResultCache(repo_root, INCREMENTAL_CACHE_NAME, incremental_salt(), snapshot)
 
-    if manifest is None:
+    if args.format == "text":
+        print(f"Validating agentsouls repository at: {repo_root}")
         print()
-        exit_code = print_results()
-        sys.exit(exit_code)
 
-    # Check 2: Path resolution
-    check_path_resolution(repo_root, manifest)
-
-    # Check 3: CORE.md frontmatter
-    check_core_frontmatter(repo_root, manifest)
-
-    # Check 4: Cheatsheet frontmatter
-    check_cheatsheet_frontmatter(repo_root, manifest)
-
-    # Check 5: _index.md accuracy
-    check_index_accuracy(repo_root, manifest, fix=args.fix)
-
-    # Check 6: UTF-8 validation
-    check_utf8(repo_root)
-
-    # Check 7: Generated file drift
-    check_generated_drift(repo_root, manifest)
-
-    # Check 8: Memory file structure
-    check_memory_structure(repo_root, manifest)
-
-    # Check 9: Skills validation
-    check_skills_validation(repo_root)
+    # Check 1: Manifest validation
+    manifest = check("manifest", check_manifest, repo_root, args.incremental)
+
+    selected = [name for name in CHECKS if args.checks is None or name in args.checks]
+    skipped: list[str] = []
+    if manifest is not None:
+        global _executor, _jobs
+        _jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        if _jobs > 1:
+            _executor = ProcessPoolExecutor(
+                max_workers=_jobs, initializer=_init_worker, initargs=(snapshot,)
+            )
+
+        # Every selected check registered in CHECKS, in registry order
+        context = CheckContext(repo_root, manifest, cache, args.fix)
+        for i, name in enumerate(selected):
+            if args.fail_fast and _results.failed:
+                skipped = selected[i:]
+                break
+            check(name, CHECKS[name], context)
+
+        if cache is not None:
+            cache.save()
+        if _executor is not None:
+            _executor.shutdown()
+    else:
+        skipped = selected
 
-    # Check 10: v2 fields validation
-    check_v2_fields(repo_root, manifest)
+    if args.format == "json":
+        print(json.dumps({"repo_root": str(repo_root), **_results.to_json(skipped)}, indent=2))
+        sys.exit(1 if _results.failed else 0)
+    if args.format == "junit":
+        print(_results.to_junit(skipped))
+        sys.exit(1 if _results.failed else 0)
 
-    print()
+    if manifest is not None:
+        print()
     exit_code = print_results()
+    if skipped and manifest is not None:
+        print(f"Stopped at the first FAIL (--fail-fast); not run: {', '.join(skipped)}")
+    if args.profile:
+        print_profile()
     sys.exit(exit_code)
 
 
@@ -0,0 +1,402 @@
+"""Watch mode: regenerate tool configs and revalidate as files change.
+
+Used by `generate-tool-configs.py --watch` and `validate.py --watch`. The
+parsed manifest, the rendered outputs and the repository snapshot stay in
+memory; on each change only the affected agents are re-rendered and only the
+affected checks are re-run, so an edit round-trips in milliseconds instead of
+a cold start of both scripts.
+
+Change detection uses inotify (Linux, via ctypes) when available and falls
+back to polling os.stat on the watched directories. No external dependencies.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import importlib
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import templates
+import validate
+from bundles import RULES_PATH, SnapshotSource, bundle_path, render_bundle
+from cache import CACHE_DIR_NAME
+from manifest import SHARDS_DIR_REL, is_manifest_source, load_manifest
+from route import ROUTING_INDEX_PATH, render_routing_index
+from writeback import WriteBatch
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+TEMPLATES_REL = "scripts/templates.py"
+
+POLL_INTERVAL = 0.25  # seconds between stat scans when inotify is unavailable
+DEBOUNCE = 0.02  # seconds to wait for the rest of a burst (editors write temp + rename)
+
+# Checks re-run per affected agent, keyed by what changed
+AGENT_FILE_CHECKS = {
+    "core": ["core-frontmatter", "bundle-freshness"],
+    "cheatsheets": ["cheatsheet-frontmatter", "index-accuracy", "bundle-freshness"],
+    "memory": ["memory-structure", "bundle-freshness"],
+    "generated": ["generated-drift"],
+}
+# Agent files that feed the summon bundle (a change re-renders it)
+BUNDLE_SOURCE_KINDS = {"core", "cheatsheets", "memory"}
+ALL_AGENT_CHECKS = [
+    "path-resolution",
+    "core-frontmatter",
+    "cheatsheet-frontmatter",
+    "index-accuracy",
+    "generated-drift",
+    "memory-structure",
+    "v2-fields",
+    "bundle-freshness",
+]
+# Checks over the whole manifest, re-run whenever a manifest source changes
+MANIFEST_CHECKS = ["schema-validation", "delegation-graph"]
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+
+class _InotifyWatcher:
+    """Directory watches through the Linux inotify API (non-recursive per directory)."""
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _HEADER = struct.Struct("iIII")
+
+    def __init__(self, repo_root: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self.repo_root = repo_root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+
+    def add(self, rel_dir: str) -> None:
+        path = str(self.repo_root / rel_dir).encode()
+        wd = self._libc.inotify_add_watch(self._fd, path, self.MASK)
+        if wd >= 0:
+            self._dirs[wd] = rel_dir
+
+    def wait(self, timeout: float | None) -> set[str]:
+        """Block until events arrive; return the repo-relative paths that changed."""
+        changed: set[str] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            buf = os.read(self._fd, 65536)
+            offset = 0
+            while offset < len(buf):
+                wd, _mask, _cookie, length = self._HEADER.unpack_from(buf, offset)
+                offset += self._HEADER.size
+                name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += length
+                rel_dir = self._dirs.get(wd)
+                if rel_dir is not None and name:
+                    changed.add(f"{rel_dir}/{name}" if rel_dir else name)
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE)
+        return changed
+
+
+class _PollingWatcher:
+    """Fallback: compare (mtime_ns, size) of the entries of each watched directory."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._state: dict[str, dict[str, tuple[int, int]]] = {}
+
+    def _scan(self, rel_dir: str) -> dict[str, tuple[int, int]]:
+        entries: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(self.repo_root / rel_dir) as it:
+                for de in it:
+                    if de.is_dir():
+                        entries[de.name] = (0, 0)  # only creation/removal matters
+                        continue
+                    try:
+                        st = de.stat()
+                    except OSError:
+                        continue
+                    entries[de.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return entries
+
+    def add(self, rel_dir: str) -> None:
+        if rel_dir not in self._state:
+            self._state[rel_dir] = self._scan(rel_dir)
+
+    def wait(self, timeout: float | None) -> set[str]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed: set[str] = set()
+            for rel_dir, old in self._state.items():
+                new = self._scan(rel_dir)
+                if new != old:
+                    self._state[rel_dir] = new
+                    for name in old.keys() | new.keys():
+                        if old.get(name) != new.get(name):
+                            changed.add(f"{rel_dir}/{name}" if rel_dir else name)
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+            time.sleep(POLL_INTERVAL)
+
+
+def make_watcher(repo_root: Path, polling: bool = False):
+    """Return an inotify watcher when available (and not disabled), else a polling one."""
+    if not polling:
+        try:
+            return _InotifyWatcher(repo_root)
+        except (OSError, AttributeError):
+            pass
+    return _PollingWatcher(repo_root)
+
+
+# ---------------------------------------------------------------------------
+# Watch session
+# ---------------------------------------------------------------------------
+
+
+class WatchSession:
+    """In-memory state for watch mode: manifest, rendered outputs and snapshot."""
+
+    def __init__(self, repo_root: Path, generate: bool = True) -> None:
+        self.repo_root = repo_root
+        self.generate = generate
+        self.manifest: dict | None = None
+        self.agents: dict[str, dict] = {}  # slug -> manifest entry
+        self.rendered: dict[str, str] = {}  # rel path -> content last rendered
+        self.snapshot = validate.get_snapshot(repo_root)
+
+    # -- path classification ------------------------------------------------
+
+    def _agent_dirs(self) -> dict[str, tuple[str, str]]:
+        """Map directories to (slug, kind) for every agent path in the manifest."""
+        dirs: dict[str, tuple[str, str]] = {}
+        for slug, agent in self.agents.items():
+            paths = agent.get("paths", {})
+            for key in ("core", "cheatsheets", "memory"):
+                rel = paths.get(key)
+                if not rel:
+                    continue
+                rel = self.snapshot.normalize(rel)
+                dirs[os.path.dirname(rel) if key == "core" else rel] = (slug, key)
+            dirs[f".agents/skills/{slug}"] = (slug, "generated")
+        return dirs
+
+    def watched_dirs(self) -> list[str]:
+        """Directories whose entries can affect generation or validation."""
+        dirs = {"", "agents", SHARDS_DIR_REL, "scripts", ".claude/agents", ".agents/skills"}
+        dirs.update(d for d in self.snapshot.dirs if d.startswith(".claude/skills"))
+        dirs.update(self._agent_dirs())
+        return sorted(d for d in dirs if (self.repo_root / d).is_dir())
+
+    # -- generation -----------------------------------------------------------
+
+    def _load_manifest(self) -> bool:
+        try:
+            manifest = load_manifest(self.repo_root)
+            agents = {a["slug"]: a for a in manifest["agents"]}
+            manifest["schema_version"]
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"  [FAIL] manifest: cannot load: {e}")
+            return False
+        self.manifest = manifest
+        self.agents = agents
+        return True
+
+    def _render(self, slugs: set[str]) -> list[str]:
+        """Render outputs for the given agents (plus repo-level files); write changed ones."""
+        if not self.generate:
+            return []
+        schema_version = self.manifest["schema_version"]
+        outputs: list[tuple[str, str]] = []
+        for slug in sorted(slugs):
+            agent = self.agents[slug]
+            outputs.extend(templates.render_agent_files([agent], schema_version))
+            outputs.append((bundle_path(slug), render_bundle(agent, schema_version, SnapshotSource(self.snapshot))))
+        sorted_agents = templates.sort_agents(list(self.agents.values()))
+        outputs.append((".cursorrules", templates.render_cursorrules(sorted_agents, schema_version)))
+        outputs.append((".windsurfrules", templates.render_windsurfrules(sorted_agents, schema_version)))
+        outputs.append((ROUTING_INDEX_PATH, render_routing_index(sorted_agents, schema_version)))
+
+        with WriteBatch(self.repo_root) as batch:
+            for rel_path, content in outputs:
+                if self.rendered.get(rel_path) == content and (self.repo_root / rel_path).is_file():
+                    continue
+                self.rendered[rel_path] = content
+                batch.add(rel_path, content)
+            written = batch.commit()
+        for rel_path in written:
+            self.snapshot.refresh(rel_path)
+        return written
+
+    # -- validation -------------------------------------------------------------
+
+    def _run_checks(
+        self, agent_checks: dict[str, set[str]], utf8_paths: set[str], repo_checks: set[str]
+    ) -> None:
+        """Run the per-agent checks on their agents only and the repo-wide ones in full, in CHECKS order."""
+        validate._results.clear()
+        by_check: dict[str, list[dict]] = {}
+        for slug, checks in agent_checks.items():
+            if slug in self.agents:
+                for check in checks:
+                    by_check.setdefault(check, []).append(self.agents[slug])
+
+        for name, check in validate.CHECKS.items():
+            if name in by_check:
+                sub = {"schema_version": self.manifest["schema_version"], "agents": by_check[name]}
+                check(validate.CheckContext(self.repo_root, sub, None, False))
+            elif name in repo_checks:
+                check(validate.CheckContext(self.repo_root, self.manifest, None, False))
+
+        for rel in sorted(utf8_paths):
+            error = validate._utf8_unit(rel)
+            if error:
+                validate.record("FAIL", "utf8-validation", validate.utf8_message(rel, error))
+
+    # -- change handling --------------------------------------------------------
+
+    def start(self) -> None:
+        """Initial full pass: render everything and run every affected check once."""
+        started = time.perf_counter()
+        if not self._load_manifest():
+            return
+        written = self._render(set(self.agents))
+        self._run_checks(
+            {slug: set(ALL_AGENT_CHECKS) for slug in self.agents},
+            {e.rel for e in self.snapshot.iter_files(".md")},
+            {"skills-validation", *MANIFEST_CHECKS},
+        )
+        self._report("initial run", written, started)
+
+    def handle(self, changed: set[str]) -> None:
+        """Re-render and re-check only what the changed paths affect."""
+        started = time.perf_counter()
+        for rel in sorted(changed):
+            self.snapshot.refresh(rel)
+
+        agent_checks: dict[str, set[str]] = {}
+        render: set[str] = set()
+        utf8_paths = {rel for rel in changed if rel.endswith(".md") and self.snapshot.is_file(rel)}
+        repo_checks: set[str] = set()
+        if any(rel.startswith(".claude/skills/") for rel in changed):
+            repo_checks.add("skills-validation")
+        if validate.MANIFEST_SCHEMA_REL in changed:
+            repo_checks.add("schema-validation")
+
+        if TEMPLATES_REL in changed:
+            global templates
+            templates = importlib.reload(templates)
+            importlib.reload(validate)
+            validate._snapshot = self.snapshot
+            render.update(self.agents)
+            for slug in self.agents:
+                agent_checks.setdefault(slug, set()).add("generated-drift")
+
+        if RULES_PATH in changed:  # embedded in every summon bundle
+            render.update(self.agents)
+            for slug in self.agents:
+                agent_checks.setdefault(slug, set()).add("bundle-freshness")
+
+        if any(is_manifest_source(rel) for rel in changed):
+            old = self.agents
+            if not self._load_manifest():
+                return
+            repo_checks.update(MANIFEST_CHECKS)
+            for slug, agent in self.agents.items():
+                if old.get(slug) != agent:
+                    render.add(slug)
+                    agent_checks.setdefault(slug, set()).update(ALL_AGENT_CHECKS)
+            for slug in old.keys() - self.agents.keys():
+                print(f"  note: agent '{slug}' removed from manifest; its generated files were left in place")
+
+        agent_dirs = self._agent_dirs()
+        for rel in changed:
+            owner = agent_dirs.get(os.path.dirname(rel))
+            if owner is None and rel.startswith(".claude/agents/"):
+                slug = os.path.basename(rel).removesuffix(".md")
+                owner = (slug, "generated") if slug in self.agents else None
+            if owner is not None:
+                slug, kind = owner
+                agent_checks.setdefault(slug, set()).update(AGENT_FILE_CHECKS[kind])
+                if kind == "generated" or kind in BUNDLE_SOURCE_KINDS:
+                    render.add(slug)  # restore a hand-edited output / rebuild the bundle
+
+        written = self._render(render) if render else []
+        self._run_checks(agent_checks, utf8_paths, repo_checks)
+        self._report(", ".join(sorted(changed)), written, started)
+
+    def _report(self, label: str, written: list[str], started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if len(written) > 10:
+            print(f"  [WRITE] {len(written)} generated files")
+        else:
+            for rel in written:
+                print(f"  [WRITE] {rel}")
+        problems = [r for r in validate._results if r[0] != "PASS"]
+        for status, check, message in problems:
+            print(f"  [{status}] {check}: {message}")
+        passes = len(validate._results) - len(problems)
+        print(f"[{time.strftime('%H:%M:%S')}] {label}: {passes} PASS, {len(problems)} FAIL/WARN ({elapsed_ms:.0f} ms)")
+
+
+def watch(repo_root: Path, generate: bool = True, polling: bool = False) -> None:
+    """Run the watch loop until interrupted (Ctrl-C)."""
+    session = WatchSession(repo_root, generate=generate)
+    watcher = make_watcher(repo_root, polling=polling)
+    mode = "polling" if isinstance(watcher, _PollingWatcher) else "inotify"
+    print(f"Watching {repo_root} ({mode}); Ctrl-C to stop")
+    session.start()
+    watched = set(session.watched_dirs())
+    for rel_dir in watched:
+        watcher.add(rel_dir)
+
+    try:
+        while True:
+            changed = watcher.wait(None)
+            # Our own writes come back as events; ignore outputs that still match.
+            changed = {
+                rel for rel in changed
+                if not rel.startswith(CACHE_DIR_NAME)
+                and not (rel in session.rendered and _matches(repo_root / rel, session.rendered[rel]))
+            }
+            if not changed:
+                continue
+            session.handle(changed)
+            for rel_dir in session.watched_dirs():
+                if rel_dir not in watched:
+                    watched.add(rel_dir)
+                    watcher.add(rel_dir)
+    except KeyboardInterrupt:
+        print()
+
+
+def _matches(path: Path, content: str) -> bool:
+    try:
+        return path.read_text(encoding="utf-8") == content
+    except (OSError, UnicodeDecodeError):
+        return False
@@ -0,0 +1,152 @@
+"""Batched, atomic write-back of generated files.
+
+Changed outputs are staged in a temporary directory under .agentsouls-cache/
+(same filesystem as the repo, so renames are atomic) and moved into place
+together on commit(). An interrupted run leaves every target either at its
+old or its new content, never half written. Parent directories are created
+once per batch, and durability is chosen with the fsync mode:
+
+    none   no fsync (fastest; the OS flushes when it likes)
+    batch  stage without syncing; on commit, fsync the staged files in one pass
+           (the kernel can write them back together), rename, then fsync each
+           touched directory once
+    each   fsync each file as it is staged, and its directory right after it
+           is moved into place
+
+Usage:
+    with WriteBatch(repo_root, fsync="batch") as batch:
+        batch.add(".cursorrules", content)
+    print(batch.summary())
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from cache import CACHE_DIR_NAME
+
+FSYNC_MODES = ("none", "batch", "each")
+
+
+def _fsync_path(path: Path, directory: bool = False) -> None:
+    flags = os.O_RDONLY | (getattr(os, "O_DIRECTORY", 0) if directory else 0)
+    try:
+        fd = os.open(path, flags)
+    except OSError:
+        return  # e.g. directories cannot be opened on Windows
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class WriteBatch:
+    """Collect changed outputs and move them into place atomically.
+
+    add() compares the content with what is on disk and stages it only if it
+    differs; commit() (or leaving the with-block) renames the staged files into
+    place. If the with-block raises, nothing is moved and the staging area is
+    removed.
+    """
+
+    def __init__(self, repo_root: Path, fsync: str = "none") -> None:
+        if fsync not in FSYNC_MODES:
+            raise ValueError(f"fsync must be one of {', '.join(FSYNC_MODES)}, got {fsync!r}")
+        self.repo_root = repo_root
+        self.fsync = fsync
+        self.bytes_written = 0
+        self.files_written = 0
+        self.elapsed = 0.0
+        self._staged: list[tuple[Path, str]] = []  # (staged file, repo-relative target)
+        self._staging_dir: Path | None = None
+
+    def __enter__(self) -> WriteBatch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def _stage_dir(self) -> Path:
+        if self._staging_dir is None:
+            parent = self.repo_root / CACHE_DIR_NAME
+            parent.mkdir(parents=True, exist_ok=True)
+            self._staging_dir = Path(tempfile.mkdtemp(prefix="staging-", dir=parent))
+        return self._staging_dir
+
+    def add(self, rel_path: str, content: str) -> str:
+        """Stage content for rel_path. Returns "created", "updated" or "unchanged"."""
+        started = time.perf_counter()
+        target = self.repo_root / rel_path
+        data = content.encode("utf-8")
+        try:
+            existing = target.read_bytes()
+        except FileNotFoundError:
+            status = "created"
+        else:
+            status = "unchanged" if existing == data else "updated"
+
+        if status != "unchanged":
+            staged = self._stage_dir() / str(len(self._staged))
+            with open(staged, "wb") as f:
+                f.write(data)
+                if self.fsync == "each":
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._staged.append((staged, rel_path))
+            self.bytes_written += len(data)
+        self.elapsed += time.perf_counter() - started
+        return status
+
+    def commit(self) -> list[str]:
+        """Move every staged file into place. Returns the repo-relative paths written."""
+        started = time.perf_counter()
+        written: list[str] = []
+        try:
+            targets = [self.repo_root / rel for _, rel in self._staged]
+            for directory in sorted({t.parent for t in targets}):
+                directory.mkdir(parents=True, exist_ok=True)
+
+            if self.fsync == "batch":
+                for staged, _ in self._staged:
+                    _fsync_path(staged)
+
+            for (staged, rel), target in zip(self._staged, targets):
+                os.replace(staged, target)
+                if self.fsync == "each":
+                    _fsync_path(target.parent, directory=True)
+                written.append(rel)
+
+            if self.fsync == "batch":
+                for directory in sorted({t.parent for t in targets}):
+                    _fsync_path(directory, directory=True)
+        finally:
+            self.files_written += len(written)
+            self._staged = []
+            self._cleanup()
+            self.elapsed += time.perf_counter() - started
+        return written
+
+    def abort(self) -> None:
+        """Drop everything staged; no target is touched."""
+        self.bytes_written = 0
+        self._staged = []
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        if self._staging_dir is not None:
+            shutil.rmtree(self._staging_dir, ignore_errors=True)
+            self._staging_dir = None
+
+    def summary(self) -> str:
+        """One-line I/O report: files, bytes and time spent writing."""
+        return (
+            f"Wrote {self.files_written} files, {self.bytes_written:,} bytes "
+            f"in {self.elapsed * 1000:.1f} ms (fsync={self.fsync})"
+        )
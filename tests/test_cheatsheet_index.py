@@ -0,0 +1,54 @@
+"""Tests for scripts/cheatsheet_index.py: page groups and pagination of large indexes.
+
+Run with: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from cheatsheet_index import MIN_GROUP_SIZE, RANGE_PAGE_SIZE, group_of, index_row, paginate  # noqa: E402
+
+
+def row(name: str, topic: str, tags: list[str] | None = None):
+    fm = {"topic": topic, "confidence": "VERIFIED", "last_updated": "2026-01-02"}
+    if tags is not None:
+        fm["tags"] = tags
+    return index_row(name, f"# {topic}\n", fm, 10)
+
+
+class GroupOfTest(unittest.TestCase):
+    def test_first_tag_wins(self) -> None:
+        self.assertEqual(group_of(["Flight Dynamics", "units"], "Pitch Damping"), "flight-dynamics")
+        self.assertEqual(group_of("units", "Pitch Damping"), "units")
+
+    def test_topic_word_skips_stopwords(self) -> None:
+        self.assertEqual(group_of(None, "The Pitch Damping Derivative"), "pitch")
+        self.assertEqual(group_of([], "A"), "other")
+
+
+class PaginateTest(unittest.TestCase):
+    def test_small_index_is_not_paginated(self) -> None:
+        self.assertEqual(paginate([row("a.md", "Alpha")], page_size=5), {})
+
+    def test_large_groups_get_pages_and_small_ones_share_ranges(self) -> None:
+        rows = [row(f"pitch-{i}.md", f"Pitch {i}") for i in range(MIN_GROUP_SIZE)]
+        rows += [row(f"s{i:03d}.md", f"Word{i:03d} topic") for i in range(RANGE_PAGE_SIZE + 5)]
+        pages = paginate(rows, page_size=RANGE_PAGE_SIZE)
+
+        self.assertEqual(list(pages), ["pitch", "word000-to-word049", "word050-to-word054"])
+        self.assertEqual(sum(len(p) for p in pages.values()), len(rows))
+
+    def test_oversized_group_is_split(self) -> None:
+        rows = [row(f"r{i}.md", "Roll", tags=["roll"]) for i in range(7)]
+        pages = paginate(rows, page_size=3)
+
+        self.assertEqual({k: len(v) for k, v in pages.items()}, {"roll-1": 3, "roll-2": 3, "roll-3": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Tests for scripts/frontmatter.py: the YAML-subset parser and the read_frontmatter() memo.
+
+Run with: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from frontmatter import clear_frontmatter_cache, parse_frontmatter, read_frontmatter  # noqa: E402
+
+
+def parse(body: str) -> dict | None:
+    return parse_frontmatter(f"---\n{body}---\n# Body\n")
+
+
+class ParseFrontmatterTest(unittest.TestCase):
+    def test_bracketed_confidence_stays_a_string(self) -> None:
+        fm = parse("topic: Pitch damping\nconfidence: [DERIVED]\nlast_updated: 2026-01-02\n")
+        self.assertEqual(fm, {"topic": "Pitch damping", "confidence": "[DERIVED]", "last_updated": "2026-01-02"})
+
+    def test_flow_list_on_other_keys(self) -> None:
+        self.assertEqual(parse('tags: [a, "b, c", d]\n'), {"tags": ["a", "b, c", "d"]})
+
+    def test_hash_in_plain_value_is_kept(self) -> None:
+        self.assertEqual(parse("topic: Issue #42\n# a whole-line comment\n"), {"topic": "Issue #42"})
+
+    def test_quoted_scalars(self) -> None:
+        fm = parse('a: "say \\"hi\\"\\n"\nb: \'it\'\'s\'\nc: "[TEXTBOOK]"\n')
+        self.assertEqual(fm, {"a": 'say "hi"\n', "b": "it's", "c": "[TEXTBOOK]"})
+
+    def test_multiline_quoted_scalar(self) -> None:
+        self.assertEqual(parse('source: "first line\n  second line"\n'), {"source": "first line second line"})
+
+    def test_block_list_and_block_scalars(self) -> None:
+        fm = parse("skills:\n  - learn\n  - session-end\nnotes: |\n  one\n  two\nsummary: >\n  folded\n  text\n")
+        self.assertEqual(fm, {"skills": ["learn", "session-end"], "notes": "one\ntwo", "summary": "folded text"})
+
+    def test_continuation_line(self) -> None:
+        self.assertEqual(parse("description: a long\n  plain value\n"), {"description": "a long plain value"})
+
+    def test_missing_delimiters(self) -> None:
+        self.assertIsNone(parse_frontmatter("# No frontmatter\n"))
+        self.assertIsNone(parse_frontmatter("---\ntopic: never closed\n"))
+        self.assertEqual(parse(""), {})
+
+
+class ReadFrontmatterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "cheatsheet.md"
+        clear_frontmatter_cache()
+
+    def tearDown(self) -> None:
+        clear_frontmatter_cache()
+        self._tmp.cleanup()
+
+    def test_returned_lists_are_copies(self) -> None:
+        self.path.write_text("---\ntags: [a]\n---\n", encoding="utf-8")
+        read_frontmatter(self.path)["tags"].append("mutated")
+        self.assertEqual(read_frontmatter(self.path), {"tags": ["a"]})
+
+    def test_change_invalidates_memo(self) -> None:
+        self.path.write_text("---\ntopic: one\n---\n", encoding="utf-8")
+        self.assertEqual(read_frontmatter(self.path), {"topic": "one"})
+        self.path.write_text("---\ntopic: three\n---\n", encoding="utf-8")
+        st = self.path.stat()
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(read_frontmatter(self.path), {"topic": "three"})
+
+    def test_unreadable_or_missing(self) -> None:
+        self.assertIsNone(read_frontmatter(self.path))
+        self.path.write_bytes(b"---\ntopic: \xff\n---\n")
+        self.assertIsNone(read_frontmatter(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""Tests for scripts/search.py: incremental updates, segment merges and doc-id renumbering.
+
+Run with: python -m unittest discover -s tests
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import search  # noqa: E402
+
+MANIFEST = {"agents": [{"slug": "miles", "paths": {"cheatsheets": "cs"}}]}
+WORDS = "pitch roll yaw damping stability derivative tail unit conversion sign lift drag".split()
+
+
+class SearchIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "cs").mkdir()
+        self._tick = 1_700_000_000_000_000_000
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def write(self, name: str, topic: str, body: str) -> None:
+        path = self.root / "cs" / name
+        path.write_text(f"---\ntopic: {topic}\n---\n{body}\n", encoding="utf-8")
+        self._tick += 1_000_000_000  # distinct mtimes even within one clock tick
+        os.utime(path, ns=(self._tick, self._tick))
+
+    def build(self, rebuild: bool = False) -> search.SearchIndex:
+        index = search.SearchIndex(self.root)
+        index.update(search.scan_cheatsheets(self.root, MANIFEST), rebuild=rebuild)
+        return search.SearchIndex(self.root)  # reload from disk
+
+    def results(self, index: search.SearchIndex, query: str) -> list[tuple[float, str]]:
+        return [(round(score, 6), doc[0]) for score, doc in index.search(query, limit=50)]
+
+    def test_incremental_update_replaces_changed_documents(self) -> None:
+        self.write("a.md", "Pitch damping", "pitch damping derivative")
+        self.write("b.md", "Unit conversion", "unit conversion sign")
+        self.build()
+        self.write("a.md", "Roll damping", "roll damping derivative")
+        index = self.build()
+
+        self.assertEqual(self.results(index, "pitch"), [])
+        self.assertEqual([p for _, p in self.results(index, "roll")], ["cs/a.md"])
+        self.assertEqual(index.live_count, 2)
+        self.assertEqual(index.stale(search.scan_cheatsheets(self.root, MANIFEST)), [])
+
+    def test_removed_document_is_dropped(self) -> None:
+        self.write("a.md", "Pitch", "pitch")
+        self.write("b.md", "Yaw", "yaw")
+        self.build()
+        (self.root / "cs" / "b.md").unlink()
+        index = search.SearchIndex(self.root)
+        indexed, removed = index.update(search.scan_cheatsheets(self.root, MANIFEST))
+
+        self.assertEqual((indexed, removed), (0, 1))
+        self.assertEqual(self.results(search.SearchIndex(self.root), "yaw"), [])
+
+    @mock.patch.multiple(search, SEGMENT_DOCS=4, MAX_SMALL_SEGMENTS=2, MAX_SEGMENTS=3)
+    def test_full_merge_renumbers_doc_ids(self) -> None:
+        for i in range(12):
+            self.write(f"c{i:02d}.md", f"{WORDS[i]} {WORDS[-1 - i]}", " ".join(WORDS[i:] + WORDS[:i]))
+        self.build()
+        merged = False
+        for round_ in range(6):
+            for i in range(round_, 12, 3):
+                self.write(f"c{i:02d}.md", f"{WORDS[(i + round_) % 12]}", " ".join(WORDS[:i + 1]) + f" r{round_}")
+            index = self.build()
+            merged = merged or (len(index.segments) == 1 and None not in index.docs)
+
+        self.assertTrue(merged, "no full merge happened")
+        index = self.build()
+        live = [d for d in index.docs if d is not None]
+        self.assertEqual(len(live), 12)
+        # Every posting still points at the right document: results match a rebuild from scratch
+        queries = ["pitch damping", "roll", "unit conversion sign", "r5 drag"]
+        before = {q: self.results(index, q) for q in queries}
+        rebuilt = self.build(rebuild=True)
+        self.assertEqual(rebuilt.docs, [d for d in rebuilt.docs if d is not None])
+        self.assertEqual(before, {q: self.results(rebuilt, q) for q in queries})
+
+    @mock.patch.multiple(search, SEGMENT_DOCS=4, MAX_SMALL_SEGMENTS=1, MAX_SEGMENTS=100)
+    def test_partial_merge_keeps_doc_ids(self) -> None:
+        for i in range(8):
+            self.write(f"c{i}.md", WORDS[i], " ".join(WORDS[:i + 1]))
+        self.build()  # two full segments
+        self.write("c1.md", "lift", "lift drag")
+        self.build()
+        self.write("c2.md", "drag", "drag")
+        index = self.build()  # the two small segments merge; the full ones stay
+
+        self.assertIn(None, index.docs)  # ids are only renumbered by a full merge
+        self.assertEqual(len(index.segments), 3)
+        self.assertEqual([p for _, p in self.results(index, "lift")], ["cs/c1.md"])
+        self.assertEqual(self.results(index, "drag"), self.results(self.build(rebuild=True), "drag"))
+
+    def test_unreadable_file_is_recorded_until_it_changes(self) -> None:
+        self.write("a.md", "Pitch", "pitch")
+        self.write("b.md", "Yaw", "yaw")
+        tokenize = search._tokenize_file
+        with mock.patch.object(
+            search, "_tokenize_file", lambda root, rel: None if rel == "cs/b.md" else tokenize(root, rel)
+        ):
+            index = self.build()
+        current = search.scan_cheatsheets(self.root, MANIFEST)
+
+        self.assertEqual(list(index.unreadable), ["cs/b.md"])
+        self.assertEqual(index.stale(current), [])
+
+        self.write("b.md", "Yaw", "yaw again")
+        self.assertEqual(search.SearchIndex(self.root).stale(search.scan_cheatsheets(self.root, MANIFEST)), ["cs/b.md"])
+        index = self.build()
+        self.assertEqual(index.unreadable, {})
+        self.assertEqual([p for _, p in self.results(index, "yaw")], ["cs/b.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()